@@ -59,14 +59,16 @@ def _help_screen():
     _line(4,  "score",       yellow, "Round 1 AI judge scoring",       "score --submission-id ID [--all] [--round N]")
     _line(5,  "votes",       yellow, "Collect Solana community votes", "votes {--collect|--scores|--stats|--test}")
     _line(6,  "synthesize",  yellow, "Round 2 synthesis",              "synthesize --submission-id ID [--all]")
+    _line(0,  "calibrate",   yellow, "Cohort-wide judge calibration",  "calibrate [--round N] [--method zscore|quantile]")
     _line(7,  "static-data", yellow, "Regenerate JSON for frontend")
+    _line(0,  "pipeline",    yellow, "Stream research → score → static", "pipeline run [--score-concurrency N]")
     _line(8,  "episode",     yellow, "Generate episode",               "episode --submission-id ID [--validate-only]")
     _line(9,  "record",      yellow, "Record episode video",           "record URL [--headless] [--format webm|mp4]")
     _line(10, "upload",      red,    "Upload to YouTube",              "upload --submission-id ID [--dry-run]")
     _line(11, "cdn",         yellow, "Upload media to Bunny CDN",      "cdn <file|dir> [--remote PATH] [--dry-run]")
     print()
     print(f"  {bold('Quick views:')}")
-    _line(0, "status",      green,  "Pipeline overview + next steps")
+    _line(0, "status",      green,  "Pipeline overview + next steps",  "status [--llm [--hours N]]")
     _line(0, "leaderboard", green,  "Display final leaderboard",      "leaderboard [--round N] [--output FILE]")
     _line(0, "submissions", green,  "Browse submissions",             "submissions [ID] [-s QUERY] [--status S] [-j]")
     print()
@@ -74,6 +76,7 @@ def _help_screen():
     print(f"    {dim('clanktank status')}")
     print(f"    {dim('clanktank score --submission-id 42')}")
     print(f"    {dim('clanktank score --all')}")
+    print(f"    {dim('clanktank score --all --watch --concurrency 4')}")
     print(f"    {dim('clanktank leaderboard --round 1')}")
     print()
     print(f"  Run {bold('clanktank <command> --help')} for details.")
@@ -322,12 +325,57 @@ def _print_research_md(ta: dict):
 # ---------------------------------------------------------------------------
 
 
-def cmd_status(_args):
+def cmd_status_llm(db: str, hours: float | None = None):
+    """Show LLM telemetry: calls, tokens, p50/p95 latency, errors and cache hits per stage, judge and model."""
+    import time
+
+    from hackathon.backend.llm_telemetry import summarize_telemetry
+
+    since = time.time() - hours * 3600 if hours else None
+    report = summarize_telemetry(db, since=since)
+    if not report["stage"]:
+        print(yellow("\n  No LLM telemetry recorded yet."))
+        return
+
+    window = f"last {hours:g}h" if hours else "all time"
+    print(f"\n  {bold('LLM usage')}  {dim('·')}  {dim(window)}")
+
+    def fmt_latency(value):
+        return f"{value:.1f}s" if value is not None else "-"
+
+    for group in ("stage", "judge", "model"):
+        rows = report[group]
+        if not rows:
+            continue
+        print(f"\n  {bold(group.title())}")
+        print(
+            dim(
+                f"  {'':<34}{'calls':>7}{'prompt':>10}{'cached':>9}{'output':>9}"
+                f"{'p50':>8}{'p95':>8}{'errors':>8}{'cache hits':>12}{'cost $':>9}"
+            )
+        )
+        for r in rows:
+            errors = f"{r['error_rate']:.0%}"
+            print(
+                f"  {r['name'][:33]:<34}{r['calls']:>7}{r['prompt_tokens']:>10,}{r['cached_tokens']:>9,}"
+                f"{r['completion_tokens']:>9,}{fmt_latency(r['p50']):>8}{fmt_latency(r['p95']):>8}"
+                f"{(red(errors.rjust(8)) if r['errors'] else errors.rjust(8))}"
+                f"{r['cache_hits'] + r['shared']:>12}{r['cost']:>9.3f}"
+            )
+    print()
+    print(dim("  cache hits = response-cache hits + calls that joined an identical in-flight request"))
+    print()
+
+
+def cmd_status(args):
     """Show pipeline overview: deadline, status breakdown, categories, scores, next steps."""
     import sqlite3
     from datetime import datetime, timezone
 
     db = _db_path_from_env()
+    if getattr(args, "llm", False):
+        cmd_status_llm(db, args.hours)
+        return
     try:
         conn = _open_db(db)
     except sqlite3.OperationalError as e:
@@ -1178,11 +1226,24 @@ def main():
     # 3. AI research
     research_p = sub.add_parser("research", help=yellow("[step 3] GitHub + AI research on submissions"))
     add_common_args(research_p)
+    research_p.add_argument("--concurrency", type=int, default=1, help="With --all, workers per research stage")
+    research_p.add_argument("--no-llm-cache", action="store_true", help="Bypass the persistent LLM response cache")
+    research_p.add_argument("--hedge", action="store_true", help="Hedge LLM requests pending past the p90 latency")
+    research_p.add_argument("--queue", action="store_true", help="With --all, use the resumable pipeline_jobs queue")
 
     # 4. Round 1 scoring
     score_p = sub.add_parser("score", help=yellow("[step 4] Round 1 AI judge scoring"))
     add_common_args(score_p)
     score_p.add_argument("--round", type=int, default=None, help="Scoring round (default: 1)")
+    score_p.add_argument("--parallel-judges", action="store_true", help="Query all four judges concurrently")
+    score_p.add_argument("--concurrency", type=int, default=1, help="Submissions scored at once with --all (default: 1)")
+    score_p.add_argument("--panel", action="store_true", help="Score all four judges in one LLM request per submission")
+    score_p.add_argument("--structured-output", action="store_true", help="Request judge scores as schema-checked JSON")
+    score_p.add_argument("--no-llm-cache", action="store_true", help="Bypass the persistent LLM response cache")
+    score_p.add_argument("--hedge", action="store_true", help="Hedge LLM requests pending past the p90 latency")
+    score_p.add_argument("--queue", action="store_true", help="With --all, use the resumable pipeline_jobs queue")
+    score_p.add_argument("--watch", action="store_true", help="With --all, keep scoring new submissions as they are researched")
+    score_p.add_argument("--poll-interval", type=float, default=None, help="With --watch, seconds between change checks")
 
     # 5. Community votes
     votes_p = sub.add_parser("votes", help=yellow("[step 5] Collect Solana community votes"))
@@ -1195,10 +1256,39 @@ def main():
     # 6. Round 2 synthesis
     synthesize_p = sub.add_parser("synthesize", help=yellow("[step 6] Round 2 synthesis (AI + community)"))
     add_common_args(synthesize_p)
+    synthesize_p.add_argument("--parallel-judges", action="store_true", help="Request judge verdicts concurrently")
+    synthesize_p.add_argument("--concurrency", type=int, default=1, help="Projects synthesized at once with --all (default: 1)")
+    synthesize_p.add_argument("--no-llm-cache", action="store_true", help="Bypass the persistent LLM response cache")
+    synthesize_p.add_argument("--hedge", action="store_true", help="Hedge LLM requests pending past the p90 latency")
+    synthesize_p.add_argument("--queue", action="store_true", help="With --all, use the resumable pipeline_jobs queue")
+
+    # Cohort-wide judge calibration (optional NumPy extra)
+    calibrate_p = sub.add_parser("calibrate", help=yellow("Calibrate judge scores across the cohort (needs NumPy)"))
+    calibrate_p.add_argument("--db-file", default=None, help="Database path (default: from .env or data/hackathon.db)")
+    calibrate_p.add_argument("--round", type=int, default=1, help="Scoring round to calibrate (default: 1)")
+    calibrate_p.add_argument("--method", choices=["zscore", "quantile"], default=None, help="Calibration method")
+    calibrate_p.add_argument("--min-samples", type=int, default=None, help="Scores a judge needs before calibration")
 
     # 7. Static data export
     sub.add_parser("static-data", help=yellow("[step 7] Regenerate JSON for frontend"))
 
+    # 3-7 streamed: research → score as each lands, synthesis, debounced static data
+    pipeline_p = sub.add_parser("pipeline", help=yellow("[steps 3-7] Streaming research → score → static data"))
+    pipeline_sub = pipeline_p.add_subparsers(dest="pipeline_command", help="Pipeline subcommands")
+    pipeline_run_p = pipeline_sub.add_parser("run", help="Research, score and publish each submission as it is ready")
+    pipeline_run_p.add_argument("--version", default="v2", choices=["v1", "v2"], help="Schema version (default: v2)")
+    pipeline_run_p.add_argument("--db-file", default=None, help="Database path (default: from .env or data/hackathon.db)")
+    pipeline_run_p.add_argument("--force", "-f", action="store_true", help="Re-research and re-score everything")
+    pipeline_run_p.add_argument("--research-concurrency", type=int, default=None, help="Research workers")
+    pipeline_run_p.add_argument("--score-concurrency", type=int, default=None, help="Scoring workers")
+    pipeline_run_p.add_argument("--synthesize-concurrency", type=int, default=None, help="Synthesis workers")
+    pipeline_run_p.add_argument("--debounce", type=float, default=None, help="Quiet seconds before static data is rebuilt")
+    pipeline_run_p.add_argument("--no-static-data", action="store_true", help="Do not regenerate static data")
+    pipeline_run_p.add_argument("--no-synthesize", action="store_true", help="Skip Round 2 synthesis")
+    pipeline_run_p.add_argument("--parallel-judges", action="store_true", help="Query all four judges concurrently")
+    pipeline_run_p.add_argument("--no-llm-cache", action="store_true", help="Bypass the persistent LLM response cache")
+    pipeline_run_p.add_argument("--hedge", action="store_true", help="Hedge LLM requests pending past the p90 latency")
+
     # 8. Episode generation
     episode_p = sub.add_parser("episode", help=yellow("[step 8] Generate episode for a submission"))
     add_common_args(episode_p)
@@ -1256,7 +1346,9 @@ def main():
     cdn_p.add_argument("-v", "--verbose", action="store_true", help="Verbose output")
 
     # --- Read / inspect (green = read-only) ---
-    sub.add_parser("status", help=green("Pipeline overview, scores, and next steps"), aliases=["stats"])
+    status_p = sub.add_parser("status", help=green("Pipeline overview, scores, and next steps"), aliases=["stats"])
+    status_p.add_argument("--llm", action="store_true", help="LLM usage per stage, judge and model")
+    status_p.add_argument("--hours", type=float, default=None, help="With --llm, only the last N hours")
 
     leaderboard_p = sub.add_parser("leaderboard", help=green("Display final leaderboard"))
     leaderboard_p.add_argument("--version", default="v2", choices=["v1", "v2"])
@@ -1334,6 +1426,24 @@ def main():
             new_argv.append("--force")
         if hasattr(args, "round") and args.round is not None:
             new_argv += ["--round", str(args.round)]
+        if getattr(args, "parallel_judges", False):
+            new_argv.append("--parallel-judges")
+        if getattr(args, "concurrency", 1) > 1:
+            new_argv += ["--concurrency", str(args.concurrency)]
+        if getattr(args, "panel", False):
+            new_argv.append("--panel")
+        if getattr(args, "no_llm_cache", False):
+            new_argv.append("--no-llm-cache")
+        if getattr(args, "hedge", False):
+            new_argv.append("--hedge")
+        if getattr(args, "queue", False):
+            new_argv.append("--queue")
+        if getattr(args, "structured_output", False):
+            new_argv.append("--structured-output")
+        if getattr(args, "watch", False):
+            new_argv.append("--watch")
+        if getattr(args, "poll_interval", None) is not None:
+            new_argv += ["--poll-interval", str(args.poll_interval)]
         sys.argv = new_argv
         manager_main()
 
@@ -1536,6 +1646,37 @@ def main():
 
         generate_static_data()
 
+    elif args.command == "calibrate":
+        from hackathon.backend.score_calibration import main as calibrate_main
+
+        new_argv = ["score_calibration", "--round", str(args.round)]
+        if args.db_file:
+            new_argv += ["--db-file", args.db_file]
+        if args.method:
+            new_argv += ["--method", args.method]
+        if args.min_samples is not None:
+            new_argv += ["--min-samples", str(args.min_samples)]
+        sys.argv = new_argv
+        calibrate_main()
+
+    elif args.command == "pipeline":
+        if args.pipeline_command != "run":
+            pipeline_p.print_help()
+            sys.exit(1)
+        from hackathon.backend.pipeline import main as pipeline_main
+
+        new_argv = ["pipeline", "--version", args.version]
+        if args.db_file:
+            new_argv += ["--db-file", args.db_file]
+        for flag in ("research_concurrency", "score_concurrency", "synthesize_concurrency", "debounce"):
+            if getattr(args, flag) is not None:
+                new_argv += [f"--{flag.replace('_', '-')}", str(getattr(args, flag))]
+        for flag in ("force", "no_static_data", "no_synthesize", "parallel_judges", "no_llm_cache", "hedge"):
+            if getattr(args, flag):
+                new_argv.append(f"--{flag.replace('_', '-')}")
+        sys.argv = new_argv
+        pipeline_main()
+
     elif args.command == "votes":
         from hackathon.scripts.collect_votes import main as votes_main
 
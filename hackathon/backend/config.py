@@ -81,11 +81,80 @@ GITHUB_TOKEN = os.getenv("GITHUB_TOKEN", "")
 # AI model configuration
 AI_MODEL_PROVIDER = os.getenv("AI_MODEL_PROVIDER", "openrouter")
 AI_MODEL_NAME = os.getenv("AI_MODEL_NAME", "")  # required — set AI_MODEL_NAME in .env (e.g. openrouter/auto)
-BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
+# Chat-completions endpoint; point at hackathon.scripts.fake_openrouter for offline runs
+BASE_URL = os.getenv("OPENROUTER_BASE_URL", "https://openrouter.ai/api/v1/chat/completions")
+
+# LLM request pacing — token bucket shared by all judge calls, plus a per-model in-flight cap
+LLM_RATE_LIMIT_RPS = float(os.getenv("LLM_RATE_LIMIT_RPS", "2"))
+LLM_RATE_LIMIT_BURST = float(os.getenv("LLM_RATE_LIMIT_BURST", "4"))
+LLM_MAX_CONCURRENCY_PER_MODEL = int(os.getenv("LLM_MAX_CONCURRENCY_PER_MODEL", "4"))
+
+# LLM transport — one keep-alive pool for all stages, POST-safe retries, and a provider circuit breaker
+LLM_POOL_SIZE = int(os.getenv("LLM_POOL_SIZE", "16"))
+LLM_REQUEST_TIMEOUT = float(os.getenv("LLM_REQUEST_TIMEOUT", "120"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_RETRY_BACKOFF = float(os.getenv("LLM_RETRY_BACKOFF", "1.0"))
+LLM_CIRCUIT_FAILURE_THRESHOLD = int(os.getenv("LLM_CIRCUIT_FAILURE_THRESHOLD", "5"))
+LLM_CIRCUIT_COOLDOWN_SECONDS = float(os.getenv("LLM_CIRCUIT_COOLDOWN_SECONDS", "60"))
+
+# Hedged LLM requests (opt-in, or --hedge) — duplicate a request still pending at the stage's p90 latency
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").lower() in ("true", "1", "yes")
+LLM_HEDGE_QUANTILE = float(os.getenv("LLM_HEDGE_QUANTILE", "0.9"))
+LLM_HEDGE_MIN_SAMPLES = int(os.getenv("LLM_HEDGE_MIN_SAMPLES", "20"))
+LLM_HEDGE_MIN_DELAY = float(os.getenv("LLM_HEDGE_MIN_DELAY", "2"))
+LLM_HEDGE_FALLBACK_MODEL = os.getenv("LLM_HEDGE_FALLBACK_MODEL", "")
+
+# LLM response cache (content-addressed, SQLite-backed; disable per run with --no-llm-cache)
+LLM_CACHE_ENABLED = os.getenv("LLM_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+LLM_CACHE_PATH = os.getenv("LLM_CACHE_PATH", ".cache/llm/responses.db")
+LLM_CACHE_TTL_HOURS = float(os.getenv("LLM_CACHE_TTL_HOURS", "168"))
+LLM_CACHE_MAX_ENTRIES = int(os.getenv("LLM_CACHE_MAX_ENTRIES", "5000"))
+
+# Mark the static prefix of judge prompts with cache_control (provider-side prompt caching)
+LLM_PROMPT_CACHE = os.getenv("LLM_PROMPT_CACHE", "true").lower() in ("true", "1", "yes")
+
+# Ask judges for JSON scores via response_format (or --structured-output); the text format still parses
+LLM_STRUCTURED_OUTPUT = os.getenv("LLM_STRUCTURED_OUTPUT", "false").lower() in ("true", "1", "yes")
+
+# Per-call LLM telemetry (llm_telemetry table, `clanktank status --llm`); rows are written in batches
+LLM_TELEMETRY_ENABLED = os.getenv("LLM_TELEMETRY_ENABLED", "true").lower() in ("true", "1", "yes")
+LLM_TELEMETRY_BATCH_SIZE = int(os.getenv("LLM_TELEMETRY_BATCH_SIZE", "25"))
+
+# Cohort-wide judge calibration (clanktank calibrate; needs the optional NumPy extra)
+SCORE_CALIBRATION_METHOD = os.getenv("SCORE_CALIBRATION_METHOD", "zscore")
+SCORE_CALIBRATION_MIN_SAMPLES = int(os.getenv("SCORE_CALIBRATION_MIN_SAMPLES", "5"))
+
+# Durable pipeline job queue (--queue): lease length, attempts per job, base retry delay
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "300"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "3"))
+JOB_RETRY_DELAY_SECONDS = float(os.getenv("JOB_RETRY_DELAY_SECONDS", "30"))
+
+# Streaming pipeline (clanktank pipeline run): workers per stage and static-data debounce
+PIPELINE_RESEARCH_CONCURRENCY = int(os.getenv("PIPELINE_RESEARCH_CONCURRENCY", "2"))
+PIPELINE_SCORE_CONCURRENCY = int(os.getenv("PIPELINE_SCORE_CONCURRENCY", "4"))
+PIPELINE_SYNTHESIZE_CONCURRENCY = int(os.getenv("PIPELINE_SYNTHESIZE_CONCURRENCY", "2"))
+PIPELINE_STATIC_DEBOUNCE_SECONDS = float(os.getenv("PIPELINE_STATIC_DEBOUNCE_SECONDS", "10"))
+PIPELINE_STATIC_MAX_DELAY_SECONDS = float(os.getenv("PIPELINE_STATIC_MAX_DELAY_SECONDS", "60"))
+
+# Watch mode (score --all --watch): seconds between change checks, and before a failed submission is retried
+WATCH_POLL_SECONDS = float(os.getenv("WATCH_POLL_SECONDS", "2"))
+WATCH_RETRY_SECONDS = float(os.getenv("WATCH_RETRY_SECONDS", "60"))
 
 # Research configuration
 RESEARCH_CACHE_DIR = os.getenv("RESEARCH_CACHE_DIR", ".cache/research")
 RESEARCH_CACHE_EXPIRY_HOURS = int(os.getenv("RESEARCH_CACHE_EXPIRY_HOURS", "24"))
+# research --all --concurrency N: cap on concurrent GitIngest downloads (disk/CPU-bound; other stages get N)
+RESEARCH_INGEST_CONCURRENCY = int(os.getenv("RESEARCH_INGEST_CONCURRENCY", "2"))
+# GitHub API conditional-request cache (ETag / Last-Modified); 304 answers don't count against the rate limit
+GITHUB_HTTP_CACHE_ENABLED = os.getenv("GITHUB_HTTP_CACHE_ENABLED", "true").lower() in ("true", "1", "yes")
+GITHUB_HTTP_CACHE_PATH = os.getenv("GITHUB_HTTP_CACHE_PATH", ".cache/github/http.db")
+GITHUB_HTTP_CACHE_MAX_ENTRIES = int(os.getenv("GITHUB_HTTP_CACHE_MAX_ENTRIES", "20000"))
+# GitHub GraphQL batch mode (needs GITHUB_TOKEN): repositories fetched per query during research
+GITHUB_GRAPHQL_ENABLED = os.getenv("GITHUB_GRAPHQL_ENABLED", "false").lower() in ("true", "1", "yes")
+GITHUB_GRAPHQL_BATCH_SIZE = int(os.getenv("GITHUB_GRAPHQL_BATCH_SIZE", "5"))
+# Dependency manifests (package.json, Cargo.toml, ...) read per repository, and concurrent REST downloads of them
+GITHUB_MAX_DEPENDENCY_FILES = int(os.getenv("GITHUB_MAX_DEPENDENCY_FILES", "3"))
+GITHUB_MANIFEST_CONCURRENCY = int(os.getenv("GITHUB_MANIFEST_CONCURRENCY", "4"))
 
 # Voting constants
 MIN_VOTE_AMOUNT = float(os.getenv("MIN_VOTE_AMOUNT", "1"))
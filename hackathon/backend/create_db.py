@@ -76,6 +76,7 @@ def create_hackathon_database(db_path):
             created_at DATETIME DEFAULT CURRENT_TIMESTAMP,
             community_bonus REAL,
             final_verdict TEXT,
+            calibrated_total REAL,
             FOREIGN KEY (submission_id) REFERENCES hackathon_submissions_v2(submission_id),
             UNIQUE (submission_id, judge_name, round)
         )
@@ -194,6 +195,16 @@ def create_hackathon_database(db_path):
     """
     )
 
+    # Durable work queue for the research/score/synthesize stages
+    from hackathon.backend.job_queue import create_jobs_table
+
+    create_jobs_table(cursor)
+
+    # Per-call LLM latency, token and cost telemetry
+    from hackathon.backend.llm_telemetry import create_telemetry_table
+
+    create_telemetry_table(cursor)
+
     # Create indexes for better performance
     for version in SUBMISSION_VERSIONS:
         table_name = f"hackathon_submissions_{version}"
@@ -0,0 +1,27 @@
+"""Cheap change detection for long-running watchers via ``PRAGMA data_version``."""
+
+import sqlite3
+
+
+class DataVersionWatcher:
+    """Report whether any other connection has committed to the database since the last check.
+
+    ``PRAGMA data_version`` is per-connection and only changes when a
+    *different* connection commits, so polling it on one long-lived
+    connection reads no tables. A watcher re-queries for work only when
+    something actually changed. The first check always reports a change,
+    so existing work is picked up at startup.
+    """
+
+    def __init__(self, db_path: str):
+        self._conn = sqlite3.connect(db_path, timeout=30, check_same_thread=False)
+        self._version: int | None = None
+
+    def changed(self) -> bool:
+        version = self._conn.execute("PRAGMA data_version").fetchone()[0]
+        changed = version != self._version
+        self._version = version
+        return changed
+
+    def close(self) -> None:
+        self._conn.close()
@@ -8,7 +8,9 @@ import json
 import logging
 import os
 import re
-from collections import defaultdict
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from urllib.parse import urlparse
 
@@ -26,20 +28,40 @@ if os.getenv("DEBUG", "").lower() in ["true", "1", "yes"]:
     logger.setLevel(logging.DEBUG)
     logger.debug("Debug logging enabled")
 
+# Repository snapshots kept per analyzer (research --all analyzes one repo per submission in flight)
+SNAPSHOT_MEMO_SIZE = 16
+
+# Dependency manifests whose first lines go into the analysis (how many: GITHUB_MAX_DEPENDENCY_FILES)
+DEPENDENCY_MANIFESTS = ("package.json", "requirements.txt", "cargo.toml", "go.mod", "pom.xml")
+
 
 class GitHubAnalyzer:
-    def __init__(self, github_token=None):
-        """Initialize with optional GitHub token for higher rate limits."""
+    def __init__(self, github_token=None, llm_client=None):
+        """Initialize with optional GitHub token for higher rate limits.
+
+        ``llm_client`` lets callers share their paced/cached ``LLMClient``; one
+        is created on first use otherwise.
+        """
         self.github_token = github_token or os.getenv("GITHUB_TOKEN")
         self.headers = {"Accept": "application/vnd.github.v3+json"}
         if self.github_token:
             self.headers["Authorization"] = f"token {self.github_token}"
         self.base_url = "https://api.github.com"
-        self._blob_size_cache = {}
+        # Recent snapshots by (owner, repo, sha); a later consumer of the same commit reuses one
+        self._snapshots = OrderedDict()
+        self._snapshots_lock = threading.Lock()
+        self.llm_client = llm_client
 
+        from hackathon.backend.config import GITHUB_GRAPHQL_ENABLED
+
+        # GraphQL batch mode needs a token; without one every fetch uses REST
+        self.use_graphql = GITHUB_GRAPHQL_ENABLED and bool(self.github_token)
+
+        from hackathon.backend.http_cache import get_github_http_cache
         from hackathon.backend.http_client import create_session
 
-        self.session = create_session()
+        self.http_cache = get_github_http_cache()
+        self.session = create_session(cache=self.http_cache)
         self.session.headers.update(self.headers)
 
     def extract_repo_info(self, repo_url):
@@ -87,33 +109,43 @@ class GitHubAnalyzer:
             url = f"{self.base_url}/repos/{owner}/{repo}/languages"
             resp = self.session.get(url, timeout=self.session.timeout)
             resp.raise_for_status()
-
-            languages = resp.json()
-            total = sum(languages.values())
-
-            if total > 0:
-                return {
-                    lang: {
-                        "bytes": bytes_count,
-                        "percentage": round((bytes_count / total) * 100, 2),
-                    }
-                    for lang, bytes_count in languages.items()
-                }
-            return {}
+            return self.language_breakdown(resp.json())
         except Exception as e:
             logger.error(f"Error fetching languages: {e}")
             return {}
 
+    @staticmethod
+    def language_breakdown(languages):
+        """Bytes and percentage per language from a ``{language: bytes}`` mapping."""
+        total = sum(languages.values())
+
+        if total > 0:
+            return {
+                lang: {
+                    "bytes": bytes_count,
+                    "percentage": round((bytes_count / total) * 100, 2),
+                }
+                for lang, bytes_count in languages.items()
+            }
+        return {}
+
+    @staticmethod
+    def submission_deadline():
+        """``SUBMISSION_DEADLINE`` as a datetime, or None if it is not configured."""
+        deadline_str = os.getenv("SUBMISSION_DEADLINE")
+        if not deadline_str:
+            logger.warning("SUBMISSION_DEADLINE not configured in environment")
+            return None
+        return datetime.fromisoformat(deadline_str.replace("Z", "+00:00"))
+
     def get_commit_data(self, owner, repo, branch=None):
         """Collect raw commit data for analysis."""
         try:
             # Get submission deadline from environment
-            deadline_str = os.getenv("SUBMISSION_DEADLINE")
-            if not deadline_str:
-                logger.warning("SUBMISSION_DEADLINE not configured in environment")
+            deadline = self.submission_deadline()
+            if deadline is None:
                 return {"error": "submission_deadline_not_configured"}
 
-            deadline = datetime.fromisoformat(deadline_str.replace("Z", "+00:00"))
             month_ago = deadline - timedelta(days=30)
 
             url = f"{self.base_url}/repos/{owner}/{repo}/commits"
@@ -122,8 +154,16 @@ class GitHubAnalyzer:
                 params["sha"] = branch
             resp = self.session.get(url, params=params, timeout=self.session.timeout)
             resp.raise_for_status()
-            commits = resp.json()
+            return self.summarize_commits(resp.json(), deadline)
 
+        except Exception as e:
+            logger.error(f"Error collecting commit data: {e}")
+            return {"error": f"commit_data_collection_failed: {e!s}"}
+
+    @staticmethod
+    def summarize_commits(commits, deadline):
+        """Commit activity from REST-shaped commits (newest first) in the month before ``deadline``."""
+        try:
             if not commits:
                 return {"total_commits": 0}
 
@@ -163,23 +203,25 @@ class GitHubAnalyzer:
             logger.error(f"Error collecting commit data: {e}")
             return {"error": f"commit_data_collection_failed: {e!s}"}
 
-    def get_readme(self, owner, repo, branch=None):
-        """Get README content and analyze its structure."""
-        try:
-            url = f"{self.base_url}/repos/{owner}/{repo}/readme"
-            params = {"ref": branch} if branch else {}
-            resp = self.session.get(url, params=params, timeout=self.session.timeout)
-
-            if resp.status_code == 404:
-                return {"exists": False}
+    def fetch_readme(self, owner, repo, ref=None):
+        """Get the decoded README text, or None if the repository has none."""
+        url = f"{self.base_url}/repos/{owner}/{repo}/readme"
+        params = {"ref": ref} if ref else {}
+        resp = self.session.get(url, params=params, timeout=self.session.timeout)
+        if resp.status_code == 404:
+            return None
+        resp.raise_for_status()
 
-            resp.raise_for_status()
-            data = resp.json()
+        import base64
 
-            import base64
-            import re
+        return base64.b64decode(resp.json()["content"]).decode("utf-8")
 
-            content = base64.b64decode(data["content"]).decode("utf-8")
+    def get_readme(self, snapshot):
+        """Analyze the structure of the snapshot's README."""
+        try:
+            content = snapshot.readme
+            if content is None:
+                return {"exists": False}
 
             # Look for common setup/run sections
             has_setup_section = bool(
@@ -202,24 +244,195 @@ class GitHubAnalyzer:
             logger.error(f"Error fetching README: {e}")
             return {"exists": False, "error": str(e)}
 
-    def get_file_structure(self, owner, repo, max_files=100, branch=None):
-        """Get file structure analysis for GitIngest optimization."""
+    def fetch_tree(self, owner, repo, ref):
+        """Get the recursive tree's blob entries (``path`` and ``size``)."""
+        url = f"{self.base_url}/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
+        resp = self.session.get(url, timeout=self.session.timeout)
+        resp.raise_for_status()
+        return [
+            {"path": item["path"], "size": item.get("size", 0)}
+            for item in resp.json().get("tree", [])
+            if item["type"] == "blob"
+        ]
+
+    def resolve_sha(self, owner, repo, ref=None):
+        """Resolve a branch, tag or HEAD to its commit SHA (one small request)."""
+        url = f"{self.base_url}/repos/{owner}/{repo}/commits/{ref or 'HEAD'}"
+        resp = self.session.get(
+            url, headers={"Accept": "application/vnd.github.sha"}, timeout=self.session.timeout
+        )
+        resp.raise_for_status()
+        return resp.text.strip()
+
+    def get_snapshot(self, owner, repo, branch=None):
+        """Fetch ``owner/repo`` at the commit ``branch`` (default branch if None) points to, once.
+
+        Returns a ``RepoSnapshot``, or an error dict like ``get_repo_data`` if the
+        repository or ref is unavailable. The last ``SNAPSHOT_MEMO_SIZE``
+        snapshots are kept, so asking again for an unchanged ref costs one SHA lookup.
+        """
+        if self.use_graphql:
+            return self.get_snapshots([(owner, repo, branch)])[0]
+        return self._rest_snapshot(owner, repo, branch)
+
+    def get_snapshots(self, targets):
+        """``get_snapshot`` for each ``(owner, repo, branch)`` in ``targets``, in order.
+
+        In GraphQL mode every ``GITHUB_GRAPHQL_BATCH_SIZE`` repositories cost two
+        GraphQL queries plus one tree request each; a batch whose query fails
+        falls back to REST.
+        """
+        from hackathon.backend.config import GITHUB_GRAPHQL_BATCH_SIZE
+
+        results = []
+        batch_size = max(1, GITHUB_GRAPHQL_BATCH_SIZE) if self.use_graphql else 1
+        for start in range(0, len(targets), batch_size):
+            batch = targets[start : start + batch_size]
+            valid = [target for target in batch if target[0] and target[1]]
+            fetched = iter([])
+            if self.use_graphql and valid:
+                try:
+                    fetched = iter(self._graphql_snapshots(valid))
+                except Exception as e:
+                    logger.warning(f"GraphQL batch failed, falling back to REST: {e}")
+                    fetched = iter([self._rest_snapshot(*target) for target in valid])
+            elif valid:
+                fetched = iter([self._rest_snapshot(*target) for target in valid])
+            for owner, repo, _branch in batch:
+                results.append(next(fetched) if owner and repo else {"error": "Invalid GitHub URL"})
+        return results
+
+    def _remember(self, snapshot):
+        """Memoize ``snapshot`` (or return the equal one already kept for its key)."""
+        with self._snapshots_lock:
+            snapshot = self._snapshots.setdefault(snapshot.key, snapshot)
+            self._snapshots.move_to_end(snapshot.key)
+            while len(self._snapshots) > SNAPSHOT_MEMO_SIZE:
+                self._snapshots.popitem(last=False)
+        return snapshot
+
+    def _recall(self, owner, repo, sha):
+        with self._snapshots_lock:
+            key = (owner.lower(), repo.lower(), sha)
+            if key in self._snapshots:
+                self._snapshots.move_to_end(key)
+                return self._snapshots[key]
+        return None
+
+    def _rest_snapshot(self, owner, repo, branch=None):
+        from hackathon.backend.repo_snapshot import RepoSnapshot
+
         try:
-            ref = branch or "HEAD"
-            url = f"{self.base_url}/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
-            resp = self.session.get(url, timeout=self.session.timeout)
-            resp.raise_for_status()
+            sha = self.resolve_sha(owner, repo, branch)
+        except Exception as e:
+            repo_data = self.get_repo_data(owner, repo)
+            if "error" in repo_data:
+                return repo_data
+            logger.error(f"Error resolving {branch or 'HEAD'} for {owner}/{repo}: {e}")
+            return {"error": f"Could not resolve ref {branch or 'HEAD'}: {e}"}
+
+        cached = self._recall(owner, repo, sha)
+        if cached is not None:
+            return cached
+
+        repo_data = self.get_repo_data(owner, repo)
+        if "error" in repo_data:
+            return repo_data
+        tree, tree_error = [], None
+        try:
+            tree = self.fetch_tree(owner, repo, sha)
+        except Exception as e:
+            logger.error(f"Error fetching file tree: {e}")
+            tree_error = str(e)
+        try:
+            readme = self.fetch_readme(owner, repo, sha)
+        except Exception as e:
+            logger.error(f"Error fetching README: {e}")
+            readme = None
+        return self._remember(
+            RepoSnapshot(
+                owner=owner,
+                repo=repo,
+                sha=sha,
+                repo_data=repo_data,
+                tree=tree,
+                readme=readme,
+                commits=self.get_commit_data(owner, repo, branch=sha),
+                tree_error=tree_error,
+            )
+        )
+
+    def _graphql_snapshots(self, targets):
+        from hackathon.backend import github_graphql
+        from hackathon.backend.repo_snapshot import RepoSnapshot
+
+        deadline = self.submission_deadline()
+        since = (deadline - timedelta(days=30)).isoformat() if deadline else None
+        nodes = github_graphql.fetch_repositories(self.session, targets, since)
+
+        results = list(nodes)
+        fresh = []
+        for index, ((owner, repo, _branch), node) in enumerate(zip(targets, nodes, strict=True)):
+            if "error" in node:
+                continue
+            cached = self._recall(owner, repo, node["sha"])
+            if cached is not None:
+                results[index] = cached
+                continue
+            tree, tree_error = [], None
+            try:
+                tree = self.fetch_tree(owner, repo, node["sha"])
+            except Exception as e:
+                logger.error(f"Error fetching file tree: {e}")
+                tree_error = str(e)
+            fresh.append((index, owner, repo, node, tree, tree_error))
+
+        # Second query: the dependency manifests of every repository in the batch
+        wanted = [
+            (owner, repo, node["sha"], path)
+            for _index, owner, repo, node, tree, _error in fresh
+            for path in self.dependency_files([item["path"] for item in tree])
+        ]
+        try:
+            blobs = github_graphql.fetch_blobs(self.session, wanted)
+        except Exception as e:
+            logger.warning(f"Could not prefetch dependency manifests: {e}")
+            blobs = {}
+
+        for index, owner, repo, node, tree, tree_error in fresh:
+            if node["commits"] is None:
+                commits = {"error": "submission_deadline_not_configured"}
+            else:
+                commits = self.summarize_commits(node["commits"], deadline)
+            results[index] = self._remember(
+                RepoSnapshot(
+                    owner=owner,
+                    repo=repo,
+                    sha=node["sha"],
+                    repo_data=node["repo_data"],
+                    tree=tree,
+                    readme=node["readme"],
+                    languages=self.language_breakdown(node["languages"]),
+                    commits=commits,
+                    blobs={path: text for (o, r, path), text in blobs.items() if (o, r) == (owner, repo)},
+                    tree_error=tree_error,
+                )
+            )
+        return results
 
-            tree = resp.json().get("tree", [])
-            files = []
+    def snapshot_for_url(self, repo_url):
+        """``get_snapshot`` for a GitHub URL (branch taken from ``/tree/<branch>``)."""
+        owner, repo, branch = self.extract_repo_info(repo_url)
+        if not owner or not repo:
+            return {"error": "Invalid GitHub URL", "url": repo_url}
+        return self.get_snapshot(owner, repo, branch)
 
-            # Build file list and cache sizes
-            for item in tree:
-                if item["type"] == "blob":
-                    path = item["path"]
-                    size = item.get("size", 0)
-                    files.append(path)
-                    self._blob_size_cache[path] = size
+    def get_file_structure(self, snapshot):
+        """Get file structure analysis for GitIngest optimization."""
+        try:
+            if snapshot.tree_error:
+                return {"error": snapshot.tree_error}
+            files = snapshot.files
 
             # Analyze file types and structure
             file_extensions = {}
@@ -250,8 +463,12 @@ class GitHubAnalyzer:
             logger.error(f"Error analyzing file structure: {e}")
             return {"error": str(e)}
 
-    def label_file_relevance(self, files):
-        """Stage-1 critic: tag each file with relevance and rationale using cheap heuristics."""
+    def label_file_relevance(self, files, sizes=None):
+        """Stage-1 critic: tag each file with relevance and rationale using cheap heuristics.
+
+        ``sizes`` maps path to blob size (``RepoSnapshot.sizes``); unknown paths count as 0 bytes.
+        """
+        sizes = sizes or {}
         manifest = []
 
         # Define patterns for different relevance levels
@@ -272,7 +489,7 @@ class GitHubAnalyzer:
         for file_path in files:
             ext = os.path.splitext(file_path)[1].lower()
             filename = file_path.split("/")[-1].lower()
-            size = self._blob_size_cache.get(file_path, 0)
+            size = sizes.get(file_path, 0)
 
             rel, why = "low", "generated/boilerplate"
 
@@ -299,32 +516,50 @@ class GitHubAnalyzer:
 
         return manifest
 
-    def extract_dependency_info(self, owner, repo, manifest):
-        """Extract first 40 lines of key dependency files."""
-        deps_info = {}
-        dep_files = [
-            f["path"]
-            for f in manifest
-            if f["path"].split("/")[-1].lower()
-            in ["package.json", "requirements.txt", "cargo.toml", "go.mod", "pom.xml"]
-        ]
+    def extract_dependency_info(self, snapshot, manifest):
+        """Extract first 40 lines of key dependency files at the snapshot's commit.
 
-        for dep_file in dep_files[:3]:  # Limit to 3 files to avoid rate limits
-            try:
-                url = f"{self.base_url}/repos/{owner}/{repo}/contents/{dep_file}"
-                resp = self.session.get(url, timeout=self.session.timeout)
-                if resp.status_code == 200:
-                    import base64
-
-                    content = base64.b64decode(resp.json()["content"]).decode("utf-8")
-                    # Get first 40 lines
-                    lines = content.splitlines()[:40]
-                    deps_info[dep_file] = "\n".join(lines)
-            except Exception as e:
-                logger.warning(f"Could not fetch {dep_file}: {e}")
+        Manifests prefetched with the snapshot (GraphQL mode) are used as-is;
+        the rest are downloaded concurrently, ``GITHUB_MANIFEST_CONCURRENCY`` at a time.
+        """
+        from hackathon.backend.config import GITHUB_MANIFEST_CONCURRENCY
 
+        dep_files = self.dependency_files([f["path"] for f in manifest])
+        contents = {path: snapshot.blobs[path] for path in dep_files if path in snapshot.blobs}
+        missing = [path for path in dep_files if path not in contents]
+        if missing:
+            workers = max(1, min(len(missing), GITHUB_MANIFEST_CONCURRENCY))
+            with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="manifest") as pool:
+                contents.update(zip(missing, pool.map(lambda path: self.fetch_file(snapshot, path), missing)))
+
+        deps_info = {}
+        for dep_file in dep_files:
+            if contents.get(dep_file) is not None:
+                # Get first 40 lines
+                deps_info[dep_file] = "\n".join(contents[dep_file].splitlines()[:40])
         return deps_info
 
+    def fetch_file(self, snapshot, path):
+        """Text of ``path`` at the snapshot's commit, or None if it cannot be fetched."""
+        try:
+            url = f"{self.base_url}/repos/{snapshot.owner}/{snapshot.repo}/contents/{path}"
+            resp = self.session.get(url, params={"ref": snapshot.sha}, timeout=self.session.timeout)
+            if resp.status_code == 200:
+                import base64
+
+                return base64.b64decode(resp.json()["content"]).decode("utf-8")
+        except Exception as e:
+            logger.warning(f"Could not fetch {path}: {e}")
+        return None
+
+    @staticmethod
+    def dependency_files(paths):
+        """The dependency manifests among ``paths`` that ``extract_dependency_info`` reads."""
+        from hackathon.backend.config import GITHUB_MAX_DEPENDENCY_FILES
+
+        dep_files = [path for path in paths if path.split("/")[-1].lower() in DEPENDENCY_MANIFESTS]
+        return dep_files[:GITHUB_MAX_DEPENDENCY_FILES]
+
     def get_loc_histogram(self, manifest):
         """Generate LOC histogram from file sizes."""
         size_buckets = defaultdict(int)
@@ -382,14 +617,16 @@ class GitHubAnalyzer:
         """Use an LLM to recommend GitIngest config based on comprehensive repo analysis."""
         import jsonschema
 
+        from hackathon.backend.config import HACKATHON_DB_PATH
         from hackathon.backend.config import OPENROUTER_API_KEY as _OPENROUTER_KEY
-        from hackathon.backend.http_client import create_session
+        from hackathon.backend.llm_cache import get_default_cache
+        from hackathon.backend.llm_client import LLMClient
+        from hackathon.backend.llm_telemetry import get_telemetry_recorder
 
         if not _OPENROUTER_KEY:
             logger.warning("No OPENROUTER_API_KEY set, using heuristic fallback.")
             return self._get_heuristic_fallback(repo_analysis)
 
-        BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
         AI_MODEL_NAME = os.getenv("AI_MODEL_NAME", "")
         MODEL = AI_MODEL_NAME
 
@@ -446,13 +683,13 @@ Output only valid JSON."""
         )
         logger.info(f"Using model: {MODEL} for agentic recommendation")
 
-        llm_session = create_session()
-        llm_session.headers.update(
-            {
-                "Authorization": f"Bearer {_OPENROUTER_KEY}",
-                "Content-Type": "application/json",
-            }
-        )
+        if self.llm_client is None:
+            self.llm_client = LLMClient(
+                cache=get_default_cache(), api_key=_OPENROUTER_KEY, title="Clank Tank GitIngest", stage="gitingest"
+            )
+            telemetry = get_telemetry_recorder(HACKATHON_DB_PATH)
+            if telemetry is not None:
+                self.llm_client.add_hook(telemetry)
 
         # JSON schema for validation
         schema = {
@@ -470,11 +707,8 @@ Output only valid JSON."""
         try:
             logger.info("Requesting agentic GitIngest config recommendation from LLM...")
             logger.debug(f"Request payload: {json.dumps(payload, indent=2)}")
-            response = llm_session.post(BASE_URL, json=payload, timeout=llm_session.timeout)
-            response.raise_for_status()
-            result = response.json()
+            result = self.llm_client.chat(payload, tags={"stage": "gitingest"})
             content = result["choices"][0]["message"]["content"]
-            logger.info(f"LLM Response status: {response.status_code}")
             logger.info(f"Raw LLM response content:\n{content}")
 
             # Try to parse JSON from response
@@ -499,19 +733,22 @@ Output only valid JSON."""
                 except jsonschema.ValidationError as e:
                     logger.warning(f"JSON schema validation failed: {e}")
                     logger.warning(f"Failed JSON: {json_content}")
+                    self.llm_client.invalidate(payload)
                     return self._get_heuristic_fallback(repo_analysis)
                 except Exception as e:
                     logger.warning(f"JSON parsing failed: {e}")
                     logger.warning(f"Failed to parse: {json_content}")
+                    self.llm_client.invalidate(payload)
                     return self._get_heuristic_fallback(repo_analysis)
             else:
                 logger.warning("No JSON found in response, falling back to heuristics")
                 logger.warning(f"Response content: {content}")
+                self.llm_client.invalidate(payload)
                 return self._get_heuristic_fallback(repo_analysis)
 
         except Exception as e:
             logger.error(f"Agentic config step failed: {e}")
-            logger.error(f"Request URL: {BASE_URL}")
+            logger.error(f"Request URL: {self.llm_client.url}")
             return self._get_heuristic_fallback(repo_analysis)
 
     def _get_heuristic_fallback(self, repo_analysis):
@@ -588,49 +825,22 @@ Output only valid JSON."""
             "rationale": "• Ultra-conservative token limits to prevent 413 errors • Focus only on essential documentation and source code • Exclude all media and large files",
         }
 
-    def summarize_repo(self, repo_url, max_files=200, readme_lines=40):
+    def summarize_repo(self, repo_url, max_files=200, readme_lines=40, snapshot=None):
         """Produce a holistic, objective summary of the repo for AI analysis."""
         owner, repo, branch = self.extract_repo_info(repo_url)
         if not owner or not repo:
             return {"error": "Invalid GitHub URL", "url": repo_url}
         logger.info(f"Summarizing repository: {owner}/{repo}" + (f" (branch: {branch})" if branch else ""))
-        # Metadata
-        repo_data = self.get_repo_data(owner, repo)
-        if "error" in repo_data:
-            return repo_data
-        # File tree (truncated)
-        try:
-            ref = branch or "HEAD"
-            url = f"{self.base_url}/repos/{owner}/{repo}/git/trees/{ref}?recursive=1"
-            resp = self.session.get(url, timeout=self.session.timeout)
-            resp.raise_for_status()
-            tree = resp.json().get("tree", [])
-            files = [item["path"] for item in tree if item["type"] == "blob"]
-            file_list = files if len(files) <= max_files else [*files[:max_files], "...truncated"]
-        except Exception as e:
-            logger.error(f"Error fetching file tree: {e}")
-            file_list = []
-        # README (first N lines)
-        readme_head = ""
-        try:
-            url = f"{self.base_url}/repos/{owner}/{repo}/readme"
-            params = {"ref": branch} if branch else {}
-            resp = self.session.get(url, params=params, timeout=self.session.timeout)
-            if resp.status_code == 404:
-                readme_head = ""
-            else:
-                resp.raise_for_status()
-                import base64
-
-                content = base64.b64decode(resp.json()["content"]).decode("utf-8")
-                readme_head = "\n".join(content.splitlines()[:readme_lines])
-        except Exception as e:
-            logger.error(f"Error fetching README: {e}")
-            readme_head = ""
-        # Languages
-        languages = self.get_languages(owner, repo)
-        # Recent commit data for analysis
-        commit_data = self.get_commit_data(owner, repo, branch=branch)
+        # Metadata, file tree, README and recent commits at one commit
+        snapshot = snapshot or self.get_snapshot(owner, repo, branch)
+        if isinstance(snapshot, dict):
+            return snapshot
+        repo_data = snapshot.repo_data
+        files = snapshot.files
+        file_list = files if len(files) <= max_files else [*files[:max_files], "...truncated"]
+        readme_head = "\n".join((snapshot.readme or "").splitlines()[:readme_lines])
+        languages = snapshot.languages if snapshot.languages is not None else self.get_languages(owner, repo)
+        commit_data = snapshot.commits
         # Contributors (top 3 by commit count)
         contributors = []
         try:
@@ -676,8 +886,11 @@ Output only valid JSON."""
         }
         return summary
 
-    def run_gitingest_secure(self, repo_url, output_path=None, settings=None):
-        """Secure GitIngest using Python library - matches original implementation."""
+    def run_gitingest_secure(self, repo_url, output_path=None, settings=None, snapshot=None):
+        """Secure GitIngest using Python library - matches original implementation.
+
+        ``snapshot`` (from ``analyze_repository``'s caller) sizes the output without re-fetching the tree.
+        """
         # Validate GitHub URL to prevent SSRF
         if not self._validate_github_url(repo_url):
             logger.error(f"Invalid GitHub URL rejected: {repo_url}")
@@ -706,19 +919,14 @@ Output only valid JSON."""
             # Based on original implementation: small repos (~13k tokens), large repos (~144k tokens)
 
             # Get repository analysis from GitHub data
-            owner, repo, _branch = self.extract_repo_info(repo_url)
-            if owner and repo:
-                try:
-                    self.get_repo_data(owner, repo)
-                    file_structure = self.get_file_structure(owner, repo, branch=branch)
-                    total_files = file_structure.get("total_files", 0)
-                    is_large_repo = file_structure.get("is_large_repo", False)
-                except Exception:
-                    total_files = 0
-                    is_large_repo = False
-            else:
+            if snapshot is None:
+                snapshot = self.snapshot_for_url(repo_url)
+            if isinstance(snapshot, dict):
                 total_files = 0
                 is_large_repo = False
+            else:
+                total_files = len(snapshot.files)
+                is_large_repo = total_files > 500
 
             # Dynamic token limits based on repository characteristics
             if total_files > 1000:
@@ -791,19 +999,23 @@ Output only valid JSON."""
         except Exception:
             return False
 
-    def analyze_repository(self, repo_url):
-        """Perform repository analysis for hackathon vibe check with two-stage file selection."""
+    def analyze_repository(self, repo_url, snapshot=None):
+        """Perform repository analysis for hackathon vibe check with two-stage file selection.
+
+        ``snapshot`` is the result of ``snapshot_for_url(repo_url)`` when the caller already has it.
+        """
         owner, repo, branch = self.extract_repo_info(repo_url)
         if not owner or not repo:
             return {"error": "Invalid GitHub URL", "url": repo_url}
         logger.info(f"Analyzing repository: {owner}/{repo}" + (f" (branch: {branch})" if branch else ""))
-        repo_data = self.get_repo_data(owner, repo)
-        if "error" in repo_data:
-            return repo_data
+        snapshot = snapshot or self.get_snapshot(owner, repo, branch)
+        if isinstance(snapshot, dict):
+            return snapshot
+        repo_data = snapshot.repo_data
 
         # Get file structure for GitIngest optimization
         logger.info("Getting file structure...")
-        file_structure = self.get_file_structure(owner, repo, branch=branch)
+        file_structure = self.get_file_structure(snapshot)
         if "error" in file_structure:
             logger.error(f"File structure error: {file_structure}")
             return file_structure
@@ -811,12 +1023,12 @@ Output only valid JSON."""
         # Stage-1 critic: label file relevance
         files = file_structure.get("files", [])
         logger.info(f"Found {len(files)} files in repository")
-        manifest = self.label_file_relevance(files)
+        manifest = self.label_file_relevance(files, snapshot.sizes)
         logger.info(f"Generated file manifest with {len(manifest)} files")
 
         # Extract additional repo signals
         logger.info("Extracting dependency info...")
-        deps_info = self.extract_dependency_info(owner, repo, manifest)
+        deps_info = self.extract_dependency_info(snapshot, manifest)
         logger.info(f"Extracted dependency info for {len(deps_info)} files")
 
         logger.info("Generating LOC histogram...")
@@ -836,9 +1048,10 @@ Output only valid JSON."""
             "created_at": repo_data.get("created_at", ""),
             "updated_at": repo_data.get("updated_at", ""),
             "license": (repo_data.get("license", {}).get("name", "None") if repo_data.get("license") else "None"),
-            "readme_analysis": self.get_readme(owner, repo, branch=branch),
+            "commit_sha": snapshot.sha,
+            "readme_analysis": self.get_readme(snapshot),
             "file_structure": file_structure,
-            "commit_activity": self.get_commit_data(owner, repo, branch=branch),
+            "commit_activity": snapshot.commits,
             "file_manifest": manifest,
             "dependency_info": deps_info,
             "loc_histogram": loc_histogram,
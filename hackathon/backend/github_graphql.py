@@ -0,0 +1,172 @@
+"""GitHub GraphQL batch queries behind ``GitHubAnalyzer.get_snapshots`` (``GITHUB_GRAPHQL_ENABLED``).
+
+The REST path spends one round-trip each on the repository, its languages,
+recent commits, README, and every dependency manifest. In GraphQL mode, one
+query fetches metadata, languages, the commit history for the month before
+the deadline, and the README for up to ``GITHUB_GRAPHQL_BATCH_SIZE``
+repositories. A second query fetches the selected manifest blobs at each
+repository's commit. The recursive file tree still comes from REST, because
+a GraphQL tree selection covers only one directory level.
+
+GraphQL requires a token. Results are shaped like the REST responses, so the
+analyzer's existing summarizers apply unchanged.
+"""
+
+import json
+import logging
+from typing import Any
+
+import requests
+
+logger = logging.getLogger(__name__)
+
+GRAPHQL_URL = "https://api.github.com/graphql"
+# Root README names tried in order (REST /readme also looks in docs/ and .github/)
+README_NAMES = ("README.md", "readme.md", "Readme.md", "README.rst", "README.txt", "README")
+# Commits per repository, matching the REST per_page
+HISTORY_LIMIT = 50
+
+REPOSITORY_FIELDS = """
+    description createdAt updatedAt stargazerCount forkCount
+    defaultBranchRef { name }
+    licenseInfo { name }
+    issues(states: OPEN) { totalCount }
+    languages(first: 50, orderBy: {field: SIZE, direction: DESC}) { edges { size node { name } } }
+"""
+
+
+class GraphQLError(Exception):
+    """The GraphQL request as a whole failed (transport, auth, rate limit, or no data)."""
+
+
+def _literal(value: str) -> str:
+    # JSON string escaping is valid GraphQL string syntax
+    return json.dumps(value)
+
+
+def build_repository_query(targets: list[tuple[str, str, str | None]], since: str | None) -> str:
+    """One aliased ``repository`` selection (``r0``, ``r1``, ...) per ``(owner, repo, branch)``."""
+    selections = []
+    for index, (owner, repo, branch) in enumerate(targets):
+        ref = branch or "HEAD"
+        history = ""
+        if since:
+            history = (
+                f"history(first: {HISTORY_LIMIT}, since: {_literal(since)}) "
+                "{ nodes { message author { name date } } }"
+            )
+        readmes = " ".join(
+            f"readme{n}: object(expression: {_literal(f'{ref}:{name}')}) {{ ... on Blob {{ text }} }}"
+            for n, name in enumerate(README_NAMES)
+        )
+        selections.append(
+            f"r{index}: repository(owner: {_literal(owner)}, name: {_literal(repo)}) {{{REPOSITORY_FIELDS}"
+            f"    commit: object(expression: {_literal(ref)}) {{ ... on Commit {{ oid {history} }} }}\n"
+            f"    {readmes}\n}}"
+        )
+    return "query {\n" + "\n".join(selections) + "\n}"
+
+
+def build_blob_query(blobs: list[tuple[str, str, str, str]]) -> str:
+    """Aliased ``object(expression: "<sha>:<path>")`` selections per ``(owner, repo, sha, path)``."""
+    by_repo: dict[tuple[str, str], list[str]] = {}
+    for index, (owner, repo, sha, path) in enumerate(blobs):
+        by_repo.setdefault((owner, repo), []).append(
+            f"b{index}: object(expression: {_literal(f'{sha}:{path}')}) {{ ... on Blob {{ text }} }}"
+        )
+    selections = [
+        f"r{n}: repository(owner: {_literal(owner)}, name: {_literal(repo)}) {{ {' '.join(objects)} }}"
+        for n, ((owner, repo), objects) in enumerate(by_repo.items())
+    ]
+    return "query {\n" + "\n".join(selections) + "\n}"
+
+
+def execute(session: requests.Session, query: str) -> tuple[dict[str, Any], dict[str, dict[str, Any]]]:
+    """Run ``query``; returns ``data`` and the errors keyed by the top-level alias they belong to."""
+    resp = session.post(GRAPHQL_URL, json={"query": query}, timeout=session.timeout)
+    if resp.status_code in (401, 403):
+        raise GraphQLError(f"GraphQL request rejected ({resp.status_code}): {resp.text[:200]}")
+    resp.raise_for_status()
+    body = resp.json()
+    errors: dict[str, dict[str, Any]] = {}
+    for error in body.get("errors") or []:
+        if error.get("type") == "RATE_LIMITED":
+            raise GraphQLError("Rate limit exceeded")
+        path = error.get("path") or [""]
+        errors.setdefault(str(path[0]), error)
+    data = body.get("data")
+    if data is None:
+        raise GraphQLError(f"GraphQL query failed: {next(iter(errors.values()), {}).get('message', 'no data')}")
+    return data, errors
+
+
+def _repo_data(node: dict[str, Any]) -> dict[str, Any]:
+    """The REST ``/repos/{owner}/{repo}`` fields the analyzer reads."""
+    return {
+        "description": node.get("description") or "",
+        "created_at": node.get("createdAt", ""),
+        "updated_at": node.get("updatedAt", ""),
+        "stargazers_count": node.get("stargazerCount", 0),
+        "forks_count": node.get("forkCount", 0),
+        "open_issues_count": (node.get("issues") or {}).get("totalCount", 0),
+        "default_branch": (node.get("defaultBranchRef") or {}).get("name"),
+        "license": {"name": node["licenseInfo"]["name"]} if node.get("licenseInfo") else None,
+    }
+
+
+def fetch_repositories(
+    session: requests.Session, targets: list[tuple[str, str, str | None]], since: str | None
+) -> list[dict[str, Any]]:
+    """Metadata, commit SHA, README, raw languages and REST-shaped commits per target, in order.
+
+    A target that could not be fetched gets an ``{"error": ...}`` dict instead.
+    ``commits`` is None when ``since`` is None (no submission deadline).
+    """
+    data, errors = execute(session, build_repository_query(targets, since))
+    results = []
+    for index, (owner, repo, branch) in enumerate(targets):
+        node = data.get(f"r{index}")
+        if node is None:
+            error = errors.get(f"r{index}", {})
+            message = "Repository not found" if error.get("type") == "NOT_FOUND" else error.get("message", "unknown")
+            results.append({"error": message})
+            continue
+        commit = node.get("commit")
+        if not commit:
+            results.append({"error": f"Could not resolve ref {branch or 'HEAD'} for {owner}/{repo}"})
+            continue
+        readmes = [(node.get(f"readme{n}") or {}).get("text") for n in range(len(README_NAMES))]
+        readme = next((text for text in readmes if text), None)
+        commits = None
+        if since:
+            commits = [
+                {"commit": {"message": c.get("message", ""), "author": c.get("author") or {}}}
+                for c in commit["history"]["nodes"]
+            ]
+        results.append(
+            {
+                "repo_data": _repo_data(node),
+                "sha": commit["oid"],
+                "readme": readme,
+                "languages": {edge["node"]["name"]: edge["size"] for edge in node["languages"]["edges"]},
+                "commits": commits,
+            }
+        )
+    return results
+
+
+def fetch_blobs(session: requests.Session, blobs: list[tuple[str, str, str, str]]) -> dict[tuple[str, str, str], str]:
+    """Text of each ``(owner, repo, sha, path)`` blob, keyed by ``(owner, repo, path)``.
+
+    Binary and missing blobs are left out.
+    """
+    if not blobs:
+        return {}
+    data, _errors = execute(session, build_blob_query(blobs))
+    by_repo = list(dict.fromkeys((owner, repo) for owner, repo, _sha, _path in blobs))
+    contents = {}
+    for index, (owner, repo, _sha, path) in enumerate(blobs):
+        node = (data.get(f"r{by_repo.index((owner, repo))}") or {}).get(f"b{index}") or {}
+        if node.get("text") is not None:
+            contents[(owner, repo, path)] = node["text"]
+    return contents
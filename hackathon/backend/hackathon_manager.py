@@ -10,8 +10,11 @@ import json
 import logging
 import os
 import re
+import signal
 import sqlite3
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
 from typing import Any
 
@@ -41,10 +44,20 @@ logger = logging.getLogger(__name__)
 # Configuration — centralized in config module
 from hackathon.backend.config import (  # noqa: E402
     AI_MODEL_NAME,
-    BASE_URL,
     HACKATHON_DB_PATH,
+    LLM_STRUCTURED_OUTPUT,
     OPENROUTER_API_KEY,
+    WATCH_POLL_SECONDS,
+    WATCH_RETRY_SECONDS,
 )
+from hackathon.backend.db_watch import DataVersionWatcher  # noqa: E402
+from hackathon.backend.job_queue import drain_stage, get_job_queue  # noqa: E402
+from hackathon.backend.judge_history import JudgeHistory  # noqa: E402
+from hackathon.backend.llm_cache import get_default_cache  # noqa: E402
+from hackathon.backend.llm_client import LLMClient, cacheable_content  # noqa: E402
+from hackathon.backend.llm_latency import get_hedge_policy  # noqa: E402
+from hackathon.backend.llm_telemetry import get_telemetry_recorder  # noqa: E402
+from hackathon.backend.score_distribution import ScoreDistribution  # noqa: E402
 
 SCHEMA_PATH = os.path.join(os.path.dirname(__file__), "submission_schema.json")
 
@@ -77,9 +90,13 @@ def get_judge_recent_evaluations(db_path, judge_name, limit=3):
         conn.close()
 
 
-def add_variety_instruction(db_path, judge_name, base_prompt):
-    """Add variety instruction based on judge's recent database evaluations."""
-    recent_notes = get_judge_recent_evaluations(db_path, judge_name)
+def add_variety_instruction(db_path, judge_name, base_prompt, recent_notes=None):
+    """Add variety instruction based on judge's recent evaluations.
+
+    Pass ``recent_notes`` (newest first) to skip the database lookup.
+    """
+    if recent_notes is None:
+        recent_notes = get_judge_recent_evaluations(db_path, judge_name)
 
     if recent_notes:
         # Show judge their recent evaluation patterns to encourage variety
@@ -97,6 +114,20 @@ When evaluating this project, vary your language, sentence structure, and critic
     return base_prompt
 
 
+def split_template_prefix(template: str, static_fields: dict[str, Any], **fields) -> tuple[str, str]:
+    """Format ``template`` and split it where the first non-static placeholder starts.
+
+    The prefix only depends on the template and ``static_fields``, so it is a
+    stable prompt-cache prefix; the remainder carries the per-project values.
+    """
+    full = template.format(**static_fields, **fields)
+    marked = template.format(**static_fields, **{name: "\x00" for name in fields})
+    cut = marked.find("\x00")
+    if cut == -1:
+        return full, ""
+    return full[:cut], full[cut:]
+
+
 def get_v2_fields_from_schema():
     with open(SCHEMA_PATH) as f:
         schema = json.load(f)
@@ -105,11 +136,73 @@ def get_v2_fields_from_schema():
 
 # In all scoring and prompt logic, use get_v2_fields_from_schema() for field access and validation.
 
+JUDGES = ["aimarc", "aishaw", "spartan", "peepo"]
+
+# Block header in panel-mode responses, tolerant of markdown decoration ("## JUDGE: aimarc", "**JUDGE: aimarc**")
+PANEL_JUDGE_HEADER = re.compile(r"^[#*\s]*JUDGE:\s*\**\s*([A-Za-z0-9_-]+)\**\s*$", re.MULTILINE)
+
+
+# Response field labels for each Round 1 criterion ("INNOVATION_SCORE:", "INNOVATION_REASON:", ...)
+SCORE_LABELS = {
+    "INNOVATION": "innovation",
+    "TECHNICAL": "technical_execution",
+    "MARKET": "market_potential",
+    "EXPERIENCE": "user_experience",
+}
+# Every labelled field in a text scoring response, matched in a single pass
+RESPONSE_FIELD = re.compile(
+    r"\b(?:(INNOVATION|TECHNICAL|MARKET|EXPERIENCE)_(SCORE|REASON)|OVERALL_COMMENT)\**:\**[ \t]*"
+)
+
+# JSON schema for structured-output scoring (sent as response_format)
+_CRITERION_SCHEMA = {
+    "type": "object",
+    "properties": {"score": {"type": "integer", "minimum": 0, "maximum": 10}, "reason": {"type": "string"}},
+    "required": ["score", "reason"],
+    "additionalProperties": False,
+}
+JUDGE_SCORE_SCHEMA = {
+    "type": "object",
+    "properties": {
+        **{criterion: _CRITERION_SCHEMA for criterion in SCORE_LABELS.values()},
+        "overall_comment": {"type": "string"},
+    },
+    "required": [*SCORE_LABELS.values(), "overall_comment"],
+    "additionalProperties": False,
+}
+STRUCTURED_OUTPUT_INSTRUCTIONS = """OUTPUT FORMAT OVERRIDE:
+Respond with a single JSON object instead of labelled lines: one key per criterion
+(innovation, technical_execution, market_potential, user_experience), each {"score": 0-10, "reason": "..."},
+plus "overall_comment". No text outside the JSON.
+"""
+
 
 class HackathonManager:
-    def __init__(self, db_path=None, version=None, force=False):
-        """Initialize the hackathon manager."""
-        if not OPENROUTER_API_KEY:
+    def __init__(
+        self,
+        db_path=None,
+        version=None,
+        force=False,
+        parallel_judges=False,
+        llm_cache=True,
+        panel=False,
+        hedge=False,
+        structured_output=False,
+        api_key=None,
+    ):
+        """Initialize the hackathon manager.
+
+        ``parallel_judges`` fans the four Round 1 judge requests out concurrently
+        instead of calling them one after another. ``panel`` instead asks for all
+        judges in a single request. ``llm_cache=False`` bypasses the persistent
+        LLM response cache for this run. ``hedge`` duplicates requests still
+        pending at the run's p90 latency (also enabled by ``LLM_HEDGE_ENABLED``).
+        ``structured_output`` asks for JSON scores matching ``JUDGE_SCORE_SCHEMA``
+        (also enabled by ``LLM_STRUCTURED_OUTPUT``); text replies still parse.
+        ``api_key`` overrides ``OPENROUTER_API_KEY`` (the offline benchmark passes a dummy one).
+        """
+        api_key = api_key or OPENROUTER_API_KEY
+        if not api_key:
             raise ValueError("OPENROUTER_API_KEY not found in environment variables")
 
         self.db_path = db_path or HACKATHON_DB_PATH
@@ -117,19 +210,25 @@ class HackathonManager:
         self.table = f"hackathon_submissions_{self.version}"
         self.fields = get_fields(self.version)
         self.force = force
-
-        from hackathon.backend.http_client import create_session
-
-        self.session = create_session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://github.com/m3-org/clanktank",
-                "X-Title": "Clank Tank Hackathon Judge Scoring",
-            }
+        self.parallel_judges = parallel_judges
+        self.panel = panel
+        self.structured_output = structured_output or LLM_STRUCTURED_OUTPUT
+
+        # Shared transport (pool, pacing, retries, breaker) plus this run's response cache
+        self.llm = LLMClient(
+            cache=get_default_cache(llm_cache),
+            api_key=api_key,
+            title="Clank Tank Hackathon Judge Scoring",
+            stage="score",
+            hedge=get_hedge_policy(hedge),
         )
-        self.headers = dict(self.session.headers)
+        # Per-call latency/token telemetry for `clanktank status --llm`
+        telemetry = get_telemetry_recorder(self.db_path)
+        if telemetry is not None:
+            self.llm.add_hook(telemetry)
+
+        # Recent notes per judge for variety prompts, kept current as scores are written
+        self.judge_history = JudgeHistory.from_db(self.db_path)
 
     def create_scoring_prompt(
         self,
@@ -138,11 +237,94 @@ class HackathonManager:
         research_data: dict[str, Any],
     ) -> str:
         """Create a detailed scoring prompt for a specific judge."""
+        prefix, suffix = self._scoring_prompt_parts(judge_name, project_data, research_data)
+        return prefix + suffix
+
+    def _scoring_prompt_parts(
+        self,
+        judge_name: str,
+        project_data: dict[str, Any],
+        research_data: dict[str, Any],
+    ) -> tuple[str, str]:
+        """Split a judge prompt into a static, cacheable prefix and the project-specific rest.
+
+        The prefix (persona, score scale, scoring task) is byte-identical for
+        every project a judge scores, so provider prompt caches can reuse it.
+        """
         persona = JUDGE_PERSONAS.get(judge_name, "")
 
-        # Score scale loaded from JUDGE_CONFIG env var
-        SCALE = get_score_scale()
+        # Score scale and scoring task loaded from JUDGE_CONFIG env var
+        prefix = f"""{persona}
+
+{get_score_scale()}
+
+You are judging a hackathon project for Clank Tank. Evaluate it based on your unique perspective.
+
+{get_scoring_task()}
+
+"""
+        if self.structured_output:
+            prefix += f"{STRUCTURED_OUTPUT_INSTRUCTIONS}\n"
+
+        # Project data, then variety instruction based on recent evaluations
+        suffix = add_variety_instruction(
+            self.db_path,
+            judge_name,
+            f"PROJECT TO EVALUATE:\n\n{self._project_context(project_data, research_data)}",
+            recent_notes=self.judge_history.recent(judge_name),
+        )
+        return prefix, suffix
+
+    def create_panel_scoring_prompt(
+        self,
+        judges: list[str],
+        project_data: dict[str, Any],
+        research_data: dict[str, Any],
+    ) -> str:
+        """Create one prompt asking the whole panel to score a project, one block per judge.
+
+        The project details and research are sent once instead of once per judge.
+        """
+        prefix, suffix = self._panel_prompt_parts(judges, project_data, research_data)
+        return prefix + suffix
+
+    def _panel_prompt_parts(
+        self,
+        judges: list[str],
+        project_data: dict[str, Any],
+        research_data: dict[str, Any],
+    ) -> tuple[str, str]:
+        """Static panel instructions and personas first, then variety reminders and the project."""
+        panel = "\n\n".join(f"### {judge_name}\n{JUDGE_PERSONAS.get(judge_name, '')}" for judge_name in judges)
+
+        prefix = f"""{get_score_scale()}
+
+You are the Clank Tank hackathon judging panel. Evaluate the project below once for each judge listed,
+each strictly from that judge's own perspective and in their own voice. Judges score independently.
+
+JUDGES:
+{panel}
 
+{get_scoring_task()}
+
+PANEL OUTPUT FORMAT:
+For each judge, in the order listed, start a new block with a line "JUDGE: <name>" ({", ".join(judges)}),
+followed by that judge's complete response in the format above (all _SCORE and _REASON lines plus OVERALL_COMMENT).
+
+"""
+
+        reminders = "".join(
+            add_variety_instruction(
+                self.db_path, judge_name, f"\n({judge_name})", recent_notes=self.judge_history.recent(judge_name)
+            )
+            for judge_name in judges
+            if self.judge_history.recent(judge_name)
+        )
+        suffix = f"PROJECT TO EVALUATE:\n\n{self._project_context(project_data, research_data)}\n{reminders}"
+        return prefix, suffix
+
+    def _project_context(self, project_data: dict[str, Any], research_data: dict[str, Any]) -> str:
+        """Project details and research findings shared by every judge prompt."""
         # Parse research data
         github_analysis = {}
         ai_research = {}
@@ -183,13 +365,7 @@ RESEARCH-IDENTIFIED RED FLAGS:
 {chr(10).join(f"• {flag}" for flag in red_flags)}
 """
 
-        prompt = f"""{persona}
-
-{SCALE}
-
-You are judging this hackathon project for Clank Tank. Evaluate it based on your unique perspective.
-
-PROJECT DETAILS:
+        return f"""PROJECT DETAILS:
 Name: {project_data.get("project_name", "Untitled")}
 Category: {project_data.get("category", "Unknown")}
 Description: {project_data.get("description", "No description")}
@@ -202,51 +378,21 @@ RESEARCH FINDINGS:
 Is Fork: {is_fork}
 Contributors: {contributors}
 {red_flags_section}
-AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI research available"}
-
-{get_scoring_task()}"""
-
-        # Add variety instruction based on recent evaluations
-        prompt_with_variety = add_variety_instruction(self.db_path, judge_name, prompt)
-        return prompt_with_variety
+AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI research available"}"""
 
     def parse_scoring_response(self, response_text: str) -> dict[str, Any]:
         """Parse the AI's scoring response into structured data.
 
+        Accepts a JSON object (structured-output mode) or labelled text fields.
+
         Raises:
             ValueError: If required scores cannot be parsed from response.
         """
-        scores = {}
-        reasons = {}
-        overall_comment = ""
-        parse_errors = []
-
-        # Parse scores and reasons using regex
-        patterns = {
-            "innovation": r"INNOVATION_SCORE:\s*(\d+)",
-            "innovation_reason": r"INNOVATION_REASON:\s*(.+?)(?=\n[A-Z]|$)",
-            "technical_execution": r"TECHNICAL_SCORE:\s*(\d+)",
-            "technical_reason": r"TECHNICAL_REASON:\s*(.+?)(?=\n[A-Z]|$)",
-            "market_potential": r"MARKET_SCORE:\s*(\d+)",
-            "market_reason": r"MARKET_REASON:\s*(.+?)(?=\n[A-Z]|$)",
-            "user_experience": r"EXPERIENCE_SCORE:\s*(\d+)",
-            "experience_reason": r"EXPERIENCE_REASON:\s*(.+?)(?=\n[A-Z]|$)",
-            "overall": r"OVERALL_COMMENT:\s*(.+?)(?=\n|$)",
-        }
-
-        for key, pattern in patterns.items():
-            match = re.search(pattern, response_text, re.MULTILINE | re.DOTALL)
-            if match:
-                if "reason" in key:
-                    reasons[key.replace("_reason", "")] = match.group(1).strip()
-                elif key == "overall":
-                    overall_comment = match.group(1).strip()
-                else:
-                    try:
-                        score = int(match.group(1))
-                        scores[key] = max(0, min(10, score))
-                    except (ValueError, IndexError) as e:
-                        parse_errors.append(f"Could not parse score for {key}: {e}")
+        structured = self._parse_structured_scores(response_text)
+        if structured is not None:
+            scores, reasons, overall_comment, parse_errors = structured
+        else:
+            scores, reasons, overall_comment, parse_errors = self._parse_labelled_scores(response_text)
 
         # Validate we have all required scores - FAIL LOUDLY instead of defaulting
         required_scores = [
@@ -271,6 +417,90 @@ AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI resea
             "overall_comment": overall_comment,
         }
 
+    @staticmethod
+    def _parse_structured_scores(response_text: str) -> tuple[dict, dict, str, list[str]] | None:
+        """Read a JSON scoring reply; None if the reply is not JSON (use the text parser)."""
+        text = response_text.strip()
+        if text.startswith("```"):
+            text = text.strip("`").removeprefix("json").strip()
+        if not text.startswith("{"):
+            return None
+        try:
+            data = json.loads(text)
+        except json.JSONDecodeError:
+            return None
+        if not isinstance(data, dict):
+            return None
+
+        scores, reasons, parse_errors = {}, {}, []
+        for label, criterion in SCORE_LABELS.items():
+            entry = data.get(criterion)
+            if not isinstance(entry, dict):
+                continue
+            try:
+                scores[criterion] = max(0, min(10, int(entry.get("score"))))
+            except (TypeError, ValueError) as e:
+                parse_errors.append(f"Could not parse score for {criterion}: {e}")
+            if entry.get("reason"):
+                reasons[label.lower()] = str(entry["reason"]).strip()
+        return scores, reasons, str(data.get("overall_comment") or "").strip(), parse_errors
+
+    @staticmethod
+    def _parse_labelled_scores(response_text: str) -> tuple[dict, dict, str, list[str]]:
+        """Read ``INNOVATION_SCORE: 8`` / ``INNOVATION_REASON: ...`` fields in one pass.
+
+        A field's value is the first line after its label (which may sit on its
+        own line or be wrapped in markdown bold); the first occurrence wins.
+        """
+        scores, reasons, parse_errors = {}, {}, []
+        overall_comment = None
+        fields = list(RESPONSE_FIELD.finditer(response_text))
+        for i, field in enumerate(fields):
+            end = fields[i + 1].start() if i + 1 < len(fields) else len(response_text)
+            value = response_text[field.end() : end].strip().split("\n", 1)[0].strip(" \t*")
+            label, kind = field.group(1), field.group(2)
+
+            if label is None:
+                if overall_comment is None:
+                    overall_comment = value
+                continue
+            criterion = SCORE_LABELS[label]
+            if kind == "REASON":
+                if value:
+                    reasons.setdefault(label.lower(), value)
+            elif criterion not in scores:
+                digits = re.match(r"\d+", value)
+                if digits:
+                    scores[criterion] = max(0, min(10, int(digits.group())))
+                elif value:
+                    parse_errors.append(f"Could not parse score for {criterion}: {value[:20]!r}")
+        return scores, reasons, overall_comment or "", parse_errors
+
+    def parse_panel_response(
+        self, response_text: str, judges: list[str]
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
+        """Split a panel response into per-judge blocks and parse each one.
+
+        Returns ``(parsed, errors)``: parsed blocks keyed by judge, and an error
+        message for every requested judge whose block is missing or unparseable.
+        """
+        blocks = {}
+        headers = list(PANEL_JUDGE_HEADER.finditer(response_text))
+        for i, header in enumerate(headers):
+            end = headers[i + 1].start() if i + 1 < len(headers) else len(response_text)
+            blocks.setdefault(header.group(1).lower(), response_text[header.end() : end])
+
+        parsed, errors = {}, {}
+        for judge_name in judges:
+            if judge_name not in blocks:
+                errors[judge_name] = "No block for this judge in panel response"
+                continue
+            try:
+                parsed[judge_name] = self.parse_scoring_response(blocks[judge_name])
+            except ValueError as e:
+                errors[judge_name] = str(e)
+        return parsed, errors
+
     def renormalize_scores(self, scores, target_mean=6):
         """Post-hoc score normalization to prevent grade inflation."""
         if not scores:
@@ -324,7 +554,7 @@ AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI resea
         research_data: dict[str, Any],
     ) -> dict[str, Any]:
         """Get AI-generated scores for a specific judge."""
-        prompt = self.create_scoring_prompt(judge_name, project_data, research_data)
+        prefix, suffix = self._scoring_prompt_parts(judge_name, project_data, research_data)
 
         payload = {
             "model": AI_MODEL_NAME,
@@ -333,43 +563,34 @@ AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI resea
                     "role": "system",
                     "content": f"You are {judge_name}, a judge in the Clank Tank hackathon. Stay in character and evaluate projects from your unique perspective.",
                 },
-                {"role": "user", "content": prompt},
+                {"role": "user", "content": cacheable_content(prefix, suffix)},
             ],
             "temperature": 0.3,
             "max_tokens": 1500,
         }
+        if self.structured_output:
+            payload["response_format"] = {
+                "type": "json_schema",
+                "json_schema": {"name": "judge_scores", "strict": True, "schema": JUDGE_SCORE_SCHEMA},
+            }
 
         try:
             logger.info(f"Getting scores from {judge_name} for {project_data['project_name']}")
-            response = self.session.post(BASE_URL, json=payload, timeout=self.session.timeout)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self.llm.chat(
+                payload,
+                validate=lambda r: self.parse_scoring_response(r["choices"][0]["message"]["content"]),
+                tags={"judge": judge_name},
+            )
             content = result["choices"][0]["message"]["content"]
 
-            # Parse the response
-            parsed = self.parse_scoring_response(content)
-
-            # Calculate weighted score
-            weighted_total = self.calculate_weighted_score(judge_name, parsed["scores"])
-
-            # Compile final scores
-            judge_scores = {
-                "judge_name": judge_name,
-                "innovation": parsed["scores"]["innovation"],
-                "technical_execution": parsed["scores"]["technical_execution"],
-                "market_potential": parsed["scores"]["market_potential"],
-                "user_experience": parsed["scores"]["user_experience"],
-                "weighted_total": weighted_total,
-                "notes": json.dumps(
-                    {
-                        "reasons": parsed["reasons"],
-                        "overall_comment": parsed["overall_comment"],
-                    }
-                ),
-            }
+            # Parse the response; never keep serving a cached reply that can't be parsed
+            try:
+                parsed = self.parse_scoring_response(content)
+            except ValueError:
+                self.llm.invalidate(payload)
+                raise
 
-            return judge_scores
+            return self._build_judge_scores(judge_name, parsed)
 
         except requests.exceptions.RequestException as e:
             # Network/API errors - propagate so caller can decide on retry
@@ -384,9 +605,134 @@ AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI resea
             logger.error(f"Unexpected error getting scores from {judge_name}: {e}")
             raise RuntimeError(f"Unexpected AI scoring error for judge {judge_name}: {e}") from e
 
+    def get_panel_scores(
+        self,
+        judges: list[str],
+        project_data: dict[str, Any],
+        research_data: dict[str, Any],
+    ) -> tuple[dict[str, dict[str, Any]], dict[str, str]]:
+        """Get every judge's scores from a single panel request.
+
+        Returns ``(scores, errors)`` keyed by judge, so judges whose block did
+        parse can be kept while the rest are retried.
+
+        Raises:
+            RuntimeError: If the request itself fails.
+        """
+        prefix, suffix = self._panel_prompt_parts(judges, project_data, research_data)
+
+        payload = {
+            "model": AI_MODEL_NAME,
+            "messages": [
+                {
+                    "role": "system",
+                    "content": "You are the Clank Tank hackathon judging panel. Write each judge's evaluation in that judge's own character and voice.",
+                },
+                {"role": "user", "content": cacheable_content(prefix, suffix)},
+            ],
+            "temperature": 0.3,
+            "max_tokens": 1500 * len(judges),
+        }
+
+        try:
+            logger.info(f"Getting panel scores ({', '.join(judges)}) for {project_data['project_name']}")
+            result = self.llm.chat(payload, tags={"judge": "panel"})
+            content = result["choices"][0]["message"]["content"]
+        except requests.exceptions.RequestException as e:
+            logger.error(f"Panel API request failed: {e}")
+            raise RuntimeError(f"AI API request failed for judging panel: {e}") from e
+        except Exception as e:
+            logger.error(f"Unexpected error getting panel scores: {e}")
+            raise RuntimeError(f"Unexpected AI scoring error for judging panel: {e}") from e
+
+        parsed, errors = self.parse_panel_response(content, judges)
+        if errors:
+            # Don't keep serving a cached reply with unusable blocks
+            self.llm.invalidate(payload)
+            for judge_name, error in errors.items():
+                logger.error(f"Panel score parsing failed for {judge_name}: {error}")
+
+        scores = {judge_name: self._build_judge_scores(judge_name, p) for judge_name, p in parsed.items()}
+        return scores, errors
+
+    def _build_judge_scores(self, judge_name: str, parsed: dict[str, Any]) -> dict[str, Any]:
+        """Turn a parsed scoring response into the row stored in hackathon_scores."""
+        # Calculate weighted score
+        weighted_total = self.calculate_weighted_score(judge_name, parsed["scores"])
+
+        # Compile final scores
+        return {
+            "judge_name": judge_name,
+            "innovation": parsed["scores"]["innovation"],
+            "technical_execution": parsed["scores"]["technical_execution"],
+            "market_potential": parsed["scores"]["market_potential"],
+            "user_experience": parsed["scores"]["user_experience"],
+            "weighted_total": weighted_total,
+            "notes": json.dumps(
+                {
+                    "reasons": parsed["reasons"],
+                    "overall_comment": parsed["overall_comment"],
+                }
+            ),
+        }
+
     def score_submission(self, submission_id: str, round_num: int = 1) -> list[dict[str, Any]]:
-        """Score a single submission with all judges."""
-        conn = sqlite3.connect(self.db_path)
+        """Score a single submission with all judges.
+
+        Each judge's result is written in its own short transaction as soon as
+        it arrives, so no write lock is held across LLM calls. Judges that
+        already have a score for this round, written after the current
+        research, are skipped unless ``force`` is set, which lets a re-run
+        after a partial failure retry only the missing ones.
+        """
+        project_data, research_data, existing = self._load_scoring_inputs(submission_id, round_num)
+
+        pending = [judge for judge in JUDGES if self.force or judge not in existing]
+        if len(pending) < len(JUDGES):
+            logger.info(f"Reusing {len(JUDGES) - len(pending)} stored judge score(s) for {submission_id}")
+
+        def persist(judge_scores):
+            judge_scores["submission_id"] = submission_id
+            judge_scores["round"] = round_num
+            self._save_judge_score(judge_scores)
+
+        try:
+            new_scores = self._collect_judge_scores(project_data, research_data, judges=pending, on_score=persist)
+        except Exception as e:
+            logger.error(f"Failed to score submission {submission_id}: {e}")
+            raise
+
+        scores = {**existing, **{judge_scores["judge_name"]: judge_scores for judge_scores in new_scores}}
+
+        # Update submission status
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.execute(
+                f"""
+                UPDATE {self.table}
+                SET status = 'scored', updated_at = ?
+                WHERE submission_id = ?
+            """,
+                (datetime.now().isoformat(), submission_id),
+            )
+            conn.commit()
+        finally:
+            conn.close()
+
+        # Simple audit logging
+        from hackathon.backend.simple_audit import log_system_action
+
+        log_system_action("submission_scored", submission_id)
+
+        logger.info(f"Scoring completed for {submission_id}")
+
+        return [scores[judge] for judge in JUDGES]
+
+    def _load_scoring_inputs(
+        self, submission_id: str, round_num: int
+    ) -> tuple[dict[str, Any], dict[str, Any], dict[str, dict[str, Any]]]:
+        """Read the submission, its research and the round's judge scores stored since that research."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
         try:
@@ -421,72 +767,137 @@ AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI resea
                 research_columns = [desc[0] for desc in cursor.description]
                 research_data = dict(zip(research_columns, research_row))
 
-            # Get scores from each judge
-            all_scores = []
-            judges = ["aimarc", "aishaw", "spartan", "peepo"]
-
-            for judge_name in judges:
-                judge_scores = self.get_ai_scores(judge_name, project_data, research_data)
-                judge_scores["submission_id"] = submission_id
-                judge_scores["round"] = round_num
-
-                # Save to database (UPSERT: replace existing score for same submission/judge/round)
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO hackathon_scores
-                    (submission_id, judge_name, round, innovation, technical_execution,
-                     market_potential, user_experience, weighted_total, notes, created_at)
-                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                """,
-                    (
-                        submission_id,
-                        judge_scores["judge_name"],
-                        round_num,
-                        judge_scores["innovation"],
-                        judge_scores["technical_execution"],
-                        judge_scores["market_potential"],
-                        judge_scores["user_experience"],
-                        judge_scores["weighted_total"],
-                        judge_scores["notes"],
-                        datetime.now().isoformat(),
-                    ),
-                )
-
-                all_scores.append(judge_scores)
-
-                # Rate limiting
-                time.sleep(1)
-
-            # Update submission status
             cursor.execute(
-                f"""
-                UPDATE {self.table}
-                SET status = 'scored', updated_at = ?
-                WHERE submission_id = ?
+                """
+                SELECT judge_name, innovation, technical_execution, market_potential,
+                       user_experience, weighted_total, notes
+                FROM hackathon_scores
+                WHERE submission_id = ? AND round = ?
+                  AND julianday(created_at) >= COALESCE(
+                      (SELECT julianday(created_at) FROM hackathon_research WHERE submission_id = ?), 0
+                  )
             """,
-                (datetime.now().isoformat(), submission_id),
+                (submission_id, round_num, submission_id),
             )
+            score_columns = [desc[0] for desc in cursor.description]
+            existing = {}
+            for score_row in cursor.fetchall():
+                judge_scores = dict(zip(score_columns, score_row))
+                if judge_scores["judge_name"] in JUDGES:
+                    judge_scores.update(submission_id=submission_id, round=round_num)
+                    existing[judge_scores["judge_name"]] = judge_scores
+
+            return project_data, research_data, existing
+        finally:
+            conn.close()
 
+    def _save_judge_score(self, judge_scores: dict[str, Any]) -> None:
+        """Persist one judge's scores in a short transaction of its own."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            # UPSERT: replace existing score for same submission/judge/round
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO hackathon_scores
+                (submission_id, judge_name, round, innovation, technical_execution,
+                 market_potential, user_experience, weighted_total, notes, created_at)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+                (
+                    judge_scores["submission_id"],
+                    judge_scores["judge_name"],
+                    judge_scores["round"],
+                    judge_scores["innovation"],
+                    judge_scores["technical_execution"],
+                    judge_scores["market_potential"],
+                    judge_scores["user_experience"],
+                    judge_scores["weighted_total"],
+                    judge_scores["notes"],
+                    datetime.now().isoformat(),
+                ),
+            )
             conn.commit()
+        finally:
+            conn.close()
 
-            # Simple audit logging
-            from hackathon.backend.simple_audit import log_system_action
+        self.judge_history.record(judge_scores["judge_name"], judge_scores["notes"])
 
-            log_system_action("submission_scored", submission_id)
+    def _collect_judge_scores(
+        self,
+        project_data: dict[str, Any],
+        research_data: dict[str, Any],
+        judges: list[str] | None = None,
+        on_score=None,
+    ) -> list[dict[str, Any]]:
+        """Get each judge's scores, serially, fanned out or as one panel request, in ``judges`` order.
+
+        ``on_score`` is called with every result as soon as it arrives. A failing
+        judge does not stop the others; the first failure is re-raised once all
+        of them have finished. Pacing is handled by the shared token bucket and
+        per-model limiter, so fanning out never exceeds ``LLM_RATE_LIMIT_RPS``.
+        """
+        judges = JUDGES if judges is None else judges
+        results = {}
+        errors = []
 
-            logger.info(f"Scoring completed for {submission_id}")
+        def record(judge_name, judge_scores):
+            if on_score is not None:
+                on_score(judge_scores)
+            results[judge_name] = judge_scores
 
-            return all_scores
+        if self.panel and len(judges) > 1:
+            panel_scores, panel_errors = self.get_panel_scores(judges, project_data, research_data)
+            for judge_name in judges:
+                if judge_name in panel_scores:
+                    record(judge_name, panel_scores[judge_name])
+                else:
+                    errors.append(
+                        RuntimeError(f"AI score parsing failed for judge {judge_name}: {panel_errors[judge_name]}")
+                    )
+        elif not self.parallel_judges or len(judges) <= 1:
+            for judge_name in judges:
+                try:
+                    judge_scores = self.get_ai_scores(judge_name, project_data, research_data)
+                except Exception as e:
+                    errors.append(e)
+                    continue
+                record(judge_name, judge_scores)
+        else:
+            with ThreadPoolExecutor(max_workers=len(judges), thread_name_prefix="judge") as pool:
+                futures = {
+                    pool.submit(self.get_ai_scores, judge_name, project_data, research_data): judge_name
+                    for judge_name in judges
+                }
+                for future in as_completed(futures):
+                    try:
+                        judge_scores = future.result()
+                    except Exception as e:
+                        errors.append(e)
+                        continue
+                    record(futures[future], judge_scores)
+
+        if errors:
+            raise errors[0]
+        return [results[judge_name] for judge_name in judges]
+
+    def score_all_researched(self, round_num: int = 1, concurrency: int = 1) -> dict[str, Any]:
+        """Score all submissions with research data (or force re-score all if force=True).
+
+        With ``concurrency`` > 1, submissions are scored by a bounded worker pool
+        that shares this manager's rate limiter. Each submission still runs in
+        its own connection/transaction, so one failure never affects another.
+        """
+        pending_submissions = self.pending_for_scoring()
+        if not pending_submissions:
+            logger.info("No researched submissions to score")
+            return {"scored": 0, "failed": 0}
 
-        except Exception as e:
-            logger.error(f"Failed to score submission {submission_id}: {e}")
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+        logger.info(f"Found {len(pending_submissions)} submissions to score")
+
+        return self._score_batch(pending_submissions, round_num, concurrency)
 
-    def score_all_researched(self, round_num: int = 1) -> dict[str, Any]:
-        """Score all submissions with research data (or force re-score all if force=True)."""
+    def pending_for_scoring(self) -> list[tuple[Any, str]]:
+        """``(submission_id, project_name)`` for submissions awaiting scores (all researched ones with force)."""
         conn = sqlite3.connect(self.db_path)
         cursor = conn.cursor()
 
@@ -514,27 +925,97 @@ AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI resea
 
         pending_submissions = cursor.fetchall()
         conn.close()
+        return pending_submissions
 
-        if not pending_submissions:
-            logger.info("No researched submissions to score")
-            return {"scored": 0, "failed": 0}
+    def _score_batch(self, submissions, round_num: int, concurrency: int) -> dict[str, Any]:
+        """Score ``(submission_id, project_name)`` pairs with a bounded worker pool."""
+        from hackathon.backend.progress import ThroughputProgress
 
-        logger.info(f"Found {len(pending_submissions)} submissions to score")
-
-        results = {"scored": 0, "failed": 0}
+        progress = ThroughputProgress(len(submissions), label="score")
 
-        for submission_id, project_name in pending_submissions:
+        def score_one(submission_id, project_name) -> bool:
+            progress.start()
             try:
                 logger.info(f"Scoring: {project_name} ({submission_id})")
                 self.score_submission(submission_id, round_num)
-                results["scored"] += 1
-
+                progress.finish(ok=True)
+                return True
             except Exception as e:
                 logger.error(f"Failed to score {submission_id}: {e}")
-                results["failed"] += 1
-                continue
+                progress.finish(ok=False)
+                return False
+
+        if concurrency <= 1:
+            outcomes = [score_one(submission_id, project_name) for submission_id, project_name in submissions]
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="score") as pool:
+                outcomes = list(pool.map(lambda row: score_one(*row), submissions))
 
-        return results
+        progress.close()
+        scored = sum(1 for ok in outcomes if ok)
+        return {"scored": scored, "failed": len(outcomes) - scored}
+
+    def watch_researched(
+        self,
+        round_num: int = 1,
+        concurrency: int = 1,
+        poll_interval: float = WATCH_POLL_SECONDS,
+        retry_delay: float = WATCH_RETRY_SECONDS,
+        stop: threading.Event | None = None,
+    ) -> dict[str, int]:
+        """Score submissions as they reach ``researched``, until ``stop`` is set.
+
+        The database is only re-queried after another connection commits
+        (``PRAGMA data_version``), so an idle watcher costs one pragma per
+        ``poll_interval``. At most ``concurrency`` submissions are scored at
+        once. A submission that fails is retried after ``retry_delay``
+        seconds. On stop, in-flight scores finish and queued ones are dropped.
+        """
+        stop = stop or threading.Event()
+        watcher = DataVersionWatcher(self.db_path)
+        totals = {"scored": 0, "failed": 0}
+        in_flight: set[Any] = set()
+        retry_at: dict[Any, float] = {}
+        lock = threading.Lock()
+
+        def score_one(submission_id, project_name) -> None:
+            try:
+                logger.info(f"Scoring: {project_name} ({submission_id})")
+                self.score_submission(submission_id, round_num)
+                outcome = "scored"
+            except Exception as e:
+                logger.error(f"Failed to score {submission_id}: {e}")
+                outcome = "failed"
+            with lock:
+                totals[outcome] += 1
+                in_flight.discard(submission_id)
+                if outcome == "failed":
+                    retry_at[submission_id] = time.monotonic() + retry_delay
+
+        logger.info(f"Watching {self.db_path} for researched submissions (Ctrl-C to stop)")
+        pool = ThreadPoolExecutor(max_workers=max(1, concurrency), thread_name_prefix="watch-score")
+        try:
+            while not stop.is_set():
+                now = time.monotonic()
+                with lock:
+                    retry_due = any(due <= now for due in retry_at.values())
+                if watcher.changed() or retry_due:
+                    for submission_id, project_name in self.pending_for_scoring():
+                        with lock:
+                            if submission_id in in_flight or retry_at.get(submission_id, 0) > now:
+                                continue
+                            in_flight.add(submission_id)
+                            # A due retry is back in flight; keeping it would re-query on every poll
+                            retry_at.pop(submission_id, None)
+                        pool.submit(score_one, submission_id, project_name)
+                stop.wait(poll_interval)
+        finally:
+            with lock:
+                if in_flight:
+                    logger.info(f"Stopping with {len(in_flight)} submission(s) in flight; running ones will finish")
+            pool.shutdown(wait=True, cancel_futures=True)
+            watcher.close()
+        return totals
 
     def get_leaderboard(self, sort_by_round: int | None = None) -> list[dict[str, Any]]:
         """Get the leaderboard with R1 and R2 scores side by side.
@@ -602,165 +1083,49 @@ AI Research: {json.dumps(ai_research, indent=2) if ai_research else "No AI resea
 
     def analyze_score_distribution(self, round_num: int = 1) -> dict[str, Any]:
         """Analyze the distribution of scores across all submissions for comparative reasoning."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-
-        # Get all scores for the round
-        cursor.execute(
-            """
-            SELECT
-                s.submission_id,
-                s.project_name,
-                s.category,
-                sc.judge_name,
-                sc.innovation,
-                sc.technical_execution,
-                sc.market_potential,
-                sc.user_experience,
-                sc.weighted_total,
-                sc.notes
-            FROM hackathon_scores sc
-            JOIN hackathon_submissions_v2 s ON sc.submission_id = s.submission_id
-            WHERE sc.round = ?
-            ORDER BY sc.weighted_total DESC
-            """,
-            (round_num,),
-        )
-
-        results = cursor.fetchall()
-        conn.close()
-
-        if not results:
-            return {"error": "No scores found for this round"}
-
-        # Organize data
-        projects = {}
-        all_scores = []
-
-        for row in results:
-            (
-                submission_id,
-                project_name,
-                category,
-                judge_name,
-                innovation,
-                technical,
-                market,
-                experience,
-                weighted_total,
-                notes,
-            ) = row
-
-            if submission_id not in projects:
-                projects[submission_id] = {
-                    "project_name": project_name,
-                    "category": category,
-                    "judges": {},
-                    "avg_score": 0,
-                    "score_variance": 0,
-                }
-
-            # Parse notes to extract reasoning
-            try:
-                judge_notes = json.loads(notes) if notes else {}
-            except Exception:
-                judge_notes = {"raw": notes}
-
-            projects[submission_id]["judges"][judge_name] = {
-                "innovation": innovation,
-                "technical_execution": technical,
-                "market_potential": market,
-                "user_experience": experience,
-                "weighted_total": weighted_total,
-                "notes": judge_notes,
-            }
-
-            all_scores.append(weighted_total)
+        return self.build_score_distribution(round_num).to_dict()
 
-        # Calculate statistics
-        import statistics
-
-        for project_id in projects:
-            judge_scores = [judge_data["weighted_total"] for judge_data in projects[project_id]["judges"].values()]
-            projects[project_id]["avg_score"] = statistics.mean(judge_scores)
-            projects[project_id]["score_variance"] = statistics.variance(judge_scores) if len(judge_scores) > 1 else 0
-
-        # Overall distribution stats
-        distribution_stats = {
-            "mean": statistics.mean(all_scores),
-            "median": statistics.median(all_scores),
-            "std_dev": statistics.stdev(all_scores) if len(all_scores) > 1 else 0,
-            "min": min(all_scores),
-            "max": max(all_scores),
-            "total_projects": len(projects),
-            "score_ranges": {
-                "excellent": len([s for s in all_scores if s >= 32]),  # 8+ avg
-                "good": len([s for s in all_scores if 24 <= s < 32]),  # 6-8 avg
-                "average": len([s for s in all_scores if 16 <= s < 24]),  # 4-6 avg
-                "poor": len([s for s in all_scores if s < 16]),  # <4 avg
-            },
-        }
+    def build_score_distribution(self, round_num: int = 1) -> ScoreDistribution:
+        """Load the round's scores once into a reusable in-memory index."""
+        return ScoreDistribution.from_db(self.db_path, self.table, round_num)
 
-        # Rank projects
-        ranked_projects = sorted(projects.items(), key=lambda x: x[1]["avg_score"], reverse=True)
-
-        return {
-            "distribution_stats": distribution_stats,
-            "projects": dict(ranked_projects),
-            "rankings": [(project_id, data["project_name"], data["avg_score"]) for project_id, data in ranked_projects],
-        }
+    def generate_comparative_reasoning(
+        self, target_project_id: str, round_num: int = 1, distribution: ScoreDistribution | None = None
+    ) -> str:
+        """Generate comparative reasoning for a project against others in the same round.
 
-    def generate_comparative_reasoning(self, target_project_id: str, round_num: int = 1) -> str:
-        """Generate comparative reasoning for a project against others in the same round."""
-        distribution_data = self.analyze_score_distribution(round_num)
+        Pass a prebuilt ``distribution`` when reasoning about many projects so the
+        scores are only loaded once.
+        """
+        if distribution is None:
+            distribution = self.build_score_distribution(round_num)
 
-        if "error" in distribution_data:
+        if not distribution.projects:
             return "No comparative data available for reasoning."
 
-        projects = distribution_data["projects"]
-        stats = distribution_data["distribution_stats"]
-        rankings = distribution_data["rankings"]
+        stats = distribution.stats
 
-        if target_project_id not in projects:
+        if target_project_id not in distribution:
             return "Target project not found in score distribution."
 
-        target_project = projects[target_project_id]
+        target_project = distribution.projects[target_project_id]
         target_score = target_project["avg_score"]
 
-        # Find project's rank
-        target_rank = next((i + 1 for i, (pid, _, _) in enumerate(rankings) if pid == target_project_id), None)
-
-        # Identify comparative context
-        better_projects = [p for p in projects.values() if p["avg_score"] > target_score]
-        worse_projects = [p for p in projects.values() if p["avg_score"] < target_score]
+        # Find project's rank and comparative context
+        target_rank = distribution.rank(target_project_id)
+        better_count = distribution.count_above(target_score)
+        worse_count = distribution.count_below(target_score)
+        better_mean = distribution.mean_above(target_score)
 
         # Find most similar projects (within 2 points)
-        similar_projects = [
-            (pid, data)
-            for pid, data in projects.items()
-            if pid != target_project_id and abs(data["avg_score"] - target_score) <= 2.0
-        ]
+        similar_projects = distribution.similar(target_project_id, window=2.0)
 
-        # Extract common criticisms from better projects
-        better_criticisms = []
-        for project_data in better_projects[:3]:  # Top 3 better projects
-            for judge_data in project_data["judges"].values():
-                reasons = judge_data.get("notes", {}).get("reasons", {})
-                for criterion, reason in reasons.items():
-                    if "but" in reason.lower() or "however" in reason.lower() or "concern" in reason.lower():
-                        better_criticisms.append(f"{criterion}: {reason}")
-
-        # Extract common strengths from worse projects
-        worse_strengths = []
-        for project_data in worse_projects[-3:]:  # Bottom 3 worse projects
-            for judge_data in project_data["judges"].values():
-                reasons = judge_data.get("notes", {}).get("reasons", {})
-                for criterion, reason in reasons.items():
-                    if any(word in reason.lower() for word in ["good", "strong", "impressive", "solid"]):
-                        worse_strengths.append(f"{criterion}: {reason}")
+        # Common criticisms from the top 3 better projects, strengths from the bottom 3 worse ones
+        better_criticisms = distribution.criticisms_from_top(target_score, limit=3)
+        worse_strengths = distribution.strengths_from_bottom(target_score, limit=3)
 
         # Generate comparative summary
-        percentile = (len(worse_projects) / len(projects)) * 100 if projects else 0
+        percentile = distribution.percentile(target_project_id)
 
         reasoning = f"""
 COMPARATIVE ANALYSIS FOR {target_project["project_name"]}:
@@ -772,8 +1137,8 @@ RANKING CONTEXT:
 - Judge consensus: {"High" if target_project["score_variance"] < 2 else "Low"} (variance: {target_project["score_variance"]:.1f})
 
 COMPETITIVE LANDSCAPE:
-- {len(better_projects)} projects scored higher{f" (avg gap: {(sum(p['avg_score'] for p in better_projects) / len(better_projects) - target_score):.1f} points)" if better_projects else ""}
-- {len(worse_projects)} projects scored lower
+- {better_count} projects scored higher{f" (avg gap: {better_mean - target_score:.1f} points)" if better_count else ""}
+- {worse_count} projects scored lower
 - {len(similar_projects)} projects in similar score range (±2 points)
 
 RELATIVE POSITIONING:
@@ -784,151 +1149,218 @@ RELATIVE POSITIONING:
 
         return reasoning.strip()
 
-    def run_round2_synthesis(self, project_id: str | None = None):
-        """Enhanced Round 2 synthesis with comparative reasoning and distribution analysis."""
-        conn = sqlite3.connect(self.db_path)
+    def pending_for_synthesis(self) -> list[Any]:
+        """Submission ids waiting for Round 2 synthesis."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            rows = conn.execute(
+                f"SELECT submission_id FROM {self.table} WHERE status = 'community-voting' ORDER BY created_at"
+            ).fetchall()
+        finally:
+            conn.close()
+        return [row[0] for row in rows]
+
+    def synthesize_one(self, submission_id) -> None:
+        """Round 2 synthesis for a single submission, raising if it failed (queue job handler)."""
+        if self.run_round2_synthesis(submission_id)["failed"]:
+            raise RuntimeError(f"Round 2 synthesis failed for {submission_id}")
+
+    def run_round2_synthesis(self, project_id: str | None = None, concurrency: int = 1) -> dict[str, int]:
+        """Enhanced Round 2 synthesis with comparative reasoning and distribution analysis.
+
+        All inputs (project metadata, Round 1 scores, community context and the
+        score distribution) are loaded up front in one short read. Projects then
+        run ``concurrency`` at a time, with judge verdicts fanned out when
+        ``parallel_judges`` is set, and each project's verdicts are committed
+        together as soon as they are ready, so an interrupted run resumes with
+        the projects still in ``community-voting``.
+        """
+        conn = sqlite3.connect(self.db_path, timeout=30)
         cursor = conn.cursor()
 
-        # Get projects ready for Round 2
-        if project_id:
+        try:
+            # Get projects ready for Round 2, with the metadata every judge prompt needs
+            if project_id:
+                cursor.execute(
+                    f"""SELECT submission_id, project_name, description, category FROM {self.table}
+                    WHERE submission_id = ? AND status = 'community-voting'""",
+                    (project_id,),
+                )
+            else:
+                cursor.execute(
+                    f"""SELECT submission_id, project_name, description, category FROM {self.table}
+                    WHERE status = 'community-voting'"""
+                )
+
+            project_meta = {
+                row[0]: {"project_name": row[1], "description": row[2], "category": row[3]} for row in cursor.fetchall()
+            }
+            project_ids = list(project_meta)
+
+            if not project_ids:
+                print("No projects ready for Round 2 synthesis")
+                return {"synthesized": 0, "failed": 0}
+
+            # Round 1 scores for every project in one query
+            placeholders = ",".join("?" * len(project_ids))
             cursor.execute(
-                f"SELECT submission_id FROM {self.table} WHERE submission_id = ? AND status = 'community-voting'",
-                (project_id,),
+                f"""SELECT submission_id, judge_name, weighted_total, notes FROM hackathon_scores
+                WHERE round = 1 AND submission_id IN ({placeholders})""",
+                project_ids,
             )
-        else:
-            cursor.execute(f"SELECT submission_id FROM {self.table} WHERE status = 'community-voting'")
-
-        project_ids = [row[0] for row in cursor.fetchall()]
+            r1_scores = {pid: {} for pid in project_ids}
+            for submission_id, judge_name, weighted_total, notes in cursor.fetchall():
+                r1_scores[submission_id][judge_name] = {"score": weighted_total, "notes": json.loads(notes or "{}")}
 
-        if not project_ids:
-            print("No projects ready for Round 2 synthesis")
+            # Get community feedback data (as context, not bonus)
+            community_data = self._get_community_feedback_context(cursor, project_ids)
+        finally:
             conn.close()
-            return
 
         # Get comparative analysis for all projects
         print(f"Analyzing score distribution across {len(project_ids)} projects...")
-        distribution_analysis = self.analyze_score_distribution(round_num=1)
+        distribution = self.build_score_distribution(round_num=1)
 
-        # Get community feedback data (as context, not bonus)
-        community_data = self._get_community_feedback_context(cursor, project_ids)
+        from hackathon.backend.progress import ThroughputProgress
 
-        for project_id in project_ids:
-            print(f"\nProcessing Round 2 for {project_id}...")
+        progress = ThroughputProgress(len(project_ids), label="synthesize")
 
-            # Get Round 1 scores
-            cursor.execute(
-                "SELECT judge_name, weighted_total, notes FROM hackathon_scores WHERE submission_id = ? AND round = 1",
-                (project_id,),
-            )
-            r1_scores = {row[0]: {"score": row[1], "notes": json.loads(row[2] or "{}")} for row in cursor.fetchall()}
+        def synthesize_one(pid) -> bool:
+            progress.start()
+            try:
+                self._synthesize_project(pid, project_meta[pid], r1_scores[pid], community_data[pid], distribution)
+                ok = True
+            except Exception as e:
+                logger.error(f"Round 2 synthesis failed for {pid}: {e}")
+                ok = False
+            progress.finish(ok)
+            return ok
 
-            # Generate comparative reasoning
-            comparative_reasoning = self.generate_comparative_reasoning(project_id, round_num=1)
+        if concurrency <= 1:
+            outcomes = [synthesize_one(pid) for pid in project_ids]
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix="synthesize") as pool:
+                outcomes = list(pool.map(synthesize_one, project_ids))
+        progress.close()
 
-            # Generate final verdicts with comparative context
-            for judge in ["aimarc", "aishaw", "peepo", "spartan"]:
-                if judge not in r1_scores:
-                    continue
+        # Simple audit logging
+        from hackathon.backend.simple_audit import log_system_action
 
-                # Get structured Round 2 response
-                round2_response = self._generate_final_verdict_with_comparison(
-                    project_id,
-                    judge,
-                    r1_scores[judge],
-                    community_data[project_id],
-                    comparative_reasoning,
-                    distribution_analysis,
-                )
+        log_system_action("round2_synthesis_completed", project_id or f"bulk_{len(project_ids)}_projects")
 
-                # Parse structured response
-                parsed_response = self._parse_round2_response(round2_response)
+        synthesized = sum(outcomes)
+        return {"synthesized": synthesized, "failed": len(outcomes) - synthesized}
+
+    def _synthesize_project(self, project_id, project_meta, r1_scores, community_context, distribution):
+        """Collect every judge's Round 2 verdict for one project and commit them together."""
+        # Generate comparative reasoning
+        comparative_reasoning = self.generate_comparative_reasoning(project_id, round_num=1, distribution=distribution)
+
+        judges = [judge for judge in JUDGES if judge in r1_scores]
+
+        def verdict(judge):
+            # Get structured Round 2 response
+            return self._generate_final_verdict_with_comparison(
+                project_id,
+                judge,
+                r1_scores[judge],
+                community_context,
+                comparative_reasoning,
+                project_meta=project_meta,
+            )
 
-                # Calculate Round 2 score based on structured response
-                final_score = self._calculate_judge_round2_score(
-                    judge, r1_scores[judge]["score"], round2_response, community_data[project_id]
-                )
+        if self.parallel_judges and len(judges) > 1:
+            with ThreadPoolExecutor(max_workers=len(judges), thread_name_prefix="verdict") as pool:
+                responses = list(pool.map(verdict, judges))
+        else:
+            responses = [verdict(judge) for judge in judges]
 
-                # Store Round 2 data with flattened, logical structure (UPSERT)
-                cursor.execute(
-                    """
-                    INSERT OR REPLACE INTO hackathon_scores
-                    (submission_id, judge_name, round, weighted_total, notes, created_at)
-                    VALUES (?, ?, 2, ?, ?, ?)
-                """,
-                    (
-                        project_id,
-                        judge,
-                        final_score,
-                        json.dumps(
-                            {
-                                # Round 2 core data
-                                "round2_final_verdict": parsed_response.get("final_verdict", ""),
-                                "round2_reasoning": parsed_response.get("reasoning", ""),
-                                "score_revision": parsed_response.get("score_revision", {}),
-                                "community_influence": parsed_response.get("community_influence", "unknown"),
-                                "confidence": parsed_response.get("confidence", "medium"),
-                                # Context data
-                                "round1_score": r1_scores[judge]["score"],
-                                "comparative_reasoning": comparative_reasoning,
-                                "community_context": community_data[project_id],
-                                # Metadata
-                                "judge_persona": judge,
-                                "submission_id": project_id,
-                                "synthesis_timestamp": datetime.now().isoformat(),
-                            }
-                        ),
-                        datetime.now().isoformat(),
-                    ),
-                )
+        rows = []
+        for judge, round2_response in zip(judges, responses):
+            # Parse structured response
+            parsed_response = self._parse_round2_response(round2_response)
 
-            # Update submission status
-            cursor.execute(
-                f"UPDATE {self.table} SET status = 'completed' WHERE submission_id = ?",
-                (project_id,),
+            # Calculate Round 2 score based on structured response
+            final_score = self._calculate_judge_round2_score(
+                judge, r1_scores[judge]["score"], round2_response, community_context
             )
-            print(f"✓ Round 2 completed for {project_id}")
 
-        conn.commit()
+            # Round 2 data with flattened, logical structure
+            notes = {
+                # Round 2 core data
+                "round2_final_verdict": parsed_response.get("final_verdict", ""),
+                "round2_reasoning": parsed_response.get("reasoning", ""),
+                "score_revision": parsed_response.get("score_revision", {}),
+                "community_influence": parsed_response.get("community_influence", "unknown"),
+                "confidence": parsed_response.get("confidence", "medium"),
+                # Context data
+                "round1_score": r1_scores[judge]["score"],
+                "comparative_reasoning": comparative_reasoning,
+                "community_context": community_context,
+                # Metadata
+                "judge_persona": judge,
+                "submission_id": project_id,
+                "synthesis_timestamp": datetime.now().isoformat(),
+            }
+            rows.append((project_id, judge, final_score, json.dumps(notes), datetime.now().isoformat()))
 
-        # Simple audit logging
-        from hackathon.backend.simple_audit import log_system_action
+        # One short transaction per project: all verdicts plus the status flip (UPSERT)
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            conn.executemany(
+                """
+                INSERT OR REPLACE INTO hackathon_scores
+                (submission_id, judge_name, round, weighted_total, notes, created_at)
+                VALUES (?, ?, 2, ?, ?, ?)
+            """,
+                rows,
+            )
+            conn.execute(
+                f"UPDATE {self.table} SET status = 'completed' WHERE submission_id = ?",
+                (project_id,),
+            )
+            conn.commit()
+        finally:
+            conn.close()
 
-        log_system_action("round2_synthesis_completed", project_id or f"bulk_{len(project_ids)}_projects")
+        for _, judge, _, notes, _ in rows:
+            self.judge_history.record(judge, notes)
 
-        conn.close()
+        logger.info(f"Round 2 completed for {project_id}")
 
     def _get_community_feedback_context(self, cursor, project_ids):
         """Get community feedback data from unified likes_dislikes table as context for Round 2 synthesis."""
         import statistics
 
         community_data = {}
-        all_reaction_counts = []
 
-        # First pass: collect all like/dislike data and counts for statistical analysis
-        for project_id in project_ids:
-            # Get total votes for this project from likes_dislikes table
+        # One grouped aggregation for every project (likes_dislikes.submission_id is TEXT)
+        aggregates = {}
+        if project_ids:
+            placeholders = ",".join("?" * len(project_ids))
             cursor.execute(
-                "SELECT COUNT(*) FROM likes_dislikes WHERE submission_id = ?",
-                (project_id,),
+                f"""
+                SELECT submission_id,
+                       COUNT(*),
+                       COUNT(DISTINCT discord_id),
+                       SUM(action = 'like'),
+                       SUM(action = 'dislike')
+                FROM likes_dislikes
+                WHERE submission_id IN ({placeholders})
+                GROUP BY submission_id
+                """,
+                [str(project_id) for project_id in project_ids],
             )
-            total_reactions = cursor.fetchone()[0]
-            all_reaction_counts.append(total_reactions)
+            aggregates = {str(row[0]): row[1:] for row in cursor.fetchall()}
 
-            # Get like/dislike breakdown from likes_dislikes table
-            cursor.execute(
-                "SELECT action, COUNT(*) FROM likes_dislikes WHERE submission_id = ? GROUP BY action",
-                (project_id,),
-            )
-            vote_breakdown = {row[0]: row[1] for row in cursor.fetchall()}
+        all_reaction_counts = []
+        for project_id in project_ids:
+            total_reactions, unique_voters, likes, dislikes = aggregates.get(str(project_id), (0, 0, 0, 0))
+            all_reaction_counts.append(total_reactions)
 
-            # Get unique voters from likes_dislikes table
-            cursor.execute(
-                "SELECT COUNT(DISTINCT discord_id) FROM likes_dislikes WHERE submission_id = ?",
-                (project_id,),
-            )
-            unique_voters = cursor.fetchone()[0]
+            # Only actions that actually occur, matching the old GROUP BY action shape
+            vote_breakdown = {action: count for action, count in (("like", likes), ("dislike", dislikes)) if count}
 
-            # Store basic data for now
             community_data[project_id] = {
                 "total_reactions": total_reactions,
                 "unique_voters": unique_voters,
@@ -1067,17 +1499,26 @@ RELATIVE POSITIONING:
         return community_data
 
     def _generate_final_verdict_with_comparison(
-        self, project_id, judge, r1_data, community_context, comparative_reasoning, distribution_analysis
+        self, project_id, judge, r1_data, community_context, comparative_reasoning, project_meta=None
     ):
-        """Generate final verdict with comparative context and community feedback as reasoning signal."""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        cursor.execute(
-            f"SELECT project_name, description, category FROM {self.table} WHERE submission_id = ?",
-            (project_id,),
-        )
-        project_name, description, category = cursor.fetchone()
-        conn.close()
+        """Generate final verdict with comparative context and community feedback as reasoning signal.
+
+        ``project_meta`` (project_name, description, category) is read from the
+        DB when not supplied by the caller.
+        """
+        if project_meta is None:
+            conn = sqlite3.connect(self.db_path)
+            cursor = conn.cursor()
+            cursor.execute(
+                f"SELECT project_name, description, category FROM {self.table} WHERE submission_id = ?",
+                (project_id,),
+            )
+            project_name, description, category = cursor.fetchone()
+            conn.close()
+        else:
+            project_name = project_meta["project_name"]
+            description = project_meta["description"]
+            category = project_meta["category"]
 
         # Get judge persona for context
         persona = get_judge_persona(judge)
@@ -1096,16 +1537,11 @@ RELATIVE POSITIONING:
         else:
             feedback_summary = "No community votes yet"
 
-        # Find this project's ranking context
-        projects = distribution_analysis.get("projects", {})
-        if project_id in projects:
-            ranked_projects = sorted(projects.items(), key=lambda x: x[1]["avg_score"], reverse=True)
-            next((i + 1 for i, (pid, _) in enumerate(ranked_projects) if pid == project_id), None)
-
-        # Round 2 template loaded from JUDGE_CONFIG env var
-        round2_tpl = get_round2_template()
-        prompt = round2_tpl.format(
-            judge=judge.upper(),
+        # Round 2 template loaded from JUDGE_CONFIG env var; everything before the first
+        # project-specific placeholder is identical across projects and becomes the cached prefix
+        prefix, suffix = split_template_prefix(
+            get_round2_template(),
+            static_fields={"judge": judge.upper()},
             overall_comment=r1_data.get("notes", {}).get("overall_comment", "No specific notes available"),
             r1_score=f"{r1_data['score']:.1f}",
             feedback_summary=feedback_summary,
@@ -1120,22 +1556,19 @@ RELATIVE POSITIONING:
 
         try:
             logger.info(f"Getting structured final verdict from {judge} for {project_name}")
-            response = self.session.post(
-                BASE_URL,
-                json={
+            result = self.llm.chat(
+                {
                     "model": AI_MODEL_NAME,
                     "messages": [
                         {"role": "system", "content": persona},
-                        {"role": "user", "content": prompt},
+                        {"role": "user", "content": cacheable_content(prefix, suffix)},
                     ],
                     "max_tokens": 600,
                     "temperature": 0.3,
                 },
-                timeout=self.session.timeout,
+                tags={"stage": "synthesize", "judge": judge},
             )
-
-            if response.ok:
-                return response.json()["choices"][0]["message"]["content"].strip()
+            return result["choices"][0]["message"]["content"].strip()
         except Exception as e:
             logger.warning(f"Failed to get structured final verdict from {judge}: {e}")
 
@@ -1196,16 +1629,75 @@ def main():
         action="store_true",
         help="Force re-score all submissions, even if they already have scores",
     )
+    parser.add_argument(
+        "--parallel-judges",
+        action="store_true",
+        help="Request all four judge scores/verdicts concurrently (paced by LLM_RATE_LIMIT_RPS)",
+    )
+    parser.add_argument(
+        "--concurrency",
+        type=int,
+        default=1,
+        help="With --score/--synthesize/--research --all, number of submissions processed at once (default: 1)",
+    )
+    parser.add_argument(
+        "--panel",
+        action="store_true",
+        help="Score all judges in a single LLM request per submission (one block per judge)",
+    )
+    parser.add_argument(
+        "--no-llm-cache",
+        action="store_true",
+        help="Bypass the persistent LLM response cache (always call the model)",
+    )
+    parser.add_argument(
+        "--structured-output",
+        action="store_true",
+        help="Request Round 1 judge scores as schema-validated JSON (response_format)",
+    )
+    parser.add_argument(
+        "--queue",
+        action="store_true",
+        help="With --all, run through the durable pipeline_jobs queue (resumable; several processes can share it)",
+    )
+    parser.add_argument(
+        "--hedge",
+        action="store_true",
+        help="Re-send LLM requests still pending at the run's p90 latency (see LLM_HEDGE_* settings)",
+    )
+    parser.add_argument(
+        "--watch",
+        action="store_true",
+        help="With --score --all, keep running and score submissions as they become researched",
+    )
+    parser.add_argument(
+        "--poll-interval",
+        type=float,
+        default=WATCH_POLL_SECONDS,
+        help=f"With --watch, seconds between database change checks (default: {WATCH_POLL_SECONDS:g})",
+    )
 
     args = parser.parse_args()
 
+    if args.watch and (not (args.score and args.all) or args.force or args.queue):
+        parser.error("--watch works with --score --all (without --force or --queue)")
+
     if not any([args.score, args.leaderboard, args.synthesize, args.research]):
         parser.print_help()
         return
 
     # Initialize manager
     try:
-        manager = HackathonManager(db_path=args.db_file, version=args.version, force=args.force)
+        manager = HackathonManager(
+            db_path=args.db_file,
+            version=args.version,
+            force=args.force,
+            parallel_judges=args.parallel_judges,
+            llm_cache=not args.no_llm_cache,
+            panel=args.panel,
+            hedge=args.hedge,
+            structured_output=args.structured_output,
+        )
     except ValueError as e:
         logger.error(f"Initialization failed: {e}")
         logger.error("Please ensure OPENROUTER_API_KEY is set in your .env file")
@@ -1226,8 +1718,31 @@ def main():
             except Exception as e:
                 logger.error(f"Scoring failed: {e}")
 
+        elif args.all and args.watch:
+            stop = threading.Event()
+
+            def request_stop(signum, _frame):
+                logger.info(f"Received {signal.Signals(signum).name}; shutting down after in-flight scores")
+                stop.set()
+                # A second signal falls through to the default handler and exits immediately
+                signal.signal(signum, signal.SIG_DFL)
+
+            for signum in (signal.SIGINT, signal.SIGTERM):
+                signal.signal(signum, request_stop)
+            results = manager.watch_researched(
+                score_round, concurrency=args.concurrency, poll_interval=args.poll_interval, stop=stop
+            )
+            logger.info(f"Watch stopped: {results['scored']} scored, {results['failed']} failed")
+        elif args.all and args.queue:
+            drain_stage(
+                get_job_queue(manager.db_path),
+                "score",
+                [row[0] for row in manager.pending_for_scoring()],
+                lambda sid: manager.score_submission(sid, score_round),
+                concurrency=args.concurrency,
+            )
         elif args.all:
-            results = manager.score_all_researched(score_round)
+            results = manager.score_all_researched(score_round, concurrency=args.concurrency)
             logger.info(f"Scoring complete: {results['scored']} succeeded, {results['failed']} failed")
 
             if args.output:
@@ -1237,6 +1752,9 @@ def main():
         else:
             logger.error("Please specify --submission-id or --all")
 
+        for line in manager.llm.run_report():
+            logger.info(line)
+
     elif args.leaderboard:
         sort_round = getattr(args, "round", None)
         leaderboard = manager.get_leaderboard(sort_by_round=sort_round)
@@ -1265,15 +1783,33 @@ def main():
     elif args.synthesize:
         if args.submission_id:
             manager.run_round2_synthesis(args.submission_id)
+        elif args.all and args.queue:
+            drain_stage(
+                get_job_queue(manager.db_path),
+                "synthesize",
+                manager.pending_for_synthesis(),
+                manager.synthesize_one,
+                concurrency=args.concurrency,
+            )
         elif args.all:
-            manager.run_round2_synthesis()
+            results = manager.run_round2_synthesis(concurrency=args.concurrency)
+            logger.info(f"Synthesis complete: {results['synthesized']} succeeded, {results['failed']} failed")
         else:
             logger.error("Please specify --submission-id or --all for synthesis")
 
+        for line in manager.llm.run_report():
+            logger.info(line)
+
     elif args.research:
         from hackathon.backend.research import HackathonResearcher
 
-        researcher = HackathonResearcher(db_path=args.db_file, version=args.version, force=args.force)
+        researcher = HackathonResearcher(
+            db_path=args.db_file,
+            version=args.version,
+            force=args.force,
+            llm_cache=not args.no_llm_cache,
+            hedge=args.hedge,
+        )
         if args.submission_id:
             results = researcher.research_submission(args.submission_id)
             if args.output:
@@ -1282,8 +1818,15 @@ def main():
                 logger.info(f"Results saved to {args.output}")
             else:
                 print(json.dumps(results, indent=2))
+        elif args.all and args.queue:
+            drain_stage(
+                get_job_queue(researcher.db_path),
+                "research",
+                researcher.pending_research_ids(),
+                researcher.research_submission,
+            )
         elif args.all:
-            results = researcher.research_all_pending()
+            results = researcher.research_all_pending(concurrency=args.concurrency)
             logger.info(f"Researched {len(results)} submissions")
             if args.output:
                 with open(args.output, "w") as f:
@@ -1291,6 +1834,9 @@ def main():
         else:
             logger.error("Please specify --submission-id or --all")
 
+        for line in researcher.llm.run_report():
+            logger.info(line)
+
 
 if __name__ == "__main__":
     main()
@@ -0,0 +1,220 @@
+"""Persistent conditional-request (ETag / Last-Modified) cache for GET requests.
+
+``ConditionalCacheAdapter`` is a ``requests`` transport adapter. A GET whose
+earlier response carried an ``ETag`` or ``Last-Modified`` validator is re-sent
+with ``If-None-Match`` / ``If-Modified-Since``. A ``304 Not Modified`` answer
+is then served from the stored body. GitHub does not count 304s against the
+REST rate limit, so a repeat research pass over an unchanged cohort costs
+round-trips but almost no quota. Entries live in a small SQLite file and are
+evicted least-recently-used beyond ``max_entries``.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from typing import Any
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+from requests.utils import get_encoding_from_headers
+
+from hackathon.backend.config import GITHUB_HTTP_CACHE_ENABLED, GITHUB_HTTP_CACHE_MAX_ENTRIES, GITHUB_HTTP_CACHE_PATH
+
+logger = logging.getLogger(__name__)
+
+# Responses vary on these request headers (GitHub sends Vary: Accept, Authorization)
+VARY_HEADERS = ("Accept", "Authorization")
+# Response headers kept with the body; rate-limit headers always come from the live answer
+STORED_HEADERS = ("Content-Type", "ETag", "Last-Modified", "Link")
+
+
+class HTTPCache:
+    """SQLite store of validated GET responses, keyed by URL and varying request headers."""
+
+    def __init__(self, path: str, max_entries: int = 0):
+        self.path = path
+        self.max_entries = max_entries
+        self.revalidated = 0
+        self.stored = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS http_cache (
+                    key TEXT PRIMARY KEY,
+                    url TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    headers TEXT NOT NULL,
+                    body BLOB NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_http_cache_last_accessed ON http_cache(last_accessed)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    @staticmethod
+    def make_key(request: requests.PreparedRequest) -> str:
+        material = [request.method or "GET", request.url or ""]
+        material += [request.headers.get(name, "") for name in VARY_HEADERS]
+        return hashlib.sha256("\n".join(material).encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                "SELECT etag, last_modified, headers, body FROM http_cache WHERE key = ?", (key,)
+            ).fetchone()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache read failed: {e}")
+            return None
+        finally:
+            conn.close()
+        if row is None:
+            return None
+        etag, last_modified, headers, body = row
+        return {"etag": etag, "last_modified": last_modified, "headers": json.loads(headers), "body": body}
+
+    def set(self, key: str, url: str, response: requests.Response) -> None:
+        now = time.time()
+        headers = {name: response.headers[name] for name in STORED_HEADERS if name in response.headers}
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO http_cache
+                (key, url, etag, last_modified, headers, body, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    key,
+                    url,
+                    response.headers.get("ETag"),
+                    response.headers.get("Last-Modified"),
+                    json.dumps(headers),
+                    response.content,
+                    now,
+                    now,
+                ),
+            )
+            if self.max_entries:
+                conn.execute(
+                    """
+                    DELETE FROM http_cache WHERE key IN (
+                        SELECT key FROM http_cache ORDER BY last_accessed DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache write failed: {e}")
+        finally:
+            conn.close()
+
+    def touch(self, key: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("UPDATE http_cache SET last_accessed = ? WHERE key = ?", (time.time(), key))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"HTTP cache update failed: {e}")
+        finally:
+            conn.close()
+
+    def record(self, outcome: str) -> None:
+        with self._lock:
+            setattr(self, outcome, getattr(self, outcome) + 1)
+
+    def summary(self) -> str:
+        return (
+            f"GitHub HTTP cache: {self.revalidated} request(s) answered 304 from cache, "
+            f"{self.stored} stored, {self.misses} uncached"
+        )
+
+
+class ConditionalCacheAdapter(HTTPAdapter):
+    """``HTTPAdapter`` that revalidates cached GET responses with ETag / Last-Modified.
+
+    Takes the usual ``HTTPAdapter`` arguments (e.g. ``max_retries``). A
+    response served from cache has ``from_cache = True``.
+    """
+
+    def __init__(self, cache: HTTPCache, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.cache = cache
+
+    def send(self, request: requests.PreparedRequest, **kwargs: Any) -> requests.Response:
+        if request.method != "GET" or kwargs.get("stream"):
+            return super().send(request, **kwargs)
+
+        key = self.cache.make_key(request)
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry["etag"]:
+                request.headers["If-None-Match"] = entry["etag"]
+            if entry["last_modified"]:
+                request.headers["If-Modified-Since"] = entry["last_modified"]
+
+        response = super().send(request, **kwargs)
+        if response.status_code == 304 and entry is not None:
+            self.cache.record("revalidated")
+            self.cache.touch(key)
+            return self._from_cache(response, entry)
+        if response.status_code == 200 and ("ETag" in response.headers or "Last-Modified" in response.headers):
+            self.cache.set(key, request.url or "", response)
+            self.cache.record("stored")
+        else:
+            self.cache.record("misses")
+        response.from_cache = False
+        return response
+
+    @staticmethod
+    def _from_cache(not_modified: requests.Response, entry: dict[str, Any]) -> requests.Response:
+        """A 200 response with the stored body and the live answer's other headers (e.g. rate limits)."""
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = "OK"
+        response.headers = CaseInsensitiveDict(not_modified.headers)
+        response.headers.update(entry["headers"])
+        response.headers["Content-Length"] = str(len(entry["body"]))
+        response._content = entry["body"]
+        response.encoding = get_encoding_from_headers(response.headers)
+        response.url = not_modified.url
+        response.request = not_modified.request
+        response.connection = not_modified.connection
+        response.elapsed = not_modified.elapsed
+        response.from_cache = True
+        not_modified.close()
+        return response
+
+
+_cache: HTTPCache | None = None
+_cache_lock = threading.Lock()
+
+
+def get_github_http_cache() -> HTTPCache | None:
+    """The process-wide GitHub API cache, or None when ``GITHUB_HTTP_CACHE_ENABLED`` is off."""
+    global _cache
+    if not GITHUB_HTTP_CACHE_ENABLED:
+        return None
+    with _cache_lock:
+        if _cache is None:
+            _cache = HTTPCache(GITHUB_HTTP_CACHE_PATH, GITHUB_HTTP_CACHE_MAX_ENTRIES)
+        return _cache
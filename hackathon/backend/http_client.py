@@ -10,8 +10,13 @@ def create_session(
     backoff_factor: float = 0.5,
     timeout: tuple[float, float] = (10, 30),
     status_forcelist: tuple[int, ...] = (429, 500, 502, 503, 504),
+    cache=None,
 ) -> requests.Session:
-    """Create a requests session with retry and timeout defaults."""
+    """Create a requests session with retry and timeout defaults.
+
+    With ``cache`` (an ``http_cache.HTTPCache``), GET responses are revalidated
+    with ETag / Last-Modified and 304s are served from the cache.
+    """
     session = requests.Session()
     retry = Retry(
         total=retries,
@@ -19,9 +24,28 @@ def create_session(
         status_forcelist=status_forcelist,
         allowed_methods=["GET", "POST"],
     )
-    adapter = HTTPAdapter(max_retries=retry)
+    if cache is not None:
+        from hackathon.backend.http_cache import ConditionalCacheAdapter
+
+        adapter = ConditionalCacheAdapter(cache, max_retries=retry)
+    else:
+        adapter = HTTPAdapter(max_retries=retry)
     session.mount("https://", adapter)
     session.mount("http://", adapter)
     # Store timeout as a session attribute for callers to use
     session.timeout = timeout
     return session
+
+
+def create_pooled_session(pool_size: int = 16, timeout: tuple[float, float] = (10, 120)) -> requests.Session:
+    """Create a keep-alive session sized for concurrent callers, without transport retries.
+
+    urllib3 retries would re-send a POST after a read timeout, so callers that
+    must not duplicate non-idempotent requests handle retries themselves.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.timeout = timeout
+    return session
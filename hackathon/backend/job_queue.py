@@ -0,0 +1,356 @@
+"""Durable, lease-based job queue for the research/score/synthesize stages.
+
+Every unit of pipeline work is a row in ``pipeline_jobs`` keyed by
+``(stage, submission_id)``. Workers claim a job with a single atomic
+``UPDATE ... RETURNING``, which takes SQLite's write lock, so any number of
+processes (on one host, or several hosts sharing the DB file on a local
+filesystem) never run the same job twice. A claim is a lease: the worker
+renews it while the job runs. If the worker dies, the lease expires and the
+job becomes claimable again, with its attempt count and last error intact.
+"""
+
+import logging
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from hackathon.backend.config import JOB_LEASE_SECONDS, JOB_MAX_ATTEMPTS, JOB_RETRY_DELAY_SECONDS
+
+logger = logging.getLogger(__name__)
+
+JOB_STAGES = ("research", "score", "synthesize")
+JOB_STATUSES = ("pending", "running", "done", "failed")
+
+
+def create_jobs_table(cursor: sqlite3.Cursor) -> None:
+    """Create ``pipeline_jobs`` and its claim index (idempotent)."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS pipeline_jobs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            stage TEXT NOT NULL,
+            submission_id TEXT NOT NULL,
+            status TEXT NOT NULL DEFAULT 'pending'
+                CHECK (status IN ('pending', 'running', 'done', 'failed')),
+            attempts INTEGER NOT NULL DEFAULT 0,
+            max_attempts INTEGER NOT NULL DEFAULT 3,
+            lease_owner TEXT,
+            lease_expires_at REAL,
+            available_at REAL NOT NULL,
+            last_error TEXT,
+            created_at REAL NOT NULL,
+            updated_at REAL NOT NULL,
+            UNIQUE(stage, submission_id)
+        )
+    """
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_pipeline_jobs_claim ON pipeline_jobs(stage, status, available_at)")
+
+
+def get_job_queue(db_path: str) -> "JobQueue":
+    """Queue configured from ``JOB_*`` settings."""
+    return JobQueue(
+        db_path, lease_seconds=JOB_LEASE_SECONDS, max_attempts=JOB_MAX_ATTEMPTS, retry_delay=JOB_RETRY_DELAY_SECONDS
+    )
+
+
+def default_worker_id() -> str:
+    return f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:6]}"
+
+
+class JobQueue:
+    """``pipeline_jobs`` operations. Each call uses its own short connection/transaction."""
+
+    def __init__(self, db_path: str, lease_seconds: float = 300, max_attempts: int = 3, retry_delay: float = 30):
+        self.db_path = db_path
+        self.lease_seconds = lease_seconds
+        self.max_attempts = max_attempts
+        self.retry_delay = retry_delay
+        conn = self._connect()
+        try:
+            create_jobs_table(conn.cursor())
+            conn.commit()
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+    def enqueue(self, stage: str, submission_ids: list[Any]) -> int:
+        """Queue ``stage`` for each submission; returns how many became pending.
+
+        Callers pass the submissions that currently need the stage (by their
+        ``status``), so a finished or exhausted job for one of them is reset
+        to pending with a fresh attempt budget. Pending and running jobs are
+        left alone, so concurrent enqueuers never disturb a live lease.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                before = conn.total_changes
+                conn.executemany(
+                    """
+                    INSERT INTO pipeline_jobs (stage, submission_id, max_attempts, available_at, created_at, updated_at)
+                    VALUES (?, ?, ?, ?, ?, ?)
+                    ON CONFLICT(stage, submission_id) DO UPDATE SET
+                        status = 'pending', attempts = 0, max_attempts = excluded.max_attempts,
+                        available_at = excluded.available_at, last_error = NULL,
+                        lease_owner = NULL, lease_expires_at = NULL, updated_at = excluded.updated_at
+                    WHERE pipeline_jobs.status IN ('done', 'failed')
+                    """,
+                    [(stage, str(sid), self.max_attempts, now, now, now) for sid in submission_ids],
+                )
+                return conn.total_changes - before
+        finally:
+            conn.close()
+
+    def claim(self, stage: str, worker_id: str) -> dict[str, Any] | None:
+        """Atomically lease the next runnable job for ``stage``, or None.
+
+        Runnable means pending and past its retry delay, or running with an
+        expired lease (its worker died). A job whose worker died on its last
+        attempt is marked failed instead of being run again.
+        """
+        now = time.time()
+        conn = self._connect()
+        try:
+            with conn:
+                conn.execute(
+                    """
+                    UPDATE pipeline_jobs
+                    SET status = 'failed', last_error = 'Lease expired on final attempt (worker died?)',
+                        lease_owner = NULL, lease_expires_at = NULL, updated_at = ?
+                    WHERE stage = ? AND status = 'running' AND lease_expires_at < ? AND attempts >= max_attempts
+                    """,
+                    (now, stage, now),
+                )
+                row = conn.execute(
+                    """
+                    UPDATE pipeline_jobs
+                    SET status = 'running', attempts = attempts + 1, lease_owner = ?,
+                        lease_expires_at = ?, updated_at = ?
+                    WHERE id = (
+                        SELECT id FROM pipeline_jobs
+                        WHERE stage = ?
+                          AND ((status = 'pending' AND available_at <= ?)
+                               OR (status = 'running' AND lease_expires_at < ?))
+                        ORDER BY available_at, id
+                        LIMIT 1
+                    )
+                    RETURNING *
+                    """,
+                    (worker_id, now + self.lease_seconds, now, stage, now, now),
+                ).fetchone()
+        finally:
+            conn.close()
+        return dict(row) if row else None
+
+    def next_retry_at(self, stage: str) -> float | None:
+        """When the earliest unfinished ``stage`` job may become claimable, or None if all are finished.
+
+        A pending job is claimable at ``available_at``; a running one when its
+        lease expires, which only happens if its worker died.
+        """
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                """
+                SELECT MIN(CASE WHEN status = 'pending' THEN available_at ELSE lease_expires_at END)
+                FROM pipeline_jobs WHERE stage = ? AND status IN ('pending', 'running')
+                """,
+                (stage,),
+            ).fetchone()
+        finally:
+            conn.close()
+        return row[0]
+
+    def _finish(self, job: dict[str, Any], worker_id: str, sql: str, params: tuple) -> bool:
+        """Apply ``sql`` only while ``worker_id`` still holds the lease."""
+        conn = self._connect()
+        try:
+            with conn:
+                cursor = conn.execute(f"{sql} WHERE id = ? AND lease_owner = ?", (*params, job["id"], worker_id))
+                return cursor.rowcount == 1
+        finally:
+            conn.close()
+
+    def renew(self, job: dict[str, Any], worker_id: str) -> bool:
+        """Extend the lease; False means it expired and another worker took the job."""
+        now = time.time()
+        return self._finish(
+            job,
+            worker_id,
+            "UPDATE pipeline_jobs SET lease_expires_at = ?, updated_at = ?",
+            (now + self.lease_seconds, now),
+        )
+
+    def complete(self, job: dict[str, Any], worker_id: str) -> bool:
+        return self._finish(
+            job,
+            worker_id,
+            """UPDATE pipeline_jobs SET status = 'done', last_error = NULL,
+               lease_owner = NULL, lease_expires_at = NULL, updated_at = ?""",
+            (time.time(),),
+        )
+
+    def fail(self, job: dict[str, Any], worker_id: str, error: str) -> bool:
+        """Record ``error``; retry after a linear backoff until ``max_attempts`` is used up."""
+        now = time.time()
+        exhausted = job["attempts"] >= job["max_attempts"]
+        return self._finish(
+            job,
+            worker_id,
+            """UPDATE pipeline_jobs SET status = ?, last_error = ?, available_at = ?,
+               lease_owner = NULL, lease_expires_at = NULL, updated_at = ?""",
+            ("failed" if exhausted else "pending", error[:2000], now + self.retry_delay * job["attempts"], now),
+        )
+
+    def counts(self, stage: str | None = None) -> dict[str, dict[str, int]]:
+        """``{stage: {status: n}}`` for the status view."""
+        conn = self._connect()
+        try:
+            query = "SELECT stage, status, COUNT(*) FROM pipeline_jobs"
+            params: tuple = ()
+            if stage:
+                query += " WHERE stage = ?"
+                params = (stage,)
+            rows = conn.execute(f"{query} GROUP BY stage, status", params).fetchall()
+        finally:
+            conn.close()
+        counts: dict[str, dict[str, int]] = {}
+        for job_stage, status, n in rows:
+            counts.setdefault(job_stage, dict.fromkeys(JOB_STATUSES, 0))[status] = n
+        return counts
+
+
+class _LeaseKeeper:
+    """Background thread renewing the leases of every job this worker holds."""
+
+    def __init__(self, queue: JobQueue, worker_id: str):
+        self.queue = queue
+        self.worker_id = worker_id
+        self._jobs: dict[int, dict[str, Any]] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="job-lease", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def hold(self, job: dict[str, Any]) -> None:
+        with self._lock:
+            self._jobs[job["id"]] = job
+
+    def release(self, job: dict[str, Any]) -> None:
+        with self._lock:
+            self._jobs.pop(job["id"], None)
+
+    def _run(self) -> None:
+        interval = max(1.0, self.queue.lease_seconds / 3)
+        while not self._stop.wait(interval):
+            with self._lock:
+                jobs = list(self._jobs.values())
+            for job in jobs:
+                try:
+                    if not self.queue.renew(job, self.worker_id):
+                        logger.warning(f"Lost lease on {job['stage']} job for {job['submission_id']}")
+                except sqlite3.Error as e:
+                    logger.warning(f"Could not renew lease for job {job['id']}: {e}")
+
+
+def run_worker(
+    queue: JobQueue,
+    stage: str,
+    handler: Callable[[str], Any],
+    concurrency: int = 1,
+    worker_id: str | None = None,
+    stop: threading.Event | None = None,
+    poll_interval: float = 5.0,
+) -> dict[str, int]:
+    """Claim and run ``stage`` jobs until all are finished (or ``stop`` is set).
+
+    Jobs leased by another worker keep this one waiting: if that worker died,
+    its jobs are reclaimed once their leases expire.
+
+    ``handler(submission_id)`` raising marks the attempt failed; the job is
+    retried later or, once out of attempts, left ``failed`` with its error.
+    Returns ``{"done": n, "failed": n}`` for this worker's attempts; an attempt
+    that finishes after its lease was lost to another worker is not counted.
+    """
+    worker_id = worker_id or default_worker_id()
+    stop = stop or threading.Event()
+    totals = {"done": 0, "failed": 0}
+    totals_lock = threading.Lock()
+
+    def work(keeper: _LeaseKeeper) -> None:
+        while not stop.is_set():
+            job = queue.claim(stage, worker_id)
+            if job is None:
+                # Stay for retries waiting out their backoff and for leases that may expire; leave once all finish
+                retry_at = queue.next_retry_at(stage)
+                if retry_at is None:
+                    return
+                stop.wait(min(max(0.0, retry_at - time.time()), poll_interval))
+                continue
+            keeper.hold(job)
+            sid = job["submission_id"]
+            try:
+                logger.info(f"[{worker_id}] {stage} {sid} (attempt {job['attempts']}/{job['max_attempts']})")
+                handler(sid)
+            except Exception as e:
+                logger.error(f"{stage} job for {sid} failed: {e}")
+                recorded = queue.fail(job, worker_id, f"{type(e).__name__}: {e}")
+                outcome = "failed"
+            else:
+                recorded = queue.complete(job, worker_id)
+                outcome = "done"
+            finally:
+                keeper.release(job)
+            if not recorded:
+                # Another worker reclaimed the job after our lease expired; its result is the one that counts
+                logger.warning(f"[{worker_id}] {stage} {sid}: lease lost, result not recorded")
+                continue
+            with totals_lock:
+                totals[outcome] += 1
+
+    with _LeaseKeeper(queue, worker_id) as keeper:
+        if concurrency <= 1:
+            work(keeper)
+        else:
+            with ThreadPoolExecutor(max_workers=concurrency, thread_name_prefix=f"{stage}-worker") as pool:
+                for future in [pool.submit(work, keeper) for _ in range(concurrency)]:
+                    future.result()
+    return totals
+
+
+def drain_stage(
+    queue: JobQueue, stage: str, submission_ids: list[Any], handler: Callable[[str], Any], concurrency: int = 1
+) -> dict[str, int]:
+    """Enqueue ``submission_ids`` for ``stage`` and work the queue from this process.
+
+    Other processes running the same command join in as extra workers; a
+    re-run after a crash picks up whatever is still pending or lease-expired.
+    """
+    added = queue.enqueue(stage, submission_ids)
+    logger.info(f"Queued {added} {stage} job(s); working the {stage} queue")
+    results = run_worker(queue, stage, handler, concurrency=concurrency)
+    counts = queue.counts(stage).get(stage, {})
+    logger.info(
+        f"{stage} queue: {results['done']} done, {results['failed']} failed attempt(s) here · "
+        + ", ".join(f"{status} {n}" for status, n in counts.items())
+    )
+    return results
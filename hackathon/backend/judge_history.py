@@ -0,0 +1,66 @@
+"""In-memory per-judge history of recent evaluation notes (for variety prompts)."""
+
+import logging
+import os
+import sqlite3
+import threading
+from collections import defaultdict, deque
+
+logger = logging.getLogger(__name__)
+
+
+class JudgeHistory:
+    """Thread-safe ring buffer of each judge's most recent notes, newest last.
+
+    Seeded once from ``hackathon_scores`` and then kept current by recording
+    every score as it is written, so building a prompt never touches the DB and
+    concurrently scored submissions all see the same, up-to-date context.
+    """
+
+    def __init__(self, limit: int = 3):
+        self.limit = limit
+        self._notes: dict[str, deque[str]] = defaultdict(lambda: deque(maxlen=limit))
+        self._lock = threading.Lock()
+
+    @classmethod
+    def from_db(cls, db_path: str, limit: int = 3) -> "JudgeHistory":
+        """Load the last ``limit`` notes per judge in a single query."""
+        history = cls(limit)
+        if not os.path.exists(db_path):
+            return history
+
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            rows = conn.execute(
+                """
+                SELECT judge_name, notes FROM (
+                    SELECT judge_name, notes, created_at,
+                           ROW_NUMBER() OVER (PARTITION BY judge_name ORDER BY created_at DESC) AS rn
+                    FROM hackathon_scores
+                    WHERE notes IS NOT NULL AND notes != ''
+                )
+                WHERE rn <= ?
+                ORDER BY judge_name, created_at ASC
+                """,
+                (limit,),
+            ).fetchall()
+        except sqlite3.Error as e:
+            logger.warning(f"Could not seed judge history: {e}")
+            return history
+        finally:
+            conn.close()
+
+        for judge_name, notes in rows:
+            history.record(judge_name, notes)
+        return history
+
+    def record(self, judge_name: str, notes: str | None) -> None:
+        if not notes:
+            return
+        with self._lock:
+            self._notes[judge_name].append(notes)
+
+    def recent(self, judge_name: str) -> list[str]:
+        """Most recent notes first, like ``ORDER BY created_at DESC``."""
+        with self._lock:
+            return list(reversed(self._notes.get(judge_name, ())))
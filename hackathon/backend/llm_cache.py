@@ -0,0 +1,158 @@
+"""Persistent, content-addressed cache for OpenRouter chat completions.
+
+Responses are keyed by a SHA-256 of the request fields that determine the
+output (model, messages, sampling parameters, response_format, tools and
+provider routing) and stored in a small SQLite file with a TTL and a
+size-bounded LRU eviction policy.
+"""
+
+import hashlib
+import json
+import logging
+import os
+import sqlite3
+import time
+from typing import Any
+
+from hackathon.backend.config import (
+    LLM_CACHE_ENABLED,
+    LLM_CACHE_MAX_ENTRIES,
+    LLM_CACHE_PATH,
+    LLM_CACHE_TTL_HOURS,
+)
+
+logger = logging.getLogger(__name__)
+
+# Every OpenRouter request field that can change the reply; fields a payload leaves out don't affect its key
+KEY_FIELDS = (
+    "model",
+    "models",
+    "messages",
+    "temperature",
+    "max_tokens",
+    "top_p",
+    "top_k",
+    "seed",
+    "stop",
+    "frequency_penalty",
+    "presence_penalty",
+    "repetition_penalty",
+    "logit_bias",
+    "response_format",
+    "tools",
+    "tool_choice",
+    "reasoning",
+    "transforms",
+    "provider",
+)
+
+
+class LLMResponseCache:
+    def __init__(self, path: str, ttl_seconds: float, max_entries: int):
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        if os.path.dirname(path):
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+        self._ensure_table()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30)
+
+    def _ensure_table(self):
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS llm_cache (
+                    key TEXT PRIMARY KEY,
+                    model TEXT,
+                    response TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    last_accessed REAL NOT NULL
+                )
+                """
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_llm_cache_last_accessed ON llm_cache(last_accessed)")
+            conn.commit()
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(payload: dict[str, Any]) -> str:
+        """Stable hash of the output-determining request fields."""
+        material = {field: payload[field] for field in KEY_FIELDS if payload.get(field) is not None}
+        blob = json.dumps(material, sort_keys=True, ensure_ascii=False, separators=(",", ":"))
+        return hashlib.sha256(blob.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        now = time.time()
+        conn = self._connect()
+        try:
+            row = conn.execute("SELECT response, created_at FROM llm_cache WHERE key = ?", (key,)).fetchone()
+            if row is None:
+                self.misses += 1
+                return None
+            response, created_at = row
+            if self.ttl_seconds and now - created_at > self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                conn.commit()
+                self.misses += 1
+                return None
+            conn.execute("UPDATE llm_cache SET last_accessed = ? WHERE key = ?", (now, key))
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            self.misses += 1
+            return None
+        finally:
+            conn.close()
+
+        self.hits += 1
+        return json.loads(response)
+
+    def set(self, key: str, model: str | None, response: dict[str, Any]) -> None:
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute(
+                """
+                INSERT OR REPLACE INTO llm_cache (key, model, response, created_at, last_accessed)
+                VALUES (?, ?, ?, ?, ?)
+                """,
+                (key, model, json.dumps(response), now, now),
+            )
+            if self.ttl_seconds:
+                conn.execute("DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl_seconds,))
+            if self.max_entries:
+                # LRU eviction: keep only the most recently used max_entries rows
+                conn.execute(
+                    """
+                    DELETE FROM llm_cache WHERE key IN (
+                        SELECT key FROM llm_cache ORDER BY last_accessed DESC LIMIT -1 OFFSET ?
+                    )
+                    """,
+                    (self.max_entries,),
+                )
+            conn.commit()
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+        finally:
+            conn.close()
+
+    def delete(self, key: str) -> None:
+        conn = self._connect()
+        try:
+            conn.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+            conn.commit()
+        finally:
+            conn.close()
+
+
+def get_default_cache(enabled: bool = True) -> LLMResponseCache | None:
+    """Build the configured cache, or ``None`` when disabled by flag or env."""
+    if not (enabled and LLM_CACHE_ENABLED):
+        return None
+    return LLMResponseCache(LLM_CACHE_PATH, LLM_CACHE_TTL_HOURS * 3600, LLM_CACHE_MAX_ENTRIES)
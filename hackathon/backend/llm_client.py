@@ -0,0 +1,429 @@
+"""Shared OpenRouter chat-completion client.
+
+Every pipeline stage that talks to OpenRouter (judge scoring, Round 2
+verdicts, research, GitIngest recommendations, episode generation) goes
+through ``LLMClient`` so connection pooling, pacing, retries, the circuit
+breaker, in-flight de-duplication, response caching and run statistics are
+applied in one place.
+"""
+
+import logging
+import random
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FuturesTimeoutError
+from typing import Any
+
+import requests
+from urllib3.exceptions import NewConnectionError
+
+from hackathon.backend.circuit_breaker import CircuitBreaker, CircuitOpenError
+from hackathon.backend.config import (
+    BASE_URL,
+    LLM_CIRCUIT_COOLDOWN_SECONDS,
+    LLM_CIRCUIT_FAILURE_THRESHOLD,
+    LLM_MAX_CONCURRENCY_PER_MODEL,
+    LLM_MAX_RETRIES,
+    LLM_POOL_SIZE,
+    LLM_PROMPT_CACHE,
+    LLM_RATE_LIMIT_BURST,
+    LLM_RATE_LIMIT_RPS,
+    LLM_REQUEST_TIMEOUT,
+    LLM_RETRY_BACKOFF,
+)
+from hackathon.backend.http_client import create_pooled_session
+from hackathon.backend.llm_cache import LLMResponseCache
+from hackathon.backend.llm_latency import HedgePolicy, get_latency_tracker
+from hackathon.backend.rate_limit import ModelConcurrencyLimiter, TokenBucket
+from hackathon.backend.single_flight import SingleFlight
+
+logger = logging.getLogger(__name__)
+
+# Error answers that carry no completion, so re-sending the POST cannot duplicate work
+RETRYABLE_STATUS = frozenset({408, 429, 500, 502, 503, 504})
+RETRY_MAX_BACKOFF = 30.0
+
+_shared_state: dict[str, Any] = {}
+_shared_lock = threading.Lock()
+
+
+def cacheable_content(prefix: str, suffix: str) -> str | list[dict[str, Any]]:
+    """Message content with a provider prompt-cache breakpoint after ``prefix``.
+
+    Keeping the static text (persona, scale, task) first and marking it with
+    ``cache_control`` lets Anthropic-style providers reuse it across projects;
+    providers with automatic prefix caching benefit from the stable ordering.
+    Returns the plain concatenation when ``LLM_PROMPT_CACHE`` is off.
+    """
+    if not LLM_PROMPT_CACHE or not prefix:
+        return prefix + suffix
+    parts = [{"type": "text", "text": prefix, "cache_control": {"type": "ephemeral"}}]
+    if suffix:
+        parts.append({"type": "text", "text": suffix})
+    return parts
+
+
+def content_text(content: str | list[dict[str, Any]]) -> str:
+    """Flatten message content (plain or content parts) back to text."""
+    if isinstance(content, str):
+        return content
+    return "".join(part.get("text", "") for part in content)
+
+
+class LLMStats:
+    """Thread-safe per-run counters for the run summary."""
+
+    def __init__(self):
+        self.calls = 0
+        self.response_cache_hits = 0
+        self.shared = 0
+        self.failures = 0
+        self.prompt_tokens = 0
+        self.cached_prompt_tokens = 0
+        self.completion_tokens = 0
+        self.latency_total = 0.0
+        self.latency_max = 0.0
+        self._lock = threading.Lock()
+
+    def record(self, latency: float, usage: dict[str, Any] | None) -> None:
+        usage = usage or {}
+        details = usage.get("prompt_tokens_details") or {}
+        with self._lock:
+            self.calls += 1
+            self.latency_total += latency
+            self.latency_max = max(self.latency_max, latency)
+            self.prompt_tokens += usage.get("prompt_tokens") or 0
+            self.cached_prompt_tokens += details.get("cached_tokens") or 0
+            self.completion_tokens += usage.get("completion_tokens") or 0
+
+    def record_cache_hit(self) -> None:
+        with self._lock:
+            self.response_cache_hits += 1
+
+    def record_shared(self) -> None:
+        with self._lock:
+            self.shared += 1
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self.failures += 1
+
+    @property
+    def prompt_cache_hit_rate(self) -> float:
+        return self.cached_prompt_tokens / self.prompt_tokens if self.prompt_tokens else 0.0
+
+    def summary(self) -> str:
+        avg = self.latency_total / self.calls if self.calls else 0.0
+        return (
+            f"LLM: {self.calls} call(s), {self.response_cache_hits} served from response cache, "
+            f"{self.shared} shared with an identical in-flight request, "
+            f"{self.failures} failed · prompt cache {self.prompt_cache_hit_rate:.0%} "
+            f"({self.cached_prompt_tokens}/{self.prompt_tokens} prompt tokens) · "
+            f"latency avg {avg:.1f}s, max {self.latency_max:.1f}s"
+        )
+
+
+def _shared(name: str, factory: Callable[[], Any]) -> Any:
+    """Process-wide transport state, so every stage shares one pool, pacing and breaker."""
+    with _shared_lock:
+        if name not in _shared_state:
+            _shared_state[name] = factory()
+        return _shared_state[name]
+
+
+def _never_sent(error: requests.exceptions.ConnectionError) -> bool:
+    """True when the request provably never reached the provider (safe to re-POST)."""
+    if isinstance(error, requests.exceptions.ConnectTimeout):
+        return True
+    reason = getattr(error.args[0], "reason", None) if error.args else None
+    return isinstance(reason, NewConnectionError)
+
+
+def _retry_after(response: requests.Response) -> float | None:
+    try:
+        return float(response.headers.get("Retry-After", ""))
+    except (TypeError, ValueError):
+        return None
+
+
+class LLMClient:
+    """Paced, cached, retrying chat-completion client.
+
+    Clients created without explicit transport parts share the process-wide
+    keep-alive session, token bucket, per-model concurrency cap, circuit
+    breaker and single-flight table, so scoring, research and episode
+    generation running side by side stay within one provider budget and never
+    pay twice for the same in-flight prompt. Each client keeps its own ``stats``,
+    response cache and metrics ``hooks``.
+    """
+
+    def __init__(
+        self,
+        session: requests.Session | None = None,
+        cache: LLMResponseCache | None = None,
+        rate_limiter: TokenBucket | None = None,
+        model_limiter: ModelConcurrencyLimiter | None = None,
+        breaker: CircuitBreaker | None = None,
+        api_key: str | None = None,
+        title: str | None = None,
+        stage: str = "llm",
+        max_retries: int | None = None,
+        retry_backoff: float | None = None,
+        hooks: list[Callable[[dict[str, Any]], None]] | None = None,
+        hedge: HedgePolicy | None = None,
+        url: str | None = None,
+    ):
+        self.session = session or _shared(
+            "session", lambda: create_pooled_session(LLM_POOL_SIZE, timeout=(10, LLM_REQUEST_TIMEOUT))
+        )
+        self.cache = cache
+        self.rate_limiter = rate_limiter or _shared(
+            "rate_limiter", lambda: TokenBucket(LLM_RATE_LIMIT_RPS, LLM_RATE_LIMIT_BURST)
+        )
+        self.model_limiter = model_limiter or _shared(
+            "model_limiter", lambda: ModelConcurrencyLimiter(LLM_MAX_CONCURRENCY_PER_MODEL)
+        )
+        self.breaker = breaker or _shared(
+            "breaker", lambda: CircuitBreaker(LLM_CIRCUIT_FAILURE_THRESHOLD, LLM_CIRCUIT_COOLDOWN_SECONDS)
+        )
+        self.headers = {}
+        if api_key:
+            self.headers = {
+                "Authorization": f"Bearer {api_key}",
+                "HTTP-Referer": "https://github.com/m3-org/clanktank",
+                "X-Title": title or "Clank Tank",
+            }
+        self.url = url or BASE_URL
+        self.stage = stage
+        self.max_retries = LLM_MAX_RETRIES if max_retries is None else max_retries
+        self.retry_backoff = LLM_RETRY_BACKOFF if retry_backoff is None else retry_backoff
+        self.hedge = hedge
+        # Every client reports into the shared per-stage latency percentiles
+        self.latency = get_latency_tracker()
+        self.hooks = [self.latency, *(hooks or [])]
+        self.single_flight = _shared("single_flight", SingleFlight)
+        self.stats = LLMStats()
+
+    def add_hook(self, hook: Callable[[dict[str, Any]], None]) -> None:
+        """Register ``hook(event)``, called after every chat() with stage, model,
+        outcome, latency, attempts, usage and the caller's ``tags``."""
+        self.hooks.append(hook)
+
+    def _emit(self, tags: dict[str, Any] | None, **event: Any) -> None:
+        event = {"stage": self.stage, **(tags or {}), **event}
+        for hook in self.hooks:
+            try:
+                hook(event)
+            except Exception as e:
+                logger.warning(f"LLM metrics hook failed: {e}")
+
+    def chat(
+        self,
+        payload: dict[str, Any],
+        validate: Callable[[dict[str, Any]], Any] | None = None,
+        tags: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """POST a chat completion and return the decoded JSON body.
+
+        Cache hits skip the network (and the rate limiter) entirely, and
+        concurrent identical requests share a single network call. With a
+        ``hedge`` policy, ``validate(result)`` (raising on an unusable answer)
+        decides which of the original and the hedged request wins. ``tags``
+        (e.g. ``{"judge": "aimarc"}`` or a ``stage`` override) are added to
+        every metrics event this call emits.
+
+        Raises:
+            requests.exceptions.RequestException: On transport or HTTP errors,
+                or ``CircuitOpenError`` while the provider circuit is open.
+        """
+        key = LLMResponseCache.make_key(payload)
+        model = payload.get("model") or ""
+        if self.cache is not None:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.info(f"LLM cache hit for {model} ({key[:12]})")
+                self.stats.record_cache_hit()
+                self._emit(tags, model=model, outcome="cache_hit", latency=0.0, attempts=0, usage=None)
+                return cached
+
+        # Identical prompts already in flight (from any client in this process) share that call
+        start = time.monotonic()
+        result, shared = self.single_flight.do(key, lambda: self._fetch(payload, validate, key, tags))
+        if shared:
+            logger.info(f"LLM request for {model} ({key[:12]}) joined an identical in-flight request")
+            self.stats.record_shared()
+            self._emit(tags, model=model, outcome="shared", latency=time.monotonic() - start, attempts=0, usage=None)
+        return result
+
+    def _fetch(
+        self,
+        payload: dict[str, Any],
+        validate: Callable[[dict[str, Any]], Any] | None,
+        key: str,
+        tags: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        stage = (tags or {}).get("stage", self.stage)
+        delay = self.hedge.delay(stage) if self.hedge is not None else None
+        if delay is None:
+            result, answered = self._send(payload, tags), payload
+        else:
+            result, answered = self._send_hedged(payload, validate, delay, tags)
+
+        # Cached before the flight ends, so later callers hit the cache. A fallback
+        # model's answer is not cached under the primary model's key.
+        if self.cache is not None and answered is payload and result.get("choices"):
+            self.cache.set(key, payload.get("model") or "", result)
+        return result
+
+    def _send(
+        self, payload: dict[str, Any], tags: dict[str, Any] | None = None, started: threading.Event | None = None
+    ) -> dict[str, Any]:
+        model = payload.get("model") or ""
+        # Ask OpenRouter for usage details (incl. cached prompt tokens); not part of the cache key
+        request = {**payload, "usage": {"include": True}}
+        attempts = [0]
+        start = time.monotonic()
+        with self.model_limiter.slot(model):
+            try:
+                response, latency = self._post(request, model, attempts, started)
+            except Exception as e:
+                self.stats.record_failure()
+                outcome = "circuit_open" if isinstance(e, CircuitOpenError) else "error"
+                self._emit(
+                    tags,
+                    model=model,
+                    outcome=outcome,
+                    latency=time.monotonic() - start,
+                    attempts=attempts[0],
+                    usage=None,
+                )
+                raise
+        result = response.json()
+        self.stats.record(latency, result.get("usage"))
+        self._emit(tags, model=model, outcome="ok", latency=latency, attempts=attempts[0], usage=result.get("usage"))
+        return result
+
+    def _send_hedged(
+        self,
+        payload: dict[str, Any],
+        validate: Callable[[dict[str, Any]], Any] | None,
+        delay: float,
+        tags: dict[str, Any] | None = None,
+    ) -> tuple[dict[str, Any], dict[str, Any]]:
+        """Race ``payload`` against a duplicate sent after ``delay`` seconds.
+
+        The hedge delay counts from when the primary request is actually sent,
+        not from when it was queued for a free pool worker or model slot. The
+        first answer that passes ``validate`` wins. The loser cannot be
+        aborted mid-flight with ``requests``; it is cancelled if still queued
+        and otherwise left to finish, with its answer discarded (its latency
+        still feeds the percentiles). If no answer validates, the first one
+        received is returned so the caller's own parse handles the failure.
+        """
+        pool = _shared("hedge_pool", lambda: ThreadPoolExecutor(LLM_POOL_SIZE, thread_name_prefix="llm-hedge"))
+        started = threading.Event()
+        primary = pool.submit(self._send, payload, tags, started)
+        # Also released if the primary fails before it is sent (e.g. an open circuit)
+        primary.add_done_callback(lambda _: started.set())
+        started.wait()
+        try:
+            return primary.result(timeout=delay), payload
+        except FuturesTimeoutError:
+            pass
+
+        hedge_payload = payload
+        if self.hedge.fallback_model:
+            hedge_payload = {**payload, "model": self.hedge.fallback_model}
+        logger.info(
+            f"Hedging {self.stage} request after {delay:.1f}s ({payload.get('model')} -> {hedge_payload.get('model')})"
+        )
+        hedge = pool.submit(self._send, hedge_payload, tags)
+        sent = {primary: payload, hedge: hedge_payload}
+
+        first_answer, error = None, None
+        for future in as_completed(sent):
+            try:
+                result = future.result()
+            except Exception as e:
+                error = error or e
+                continue
+            if first_answer is None:
+                first_answer = (result, sent[future])
+            if validate is not None:
+                try:
+                    validate(result)
+                except Exception as e:
+                    logger.warning(f"Discarding unusable {self.stage} answer from {sent[future].get('model')}: {e}")
+                    continue
+            (hedge if future is primary else primary).cancel()
+            self.hedge.record(hedge_won=future is hedge)
+            return result, sent[future]
+
+        self.hedge.record(hedge_won=False)
+        if first_answer is not None:
+            return first_answer
+        raise error
+
+    def _post(
+        self, request: dict[str, Any], model: str, attempts: list[int], started: threading.Event | None = None
+    ) -> tuple[requests.Response, float]:
+        """Send ``request``, retrying only where a duplicate POST cannot happen.
+
+        Retried: connect failures (nothing was sent) and 408/429/5xx answers
+        (the provider produced no completion). A read timeout is never retried —
+        the provider may still be generating, and billing, the first request.
+        Backoff is exponential with full jitter, honouring ``Retry-After``.
+        ``started`` is set just before the first POST goes out.
+        """
+        while True:
+            self.breaker.before_call()
+            self.rate_limiter.acquire()
+            attempts[0] += 1
+            start = time.monotonic()
+            if started is not None:
+                started.set()
+            try:
+                response = self.session.post(self.url, json=request, headers=self.headers, timeout=self.session.timeout)
+            except requests.exceptions.ConnectionError as e:
+                self.breaker.record_failure()
+                if not _never_sent(e) or attempts[0] > self.max_retries:
+                    raise
+                reason, retry_after = type(e).__name__, None
+            except requests.exceptions.Timeout:
+                self.breaker.record_failure()
+                raise
+            except BaseException:
+                # Any other outcome still settles the breaker, or a half-open probe would never end
+                self.breaker.record_failure()
+                raise
+            else:
+                if response.status_code not in RETRYABLE_STATUS:
+                    self.breaker.record_success()
+                    response.raise_for_status()
+                    return response, time.monotonic() - start
+                self.breaker.record_failure()
+                if attempts[0] > self.max_retries:
+                    response.raise_for_status()
+                reason, retry_after = f"HTTP {response.status_code}", _retry_after(response)
+
+            delay = random.uniform(0, min(RETRY_MAX_BACKOFF, self.retry_backoff * 2 ** (attempts[0] - 1)))
+            if retry_after is not None:
+                delay = max(delay, min(retry_after, RETRY_MAX_BACKOFF))
+            logger.warning(
+                f"LLM request to {model} failed ({reason}); retry {attempts[0]}/{self.max_retries} in {delay:.1f}s"
+            )
+            time.sleep(delay)
+
+    def run_report(self) -> list[str]:
+        """Summary lines for the end of a run: call stats, per-stage latency percentiles, hedging."""
+        lines = [self.stats.summary(), *self.latency.report()]
+        if self.hedge is not None:
+            lines.append(self.hedge.summary())
+        return lines
+
+    def invalidate(self, payload: dict[str, Any]) -> None:
+        """Drop a cached response, e.g. after it failed to parse."""
+        if self.cache is not None:
+            self.cache.delete(self.cache.make_key(payload))
@@ -0,0 +1,122 @@
+"""Per-stage LLM latency percentiles and the hedged-request policy built on them."""
+
+import math
+import threading
+from collections import defaultdict, deque
+from typing import Any
+
+from hackathon.backend.config import (
+    LLM_HEDGE_ENABLED,
+    LLM_HEDGE_FALLBACK_MODEL,
+    LLM_HEDGE_MIN_DELAY,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_QUANTILE,
+)
+
+
+class LatencyTracker:
+    """Thread-safe rolling window of successful call latencies per stage.
+
+    Registered as an ``LLMClient`` metrics hook, so every stage's samples
+    accumulate in one place for the run report and for hedging thresholds.
+    """
+
+    def __init__(self, window: int = 1000):
+        self.window = window
+        self._samples: dict[str, deque[float]] = defaultdict(lambda: deque(maxlen=window))
+        self._lock = threading.Lock()
+
+    def __call__(self, event: dict[str, Any]) -> None:
+        if event.get("outcome") == "ok":
+            self.observe(event["stage"], event["latency"])
+
+    def observe(self, stage: str, latency: float) -> None:
+        with self._lock:
+            self._samples[stage].append(latency)
+
+    def count(self, stage: str) -> int:
+        with self._lock:
+            return len(self._samples.get(stage, ()))
+
+    def percentile(self, stage: str, q: float) -> float | None:
+        """Nearest-rank ``q`` quantile (0-1) for ``stage``, or None without samples."""
+        with self._lock:
+            samples = sorted(self._samples.get(stage, ()))
+        if not samples:
+            return None
+        return samples[max(0, math.ceil(q * len(samples)) - 1)]
+
+    def report(self) -> list[str]:
+        """One ``stage: n=…, p50/p90/p99`` line per stage with samples."""
+        with self._lock:
+            stages = sorted(stage for stage, samples in self._samples.items() if samples)
+        lines = []
+        for stage in stages:
+            p50, p90, p99 = (self.percentile(stage, q) for q in (0.5, 0.9, 0.99))
+            lines.append(
+                f"LLM latency [{stage}]: n={self.count(stage)}, p50 {p50:.1f}s, p90 {p90:.1f}s, p99 {p99:.1f}s"
+            )
+        return lines
+
+
+class HedgePolicy:
+    """When to send a duplicate of a slow LLM request, and to which model.
+
+    The hedge fires once a request has been outstanding longer than the
+    ``quantile`` latency seen so far for its stage (at least ``min_delay``
+    seconds). Until ``min_samples`` calls have completed there is no reliable
+    threshold, so nothing is hedged.
+    """
+
+    def __init__(
+        self,
+        tracker: LatencyTracker,
+        quantile: float = 0.9,
+        min_samples: int = 20,
+        min_delay: float = 2.0,
+        fallback_model: str | None = None,
+    ):
+        self.tracker = tracker
+        self.quantile = quantile
+        self.min_samples = min_samples
+        self.min_delay = min_delay
+        self.fallback_model = fallback_model or None
+        self.hedges = 0
+        self.hedge_wins = 0
+        self._lock = threading.Lock()
+
+    def delay(self, stage: str) -> float | None:
+        """Seconds to wait before hedging a ``stage`` request, or None to never hedge."""
+        if self.tracker.count(stage) < self.min_samples:
+            return None
+        return max(self.min_delay, self.tracker.percentile(stage, self.quantile))
+
+    def record(self, hedge_won: bool) -> None:
+        with self._lock:
+            self.hedges += 1
+            self.hedge_wins += hedge_won
+
+    def summary(self) -> str:
+        target = f" to {self.fallback_model}" if self.fallback_model else ""
+        return f"LLM hedging: {self.hedges} hedged request(s){target}, {self.hedge_wins} won by the hedge"
+
+
+_tracker = LatencyTracker()
+
+
+def get_latency_tracker() -> LatencyTracker:
+    """The process-wide tracker every ``LLMClient`` reports into."""
+    return _tracker
+
+
+def get_hedge_policy(enabled: bool = False) -> HedgePolicy | None:
+    """Hedge policy from config, or None unless enabled here or via ``LLM_HEDGE_ENABLED``."""
+    if not (enabled or LLM_HEDGE_ENABLED):
+        return None
+    return HedgePolicy(
+        _tracker,
+        quantile=LLM_HEDGE_QUANTILE,
+        min_samples=LLM_HEDGE_MIN_SAMPLES,
+        min_delay=LLM_HEDGE_MIN_DELAY,
+        fallback_model=LLM_HEDGE_FALLBACK_MODEL,
+    )
@@ -0,0 +1,217 @@
+"""Per-call LLM telemetry in ``llm_telemetry`` and the aggregates behind ``clanktank status --llm``.
+
+``TelemetryRecorder`` is an ``LLMClient`` metrics hook. It buffers events in
+memory and inserts them in batches, so recording adds one short write
+transaction per ``LLM_TELEMETRY_BATCH_SIZE`` calls rather than one per call.
+Buffered rows are flushed at exit.
+"""
+
+import atexit
+import logging
+import math
+import sqlite3
+import threading
+import time
+from typing import Any
+
+from hackathon.backend.config import LLM_TELEMETRY_BATCH_SIZE, LLM_TELEMETRY_ENABLED
+
+logger = logging.getLogger(__name__)
+
+TELEMETRY_GROUPS = ("stage", "judge", "model")
+ERROR_OUTCOMES = ("error", "circuit_open")
+
+
+def create_telemetry_table(cursor: sqlite3.Cursor) -> None:
+    """Create ``llm_telemetry`` and its time index (idempotent)."""
+    cursor.execute(
+        """
+        CREATE TABLE IF NOT EXISTS llm_telemetry (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            created_at REAL NOT NULL,
+            stage TEXT NOT NULL,
+            judge TEXT,
+            model TEXT,
+            outcome TEXT NOT NULL,
+            latency REAL,
+            attempts INTEGER,
+            prompt_tokens INTEGER,
+            completion_tokens INTEGER,
+            cached_tokens INTEGER,
+            cost REAL
+        )
+    """
+    )
+    cursor.execute("CREATE INDEX IF NOT EXISTS idx_llm_telemetry_created ON llm_telemetry(created_at)")
+
+
+class TelemetryRecorder:
+    """Thread-safe metrics hook that batches events into ``llm_telemetry``.
+
+    The table is created on the first flush, so attaching a recorder to a
+    client that never makes a call leaves the database untouched. A failed
+    write is logged and its rows dropped; telemetry never fails a call.
+    """
+
+    def __init__(self, db_path: str, batch_size: int = 25):
+        self.db_path = db_path
+        self.batch_size = max(1, batch_size)
+        self._buffer: list[tuple] = []
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._table_ready = False
+
+    def __call__(self, event: dict[str, Any]) -> None:
+        usage = event.get("usage") or {}
+        details = usage.get("prompt_tokens_details") or {}
+        row = (
+            time.time(),
+            event.get("stage") or "llm",
+            event.get("judge"),
+            event.get("model"),
+            event.get("outcome") or "ok",
+            event.get("latency"),
+            event.get("attempts"),
+            usage.get("prompt_tokens"),
+            usage.get("completion_tokens"),
+            details.get("cached_tokens"),
+            usage.get("cost"),
+        )
+        with self._lock:
+            self._buffer.append(row)
+            full = len(self._buffer) >= self.batch_size
+        if full:
+            self.flush()
+
+    def flush(self) -> int:
+        """Write buffered rows; returns how many were written."""
+        with self._flush_lock:
+            with self._lock:
+                rows, self._buffer = self._buffer, []
+            if not rows:
+                return 0
+            conn = sqlite3.connect(self.db_path, timeout=30)
+            try:
+                if not self._table_ready:
+                    create_telemetry_table(conn.cursor())
+                    self._table_ready = True
+                conn.executemany(
+                    """
+                    INSERT INTO llm_telemetry
+                    (created_at, stage, judge, model, outcome, latency, attempts,
+                     prompt_tokens, completion_tokens, cached_tokens, cost)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                    """,
+                    rows,
+                )
+                conn.commit()
+                return len(rows)
+            except sqlite3.Error as e:
+                logger.warning(f"Dropping {len(rows)} LLM telemetry row(s): {e}")
+                return 0
+            finally:
+                conn.close()
+
+
+_recorders: dict[str, TelemetryRecorder] = {}
+_recorders_lock = threading.Lock()
+
+
+def _flush_all() -> None:
+    for recorder in list(_recorders.values()):
+        recorder.flush()
+
+
+atexit.register(_flush_all)
+
+
+def get_telemetry_recorder(db_path: str) -> TelemetryRecorder | None:
+    """The process-wide recorder for ``db_path``, or None when ``LLM_TELEMETRY_ENABLED`` is off."""
+    if not LLM_TELEMETRY_ENABLED:
+        return None
+    with _recorders_lock:
+        if db_path not in _recorders:
+            _recorders[db_path] = TelemetryRecorder(db_path, batch_size=LLM_TELEMETRY_BATCH_SIZE)
+        return _recorders[db_path]
+
+
+def _percentile(samples: list[float], q: float) -> float | None:
+    if not samples:
+        return None
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+def summarize_telemetry(db_path: str, since: float | None = None) -> dict[str, list[dict[str, Any]]]:
+    """Per-stage, per-judge and per-model aggregates of ``llm_telemetry``.
+
+    Each group row has ``calls`` (every chat() outcome), ``errors`` and
+    ``error_rate`` (over calls that reached the provider), ``cache_hits``
+    (response cache) and ``shared`` (joined an identical in-flight request),
+    token totals including provider-cached prompt tokens, ``cost`` as
+    reported by OpenRouter, and p50/p95 latency of successful calls. Calls
+    without a judge are left out of the judge group. Returns empty groups if
+    nothing has been recorded yet.
+    """
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        query = (
+            "SELECT stage, judge, model, outcome, latency, prompt_tokens, completion_tokens, cached_tokens, cost "
+            "FROM llm_telemetry"
+        )
+        params: tuple = ()
+        if since is not None:
+            query += " WHERE created_at >= ?"
+            params = (since,)
+        try:
+            rows = conn.execute(query, params).fetchall()
+        except sqlite3.OperationalError:
+            rows = []
+    finally:
+        conn.close()
+
+    groups: dict[str, dict[str, dict[str, Any]]] = {group: {} for group in TELEMETRY_GROUPS}
+    for stage, judge, model, outcome, latency, prompt, completion, cached, cost in rows:
+        for group, name in zip(TELEMETRY_GROUPS, (stage, judge, model), strict=True):
+            if name is None:
+                continue
+            agg = groups[group].setdefault(
+                name,
+                {
+                    "name": name,
+                    "calls": 0,
+                    "errors": 0,
+                    "cache_hits": 0,
+                    "shared": 0,
+                    "prompt_tokens": 0,
+                    "completion_tokens": 0,
+                    "cached_tokens": 0,
+                    "cost": 0.0,
+                    "latencies": [],
+                },
+            )
+            agg["calls"] += 1
+            if outcome == "ok":
+                agg["latencies"].append(latency or 0.0)
+            elif outcome in ERROR_OUTCOMES:
+                agg["errors"] += 1
+            elif outcome == "cache_hit":
+                agg["cache_hits"] += 1
+            elif outcome == "shared":
+                agg["shared"] += 1
+            agg["prompt_tokens"] += prompt or 0
+            agg["completion_tokens"] += completion or 0
+            agg["cached_tokens"] += cached or 0
+            agg["cost"] += cost or 0.0
+
+    report = {}
+    for group, aggs in groups.items():
+        report[group] = []
+        for agg in sorted(aggs.values(), key=lambda a: a["calls"], reverse=True):
+            latencies = agg.pop("latencies")
+            sent = len(latencies) + agg["errors"]
+            agg["error_rate"] = agg["errors"] / sent if sent else 0.0
+            agg["p50"] = _percentile(latencies, 0.5)
+            agg["p95"] = _percentile(latencies, 0.95)
+            report[group].append(agg)
+    return report
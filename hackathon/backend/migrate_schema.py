@@ -31,6 +31,7 @@ REQUIRED_SCORE_FIELDS = [
     "round",
     "community_bonus",
     "final_verdict",
+    "calibrated_total",
 ]
 
 STATIC_FIELDS = ["id", "submission_id", "status", "created_at", "updated_at"]
@@ -0,0 +1,278 @@
+"""Streaming research → score → synthesize orchestrator (``clanktank pipeline run``).
+
+The batch commands finish a whole stage for the cohort before the next one
+starts. Here each submission moves on its own: as soon as its research is
+written it is handed to the scoring pool. Every stage has its own worker
+budget, so a slow repository analysis never holds up scoring elsewhere.
+Static data is rebuilt by a debouncer. It coalesces the submissions changed
+within a quiet window into one partial regeneration.
+"""
+
+import argparse
+import logging
+import threading
+import time
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from hackathon.backend.config import (
+    PIPELINE_RESEARCH_CONCURRENCY,
+    PIPELINE_SCORE_CONCURRENCY,
+    PIPELINE_STATIC_DEBOUNCE_SECONDS,
+    PIPELINE_STATIC_MAX_DELAY_SECONDS,
+    PIPELINE_SYNTHESIZE_CONCURRENCY,
+)
+
+logger = logging.getLogger(__name__)
+
+PIPELINE_STAGES = ("research", "score", "synthesize")
+
+
+class Debouncer:
+    """Coalesce change notifications into one ``fn(keys)`` call per quiet window.
+
+    ``fn`` runs on a background thread once ``delay`` seconds pass without a
+    new ``touch``, or ``max_delay`` seconds after the first pending change,
+    so a steady stream of updates still publishes regularly.
+    """
+
+    def __init__(self, fn: Callable[[set[str]], Any], delay: float, max_delay: float | None = None):
+        self.fn = fn
+        self.delay = delay
+        self.max_delay = max(delay, max_delay if max_delay is not None else delay)
+        self.flushes = 0
+        self._pending: set[str] = set()
+        self._first = self._last = 0.0
+        self._closed = False
+        self._cond = threading.Condition()
+        self._thread = threading.Thread(target=self._run, name="debounce", daemon=True)
+        self._thread.start()
+
+    def touch(self, key: Any) -> None:
+        now = time.monotonic()
+        with self._cond:
+            if not self._pending:
+                self._first = now
+            self._pending.add(str(key))
+            self._last = now
+            self._cond.notify()
+
+    def close(self) -> None:
+        """Flush anything pending immediately, then stop the thread."""
+        with self._cond:
+            self._closed = True
+            self._cond.notify()
+        self._thread.join()
+
+    def _deadline(self) -> float:
+        return min(self._last + self.delay, self._first + self.max_delay)
+
+    def _run(self) -> None:
+        while True:
+            with self._cond:
+                while not self._pending and not self._closed:
+                    self._cond.wait()
+                if not self._pending:
+                    return
+                while not self._closed and (remaining := self._deadline() - time.monotonic()) > 0:
+                    self._cond.wait(remaining)
+                batch, self._pending = self._pending, set()
+            try:
+                self.fn(batch)
+                self.flushes += 1
+            except Exception as e:
+                logger.error(f"Debounced update for {len(batch)} submission(s) failed: {e}")
+
+
+class PipelineRunner:
+    """Run stage handlers per submission, chaining research straight into scoring.
+
+    ``handlers`` maps stage names to ``handler(submission_id)`` callables (a
+    missing stage is skipped). A handler that raises marks the submission
+    failed for that stage and it goes no further. After each successful stage,
+    ``publish`` is notified through the debouncer.
+    """
+
+    def __init__(
+        self,
+        handlers: dict[str, Callable[[str], Any]],
+        publish: Callable[[set[str]], Any] | None = None,
+        concurrency: dict[str, int] | None = None,
+        debounce: float = 10.0,
+        max_debounce: float = 60.0,
+        stop: threading.Event | None = None,
+    ):
+        self.handlers = handlers
+        self.publish = publish
+        self.concurrency = {stage: 1 for stage in PIPELINE_STAGES} | (concurrency or {})
+        self.debounce = debounce
+        self.max_debounce = max_debounce
+        self.stop = stop or threading.Event()
+        self.results = {stage: {"done": 0, "failed": 0} for stage in PIPELINE_STAGES}
+        self._started: dict[str, float] = {}
+        self._outstanding = 0
+        self._cond = threading.Condition()
+        self._pools: dict[str, ThreadPoolExecutor] = {}
+        self._debouncer: Debouncer | None = None
+
+    def run(
+        self, research_ids: Iterable[Any] = (), score_ids: Iterable[Any] = (), synthesize_ids: Iterable[Any] = ()
+    ) -> dict[str, dict[str, int]]:
+        """Process the given submissions and return ``{stage: {"done": n, "failed": n}}``.
+
+        Submissions queued for research are scored when it lands, so they are
+        dropped from ``score_ids``. Setting ``stop`` lets running jobs finish
+        but starts nothing new.
+        """
+        research_ids = [str(sid) for sid in research_ids]
+        researching = set(research_ids)
+        score_ids = [str(sid) for sid in score_ids if str(sid) not in researching]
+        self._pools = {
+            stage: ThreadPoolExecutor(max_workers=max(1, self.concurrency[stage]), thread_name_prefix=stage)
+            for stage in PIPELINE_STAGES
+            if stage in self.handlers
+        }
+        if self.publish:
+            self._debouncer = Debouncer(self.publish, self.debounce, self.max_debounce)
+        try:
+            for stage, ids in (("research", research_ids), ("score", score_ids), ("synthesize", synthesize_ids)):
+                for sid in ids:
+                    self._submit(stage, str(sid))
+            with self._cond:
+                while self._outstanding:
+                    self._cond.wait()
+        except BaseException:
+            # Interrupted: running jobs finish, queued ones are cancelled and nothing is chained
+            self.stop.set()
+            raise
+        finally:
+            for pool in self._pools.values():
+                pool.shutdown(wait=True, cancel_futures=True)
+            if self._debouncer:
+                self._debouncer.close()
+        return self.results
+
+    def _submit(self, stage: str, sid: str) -> None:
+        if stage not in self._pools or self.stop.is_set():
+            return
+        with self._cond:
+            self._outstanding += 1
+            self._started.setdefault(sid, time.monotonic())
+        try:
+            future = self._pools[stage].submit(self._run_stage, stage, sid)
+        except RuntimeError:  # pool already shut down by an interrupt
+            self._release()
+            return
+        future.add_done_callback(lambda f: f.cancelled() and self._release())
+
+    def _run_stage(self, stage: str, sid: str) -> None:
+        try:
+            if self.stop.is_set():
+                return
+            try:
+                self.handlers[stage](sid)
+            except Exception as e:
+                logger.error(f"Pipeline {stage} failed for {sid}: {e}")
+                self._record(stage, "failed")
+                return
+            self._record(stage, "done")
+            if self._debouncer:
+                self._debouncer.touch(sid)
+            if stage == "research":
+                self._submit("score", sid)
+            else:
+                logger.info(
+                    f"Pipeline: {sid} {stage} done {time.monotonic() - self._started[sid]:.1f}s after it started"
+                )
+        finally:
+            self._release()
+
+    def _release(self) -> None:
+        with self._cond:
+            self._outstanding -= 1
+            self._cond.notify_all()
+
+    def _record(self, stage: str, outcome: str) -> None:
+        with self._cond:
+            self.results[stage][outcome] += 1
+
+
+def main():
+    """CLI entry point for ``clanktank pipeline run``."""
+    parser = argparse.ArgumentParser(description="Streaming research → score → synthesize pipeline")
+    parser.add_argument("--version", default="latest", choices=["latest", "v1", "v2"], help="Submission schema version")
+    parser.add_argument("--db-file", default=None, help="Path to the hackathon SQLite database file")
+    parser.add_argument("--force", "-f", action="store_true", help="Re-research and re-score every submission")
+    parser.add_argument("--research-concurrency", type=int, default=PIPELINE_RESEARCH_CONCURRENCY)
+    parser.add_argument("--score-concurrency", type=int, default=PIPELINE_SCORE_CONCURRENCY)
+    parser.add_argument("--synthesize-concurrency", type=int, default=PIPELINE_SYNTHESIZE_CONCURRENCY)
+    parser.add_argument(
+        "--debounce",
+        type=float,
+        default=PIPELINE_STATIC_DEBOUNCE_SECONDS,
+        help="Quiet seconds before changed submissions are republished as static data",
+    )
+    parser.add_argument("--no-static-data", action="store_true", help="Do not regenerate static data as work lands")
+    parser.add_argument("--no-synthesize", action="store_true", help="Skip Round 2 synthesis of community-voting ones")
+    parser.add_argument("--parallel-judges", action="store_true", help="Query all four judges concurrently")
+    parser.add_argument("--no-llm-cache", action="store_true", help="Bypass the persistent LLM response cache")
+    parser.add_argument("--hedge", action="store_true", help="Hedge LLM requests pending past the p90 latency")
+    args = parser.parse_args()
+
+    from hackathon.backend.hackathon_manager import HackathonManager
+    from hackathon.backend.research import HackathonResearcher
+
+    try:
+        manager = HackathonManager(
+            db_path=args.db_file,
+            version=args.version,
+            force=args.force,
+            parallel_judges=args.parallel_judges,
+            llm_cache=not args.no_llm_cache,
+            hedge=args.hedge,
+        )
+    except ValueError as e:
+        logger.error(f"Initialization failed: {e}")
+        return
+    researcher = HackathonResearcher(
+        db_path=args.db_file, version=args.version, force=args.force, llm_cache=not args.no_llm_cache, hedge=args.hedge
+    )
+
+    handlers = {"research": researcher.research_submission, "score": lambda sid: manager.score_submission(sid, 1)}
+    if not args.no_synthesize:
+        handlers["synthesize"] = manager.synthesize_one
+
+    publish = None
+    if not args.no_static_data:
+        from hackathon.scripts.generate_static_data import generate_static_data
+
+        publish = lambda changed: generate_static_data(submission_ids=changed, db_path=args.db_file)  # noqa: E731
+
+    runner = PipelineRunner(
+        handlers,
+        publish=publish,
+        concurrency={
+            "research": args.research_concurrency,
+            "score": args.score_concurrency,
+            "synthesize": args.synthesize_concurrency,
+        },
+        debounce=args.debounce,
+        max_debounce=PIPELINE_STATIC_MAX_DELAY_SECONDS,
+    )
+    research_ids = researcher.pending_research_ids()
+    score_ids = [row[0] for row in manager.pending_for_scoring()]
+    synthesize_ids = [] if args.no_synthesize else manager.pending_for_synthesis()
+    logger.info(
+        f"Pipeline: {len(research_ids)} to research, {len(score_ids)} already researched, "
+        f"{len(synthesize_ids)} awaiting synthesis"
+    )
+    results = runner.run(research_ids, score_ids, synthesize_ids)
+    for stage, counts in results.items():
+        logger.info(f"Pipeline {stage}: {counts['done']} done, {counts['failed']} failed")
+    for line in manager.llm.run_report():
+        logger.info(line)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""Live progress/throughput line for batch pipeline stages (research, scoring, ...)."""
+
+import logging
+import sys
+import threading
+import time
+
+logger = logging.getLogger(__name__)
+
+
+class ThroughputProgress:
+    """Thread-safe counter that renders ``done/total · in-flight · failed · rate``.
+
+    On a TTY the line is redrawn in place; otherwise each completion is logged
+    so batch runs under cron/CI still leave a readable trail.
+    """
+
+    def __init__(self, total: int, label: str = "progress", stream=None):
+        self.total = total
+        self.label = label
+        self.stream = stream or sys.stderr
+        self.in_flight = 0
+        self.done = 0
+        self.failed = 0
+        self._started = time.monotonic()
+        self._lock = threading.Lock()
+        self._tty = hasattr(self.stream, "isatty") and self.stream.isatty()
+
+    @property
+    def per_minute(self) -> float:
+        elapsed = time.monotonic() - self._started
+        return (self.done / elapsed) * 60 if elapsed > 0 else 0.0
+
+    def line(self) -> str:
+        return (
+            f"[{self.label}] {self.done}/{self.total} done · {self.in_flight} in-flight · "
+            f"{self.failed} failed · {self.per_minute:.1f}/min"
+        )
+
+    def start(self) -> None:
+        with self._lock:
+            self.in_flight += 1
+            self._render()
+
+    def finish(self, ok: bool = True) -> None:
+        with self._lock:
+            self.in_flight -= 1
+            self.done += 1
+            if not ok:
+                self.failed += 1
+            self._render(completed=True)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._tty:
+                self.stream.write("\n")
+                self.stream.flush()
+            else:
+                logger.info(self.line())
+
+    def _render(self, completed: bool = False) -> None:
+        if self._tty:
+            self.stream.write("\r\033[K" + self.line())
+            self.stream.flush()
+        elif completed:
+            logger.info(self.line())
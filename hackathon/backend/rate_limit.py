@@ -0,0 +1,81 @@
+"""Thread-safe rate limiting primitives shared by the LLM pipeline stages."""
+
+import threading
+import time
+from contextlib import contextmanager
+
+
+class TokenBucket:
+    """Classic token bucket: ``rate`` tokens/second refill, up to ``capacity`` burst.
+
+    ``acquire`` blocks until a token is available, so callers can fan out
+    requests freely and let the bucket smooth them to the provider's limit.
+    A non-positive ``rate`` disables limiting entirely.
+    """
+
+    def __init__(self, rate: float, capacity: float | None = None):
+        self.rate = float(rate)
+        self.capacity = float(capacity if capacity is not None else max(1.0, rate))
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+            self._updated = now
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` if available right now; never blocks."""
+        if self.rate <= 0:
+            return True
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens >= tokens:
+                self._tokens -= tokens
+                return True
+            return False
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available. Returns seconds spent waiting."""
+        if self.rate <= 0:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._refill(now)
+                if self._tokens >= tokens:
+                    self._tokens -= tokens
+                    return waited
+                delay = (tokens - self._tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class ModelConcurrencyLimiter:
+    """Caps the number of in-flight requests per model name."""
+
+    def __init__(self, max_per_model: int):
+        self.max_per_model = max(1, int(max_per_model))
+        self._semaphores: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+
+    def _semaphore(self, model: str) -> threading.BoundedSemaphore:
+        with self._lock:
+            sem = self._semaphores.get(model)
+            if sem is None:
+                sem = threading.BoundedSemaphore(self.max_per_model)
+                self._semaphores[model] = sem
+            return sem
+
+    @contextmanager
+    def slot(self, model: str):
+        """Hold one of the ``max_per_model`` slots for ``model`` while the block runs."""
+        sem = self._semaphore(model)
+        sem.acquire()
+        try:
+            yield
+        finally:
+            sem.release()
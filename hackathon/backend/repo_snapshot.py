@@ -0,0 +1,84 @@
+"""Immutable view of one repository at one commit, shared by every GitHub consumer.
+
+``GitHubAnalyzer.get_snapshot`` resolves the branch to a commit SHA and fetches
+the repository metadata, recursive tree, README and recent commit data once
+(GraphQL mode also gets the languages in the same query). ``analyze_repository``,
+``summarize_repo``, ``extract_dependency_info`` and ``run_gitingest_secure``
+then read from the snapshot instead of each calling the REST API again.
+Because the key includes the SHA, a snapshot never mixes file sizes from
+different repositories or from different pushes to one branch.
+"""
+
+import threading
+from concurrent.futures import Future
+from dataclasses import dataclass, field
+from functools import cached_property
+from typing import Any
+
+
+@dataclass(frozen=True)
+class RepoSnapshot:
+    """Repository state at ``sha``; ``tree`` holds the blob entries (``path``, ``size``)."""
+
+    owner: str
+    repo: str
+    sha: str
+    repo_data: dict[str, Any]
+    tree: list[dict[str, Any]] = field(default_factory=list)
+    readme: str | None = None
+    # None when not fetched with the snapshot (REST mode); ``summarize_repo`` then asks for them
+    languages: dict[str, Any] | None = None
+    commits: dict[str, Any] = field(default_factory=dict)
+    # File contents fetched along with the snapshot (GraphQL mode prefetches dependency manifests)
+    blobs: dict[str, str] = field(default_factory=dict)
+    # Set when the tree could not be fetched; ``tree`` is then empty
+    tree_error: str | None = None
+
+    @property
+    def key(self) -> tuple[str, str, str]:
+        return (self.owner.lower(), self.repo.lower(), self.sha)
+
+    @cached_property
+    def files(self) -> list[str]:
+        return [item["path"] for item in self.tree]
+
+    @cached_property
+    def sizes(self) -> dict[str, int]:
+        return {item["path"]: item.get("size", 0) for item in self.tree}
+
+
+class SnapshotPrefetcher:
+    """Hands out snapshots for a known list of repository URLs, fetching ``batch_size`` at a time.
+
+    Used by ``research --all`` in GraphQL mode. The first submission that needs
+    a snapshot fetches it together with the next unfetched URLs in one
+    ``get_snapshots`` batch. Other workers whose URL is in that batch wait for
+    it; the rest are not blocked by it. Snapshots are dropped once taken, so only
+    about one batch per worker is held in memory.
+    """
+
+    def __init__(self, analyzer: Any, urls: list[str], batch_size: int):
+        self.analyzer = analyzer
+        self.batch_size = max(1, batch_size)
+        self._unfetched = list(dict.fromkeys(url for url in urls if url))
+        # URL -> the batch fetching (or holding) its snapshot, resolving to {url: snapshot}
+        self._batches: dict[str, Future] = {}
+        self._lock = threading.Lock()
+
+    def take(self, url: str) -> "RepoSnapshot | dict[str, Any]":
+        with self._lock:
+            batch = self._batches.pop(url, None)
+            fetch = batch is None
+            if fetch:
+                others = [other for other in self._unfetched if other != url]
+                urls = [url, *others[: self.batch_size - 1]]
+                self._unfetched = [other for other in self._unfetched if other not in urls]
+                batch = Future()
+                self._batches.update(dict.fromkeys(urls[1:], batch))
+        if fetch:
+            try:
+                targets = [self.analyzer.extract_repo_info(other) for other in urls]
+                batch.set_result(dict(zip(urls, self.analyzer.get_snapshots(targets), strict=True)))
+            except BaseException as e:
+                batch.set_exception(e)
+        return batch.result().pop(url)
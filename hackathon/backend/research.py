@@ -16,14 +16,22 @@ from typing import Any
 from dotenv import load_dotenv
 
 from hackathon.backend.config import (
+    GITHUB_GRAPHQL_BATCH_SIZE,
     GITHUB_TOKEN,
     HACKATHON_DB_PATH,
     OPENROUTER_API_KEY,
     RESEARCH_CACHE_DIR,
     RESEARCH_CACHE_EXPIRY_HOURS,
+    RESEARCH_INGEST_CONCURRENCY,
 )
 from hackathon.backend.github_analyzer import GitHubAnalyzer
+from hackathon.backend.llm_cache import get_default_cache
+from hackathon.backend.llm_client import LLMClient
+from hackathon.backend.llm_latency import get_hedge_policy
+from hackathon.backend.llm_telemetry import get_telemetry_recorder
+from hackathon.backend.repo_snapshot import SnapshotPrefetcher
 from hackathon.backend.schema import LATEST_SUBMISSION_VERSION, get_fields
+from hackathon.backend.stage_pipeline import Stage, StageError, StagePipeline
 from hackathon.prompts.research_prompts import create_research_prompt
 
 # Load environment variables
@@ -34,7 +42,6 @@ logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(
 logger = logging.getLogger(__name__)
 
 # OpenRouter API configuration
-BASE_URL = "https://openrouter.ai/api/v1/chat/completions"
 MODEL = "perplexity/sonar-reasoning-pro:online"
 
 # In all research prompt and logic, use get_v2_fields_from_schema() for field access and validation.
@@ -69,7 +76,7 @@ def basic_research_cleanup(ai_research: dict[str, Any]) -> dict[str, Any]:
 
 
 class HackathonResearcher:
-    def __init__(self, db_path=None, version=None, force: bool = False):
+    def __init__(self, db_path=None, version=None, force: bool = False, llm_cache: bool = True, hedge: bool = False):
         """Initialize researcher with API keys, cache directory, DB path, and version.
 
         Parameters
@@ -80,10 +87,13 @@ class HackathonResearcher:
             Submission schema version (e.g., 'v2')
         force: bool
             If True, bypass cached research results and recompute
+        llm_cache: bool
+            If False, bypass the persistent LLM response cache as well
+        hedge: bool
+            If True, duplicate LLM requests still pending at the run's p90 latency
         """
         if not OPENROUTER_API_KEY:
             raise ValueError("OPENROUTER_API_KEY not found in environment variables")
-        self.github_analyzer = GitHubAnalyzer(GITHUB_TOKEN)
         self.cache_dir = Path(RESEARCH_CACHE_DIR)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
         self.db_path = db_path or HACKATHON_DB_PATH
@@ -91,19 +101,20 @@ class HackathonResearcher:
         self.table = f"hackathon_submissions_{self.version}"
         self.force = force
         self.fields = get_fields(self.version)
-        # HTTP session with retry/timeout
-        from hackathon.backend.http_client import create_session
-
-        self.session = create_session()
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-                "Content-Type": "application/json",
-                "HTTP-Referer": "https://github.com/m3-org/clanktank",
-                "X-Title": "Clank Tank Hackathon Research",
-            }
+        self.llm = LLMClient(
+            cache=get_default_cache(llm_cache),
+            api_key=OPENROUTER_API_KEY,
+            title="Clank Tank Hackathon Research",
+            stage="research",
+            hedge=get_hedge_policy(hedge),
         )
-        self.headers = dict(self.session.headers)
+        # Per-call telemetry; GitIngest recommendations share this client and are tagged "gitingest"
+        telemetry = get_telemetry_recorder(self.db_path)
+        if telemetry is not None:
+            self.llm.add_hook(telemetry)
+        self.github_analyzer = GitHubAnalyzer(GITHUB_TOKEN, llm_client=self.llm)
+        # Set by research_all_pending in GraphQL mode: snapshots fetched several repositories per query
+        self._prefetcher = None
 
     def _get_cache_path(self, submission_id: str) -> Path:
         """Get cache file path for a submission."""
@@ -156,6 +167,23 @@ class HackathonResearcher:
         # Delegate to the latest prompt builder which also trims content safely
         return create_research_prompt(project_data, github_analysis, gitingest_content)
 
+    @staticmethod
+    def _json_text(content: str) -> str:
+        """Extract JSON from markdown code blocks if present."""
+        if "```json" in content:
+            json_start = content.find("```json") + 7
+            json_end = content.find("```", json_start)
+            if json_end == -1:  # No closing ```
+                json_end = len(content)
+            content = content[json_start:json_end].strip()
+        elif "```" in content and "{" in content:
+            # Handle case where JSON is in code block without 'json' label
+            start_brace = content.find("{")
+            end_brace = content.rfind("}")
+            if start_brace != -1 and end_brace != -1 and end_brace > start_brace:
+                content = content[start_brace : end_brace + 1]
+        return content
+
     def conduct_ai_research(
         self, project_data: dict[str, Any], github_analysis: dict[str, Any], gitingest_path: str | None = None
     ) -> dict[str, Any]:
@@ -177,34 +205,21 @@ class HackathonResearcher:
 
         try:
             logger.info(f"Conducting AI research for {project_data['project_name']}")
-            response = self.session.post(BASE_URL, json=payload, timeout=self.session.timeout)
-            response.raise_for_status()
-
-            result = response.json()
+            result = self.llm.chat(
+                payload, validate=lambda r: json.loads(self._json_text(r["choices"][0]["message"]["content"]))
+            )
             content = result["choices"][0]["message"]["content"]
 
             # Try to parse as JSON, fallback to raw content
             try:
-                # Extract JSON from markdown code blocks if present
-                if "```json" in content:
-                    json_start = content.find("```json") + 7
-                    json_end = content.find("```", json_start)
-                    if json_end == -1:  # No closing ```
-                        json_end = len(content)
-                    content = content[json_start:json_end].strip()
-                elif "```" in content and "{" in content:
-                    # Handle case where JSON is in code block without 'json' label
-                    start_brace = content.find("{")
-                    end_brace = content.rfind("}")
-                    if start_brace != -1 and end_brace != -1 and end_brace > start_brace:
-                        content = content[start_brace : end_brace + 1]
-
+                content = self._json_text(content)
                 parsed_json = json.loads(content)
                 logger.info("Successfully parsed AI response as JSON")
                 return parsed_json
             except json.JSONDecodeError as e:
                 logger.warning(f"Could not parse AI response as JSON: {e}")
                 logger.warning(f"Raw content (first 500 chars): {content[:500]}")
+                self.llm.invalidate(payload)
 
                 # Try to extract at least some structured data from the response
                 fallback_structure = {
@@ -233,6 +248,11 @@ class HackathonResearcher:
         if cached_results:
             return cached_results
 
+        job = self._analyze_github(self._load_project(submission_id))
+        return self._write_research(self._run_ai_research(self._run_ingest(job)))
+
+    def _load_project(self, submission_id: str) -> dict[str, Any]:
+        """Research job for ``submission_id``: its submission row as ``project_data``."""
         # Get submission data from database
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
@@ -246,41 +266,67 @@ class HackathonResearcher:
         if not row:
             raise ValueError(f"Submission {submission_id} not found")
 
-        project_data = dict(row)
-        github_url = project_data.get("github_url")
+        return {"submission_id": submission_id, "project_data": dict(row)}
 
+    def _analyze_github(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Stage 1: GitHub REST metadata (plus the GitIngest settings recommendation)."""
+        github_url = job["project_data"].get("github_url")
         if not github_url:
-            logger.warning(f"No GitHub URL for submission {submission_id}")
-            github_analysis = {"error": "No GitHub URL provided"}
-            gitingest_path = None
+            logger.warning(f"No GitHub URL for submission {job['submission_id']}")
+            job["github_analysis"] = {"error": "No GitHub URL provided"}
         else:
             # Perform GitHub analysis
             logger.info(f"Analyzing GitHub repository: {github_url}")
-            github_analysis = self.github_analyzer.analyze_repository(github_url)
-
-            # Run GitIngest with dynamic settings - prefer agentic recommendation
-            gitingest_settings = github_analysis.get("gitingest_agentic_recommendation")
-            if not gitingest_settings:
-                logger.info("No agentic recommendation available, falling back to basic settings")
-                gitingest_settings = github_analysis.get("gitingest_settings", {})
-
-            # Use GitHubAnalyzer's secure GitIngest method
-            output_file = f"gitingest-{submission_id}.txt"
-            cache_path = Path(RESEARCH_CACHE_DIR) / output_file
-            gitingest_path = self.github_analyzer.run_gitingest_secure(github_url, str(cache_path), gitingest_settings)
+            if self._prefetcher is not None:
+                snapshot = self._prefetcher.take(github_url)
+            else:
+                snapshot = self.github_analyzer.snapshot_for_url(github_url)
+            job["github_analysis"] = self.github_analyzer.analyze_repository(github_url, snapshot=snapshot)
+            # Reused by the ingest stage to size the GitIngest output
+            job["snapshot"] = None if isinstance(snapshot, dict) else snapshot
+        return job
+
+    def _run_ingest(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Stage 2: GitIngest download of the repository into the research cache."""
+        github_url = job["project_data"].get("github_url")
+        job["gitingest_path"] = None
+        if not github_url:
+            return job
+
+        # Run GitIngest with dynamic settings - prefer agentic recommendation
+        github_analysis = job["github_analysis"]
+        gitingest_settings = github_analysis.get("gitingest_agentic_recommendation")
+        if not gitingest_settings:
+            logger.info("No agentic recommendation available, falling back to basic settings")
+            gitingest_settings = github_analysis.get("gitingest_settings", {})
+
+        # Use GitHubAnalyzer's secure GitIngest method
+        output_file = f"gitingest-{job['submission_id']}.txt"
+        cache_path = Path(RESEARCH_CACHE_DIR) / output_file
+        job["gitingest_path"] = self.github_analyzer.run_gitingest_secure(
+            github_url, str(cache_path), gitingest_settings, snapshot=job.get("snapshot")
+        )
+        return job
 
+    def _run_ai_research(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Stage 3: the LLM research call."""
         # Conduct AI research
-        ai_research = self.conduct_ai_research(project_data, github_analysis, gitingest_path)
+        ai_research = self.conduct_ai_research(job["project_data"], job["github_analysis"], job["gitingest_path"])
 
         # Basic cleanup without forcing schema
-        ai_research = basic_research_cleanup(ai_research)
+        job["ai_research"] = basic_research_cleanup(ai_research)
+        return job
+
+    def _write_research(self, job: dict[str, Any]) -> dict[str, Any]:
+        """Stage 4: DB upsert, research cache file and audit entry."""
+        submission_id = job["submission_id"]
 
         # Compile final results
         research_results = {
             "submission_id": submission_id,
-            "github_analysis": github_analysis,
-            "ai_research": ai_research,
-            "gitingest_output_path": gitingest_path,
+            "github_analysis": job["github_analysis"],
+            "ai_research": job["ai_research"],
+            "gitingest_output_path": job["gitingest_path"],
             "researched_at": datetime.now().isoformat(),
         }
 
@@ -298,8 +344,94 @@ class HackathonResearcher:
         logger.info(f"Research completed for submission {submission_id}")
         return research_results
 
-    def research_all_pending(self) -> list[dict[str, Any]]:
-        """Research all submissions that don't have research data yet."""
+    def research_all_pending(self, concurrency: int = 1) -> list[dict[str, Any]]:
+        """Research all submissions that don't have research data yet.
+
+        With ``concurrency`` > 1 the work runs as a staged pipeline: GitHub
+        metadata, ingest, LLM research and the DB write each have their own
+        worker pool and a bounded hand-off queue, so one submission's repo
+        download overlaps another's GitHub calls and a third's LLM wait.
+        GitHub and LLM stages get ``concurrency`` workers, ingest at most
+        ``RESEARCH_INGEST_CONCURRENCY``, and a single writer keeps SQLite
+        writes serialized.
+        """
+        pending_ids = self.pending_research_ids()
+        logger.info(f"Found {len(pending_ids)} submissions pending research")
+
+        self._prefetcher = self._snapshot_prefetcher(pending_ids)
+        try:
+            return self._research_ids(pending_ids, concurrency)
+        finally:
+            self._prefetcher = None
+
+    def _snapshot_prefetcher(self, submission_ids: list[Any]) -> SnapshotPrefetcher | None:
+        """In GraphQL mode, a prefetcher over the uncached submissions' repositories."""
+        if not self.github_analyzer.use_graphql:
+            return None
+        uncached = [sid for sid in submission_ids if not self._is_cache_valid(self._get_cache_path(sid))]
+        if not uncached:
+            return None
+        conn = sqlite3.connect(self.db_path)
+        try:
+            placeholders = ", ".join("?" for _ in uncached)
+            rows = dict(
+                conn.execute(
+                    f"SELECT submission_id, github_url FROM {self.table} WHERE submission_id IN ({placeholders})",
+                    uncached,
+                ).fetchall()
+            )
+        finally:
+            conn.close()
+        urls = [rows.get(sid) for sid in uncached]
+        return SnapshotPrefetcher(self.github_analyzer, urls, GITHUB_GRAPHQL_BATCH_SIZE)
+
+    def _research_ids(self, pending_ids: list[Any], concurrency: int) -> list[dict[str, Any]]:
+        if concurrency <= 1:
+            results = []
+            for submission_id in pending_ids:
+                try:
+                    result = self.research_submission(submission_id)
+                    results.append(result)
+                except Exception as e:
+                    logger.error(f"Failed to research submission {submission_id}: {e}")
+                    results.append({"submission_id": submission_id, "error": str(e)})
+            self._log_http_cache()
+            return results
+
+        # Cache hits skip the pipeline entirely
+        by_id: dict[Any, dict[str, Any]] = {}
+        to_research = []
+        for submission_id in pending_ids:
+            cached = self._load_from_cache(submission_id)
+            if cached:
+                by_id[submission_id] = cached
+            else:
+                to_research.append(submission_id)
+
+        pipeline = StagePipeline(
+            [
+                Stage("github", lambda sid: self._analyze_github(self._load_project(sid)), concurrency),
+                Stage("ingest", self._run_ingest, min(concurrency, RESEARCH_INGEST_CONCURRENCY)),
+                Stage("llm", self._run_ai_research, concurrency),
+                Stage("write", self._write_research, 1),
+            ]
+        )
+        for submission_id, outcome in zip(to_research, pipeline.run(to_research), strict=True):
+            if isinstance(outcome, StageError):
+                by_id[submission_id] = {"submission_id": submission_id, "error": str(outcome.error)}
+            elif outcome is not None:
+                by_id[submission_id] = outcome
+        logger.info(pipeline.report())
+        self._log_http_cache()
+
+        return [by_id[submission_id] for submission_id in pending_ids if submission_id in by_id]
+
+    def _log_http_cache(self) -> None:
+        if self.github_analyzer.http_cache is not None:
+            logger.info(self.github_analyzer.http_cache.summary())
+
+    def pending_research_ids(self) -> list[Any]:
+        """Submission ids without research (every submission with force)."""
         conn = sqlite3.connect(self.db_path)
         conn.row_factory = sqlite3.Row
         cursor = conn.cursor()
@@ -321,19 +453,7 @@ class HackathonResearcher:
         cursor.execute(query)
         pending_ids = [row[0] for row in cursor.fetchall()]
         conn.close()
-
-        logger.info(f"Found {len(pending_ids)} submissions pending research")
-
-        results = []
-        for submission_id in pending_ids:
-            try:
-                result = self.research_submission(submission_id)
-                results.append(result)
-            except Exception as e:
-                logger.error(f"Failed to research submission {submission_id}: {e}")
-                results.append({"submission_id": submission_id, "error": str(e)})
-
-        return results
+        return pending_ids
 
     def _update_submission_research(self, submission_id: str, research_data: dict[str, Any]):
         """Insert or update research results in hackathon_research table."""
@@ -0,0 +1,229 @@
+#!/usr/bin/env python3
+"""Cohort-wide judge calibration of ``hackathon_scores`` (optional NumPy dependency).
+
+``renormalize_scores`` rescales one judge's four criteria for one submission,
+so it cannot tell a lenient judge from a strong project. This pass loads a
+round's scores as a ``submissions x judges x criteria`` array and removes
+each judge's leniency per criterion in one vectorized step:
+
+- ``zscore``: a judge's scores are standardized against that judge's own mean
+  and spread, then mapped onto the cohort's mean and spread for the criterion.
+- ``quantile``: a judge's scores are replaced by the cohort score at the same
+  percentile (mid-rank, so tied raw scores stay tied).
+
+Calibrated criteria are weighted with the judge's weights and written to
+``hackathon_scores.calibrated_total`` in one transaction. Raw scores and
+``weighted_total`` are left untouched. Judge/criterion columns with fewer than
+``min_samples`` scores keep their raw values.
+
+Usage:
+    pip install 'clanktank[calibration]'
+    python -m hackathon.backend.score_calibration --round 1 --method zscore
+"""
+
+import argparse
+import logging
+import sqlite3
+import sys
+import time
+import warnings
+from typing import Any
+
+try:
+    import numpy as np
+except ImportError:  # optional: pip install 'clanktank[calibration]'
+    np = None
+
+from hackathon.backend.config import HACKATHON_DB_PATH, SCORE_CALIBRATION_METHOD, SCORE_CALIBRATION_MIN_SAMPLES
+from hackathon.prompts.judge_personas import JUDGE_WEIGHTS
+
+logger = logging.getLogger(__name__)
+
+CRITERIA = ("innovation", "technical_execution", "market_potential", "user_experience")
+CALIBRATION_METHODS = ("zscore", "quantile")
+
+
+def _require_numpy() -> None:
+    if np is None:
+        raise RuntimeError("Score calibration needs NumPy: pip install 'clanktank[calibration]'")
+
+
+def ensure_calibrated_column(cursor: sqlite3.Cursor) -> None:
+    """Add ``hackathon_scores.calibrated_total`` to databases created before it existed."""
+    columns = {row[1] for row in cursor.execute("PRAGMA table_info(hackathon_scores)")}
+    if "calibrated_total" not in columns:
+        cursor.execute("ALTER TABLE hackathon_scores ADD COLUMN calibrated_total REAL")
+
+
+def _zscore(scores, counts, cohort):
+    mean = np.nanmean(scores, axis=0)
+    std = np.nanstd(scores, axis=0)
+    cohort_mean = np.nanmean(cohort, axis=(0, 1))
+    cohort_std = np.nanstd(cohort, axis=(0, 1))
+    # A judge who gave every project the same score has no spread to rescale; centre it only
+    z = np.divide(scores - mean, std, out=np.zeros_like(scores), where=std > 0)
+    return cohort_mean + z * cohort_std
+
+
+def _quantile(scores, counts, cohort):
+    n_subs, n_judges, n_criteria = scores.shape
+    columns = scores.reshape(n_subs, -1)
+    n_columns = columns.shape[1]
+
+    # Shift every judge/criterion column into its own band so one sort + searchsorted ranks them all;
+    # missing scores sort to the end of their band and are masked out by the caller
+    finite = columns[~np.isnan(columns)]
+    low = finite.min() if finite.size else 0.0
+    band = (finite.max() - low if finite.size else 0.0) + 2
+    keys = np.where(np.isnan(columns), band - 1, columns - low) + np.arange(n_columns) * band
+    ordered = np.sort(keys, axis=None)
+    left = np.searchsorted(ordered, keys, side="left")
+    right = np.searchsorted(ordered, keys, side="right")
+    below = left - np.arange(n_columns) * n_subs
+    # Mid-rank percentile: tied raw scores land on the same cohort score
+    percentile = (below + 0.5 * (right - left)) / np.maximum(counts.reshape(-1), 1)
+
+    calibrated = np.empty_like(columns)
+    for criterion in range(n_criteria):
+        pool = cohort[:, :, criterion]
+        pool = np.sort(pool[~np.isnan(pool)])
+        if pool.size == 0:
+            calibrated[:, criterion::n_criteria] = np.nan
+            continue
+        # Cohort score at each percentile (linear interpolation between order statistics)
+        positions = np.clip(percentile[:, criterion::n_criteria] * pool.size - 0.5, 0, pool.size - 1)
+        calibrated[:, criterion::n_criteria] = np.interp(positions, np.arange(pool.size), pool)
+    return calibrated.reshape(n_subs, n_judges, n_criteria)
+
+
+def calibrate_matrix(scores, method: str = "zscore", min_samples: int = 5):
+    """Calibrated copy of a ``submissions x judges x criteria`` array (NaN = no score).
+
+    Columns with fewer than ``min_samples`` scores are returned unchanged.
+    Results are clipped to the 0-10 score scale.
+    """
+    _require_numpy()
+    if method not in CALIBRATION_METHODS:
+        raise ValueError(f"Unknown calibration method {method!r}; expected one of {CALIBRATION_METHODS}")
+    scores = np.asarray(scores, dtype=float)
+    counts = np.sum(~np.isnan(scores), axis=0)
+    enough = counts >= max(min_samples, 2)
+    # The cohort each criterion is mapped onto: every score from judges with enough samples
+    cohort = np.where(enough, scores, np.nan)
+
+    with warnings.catch_warnings():
+        # Empty judge/criterion columns yield NaN statistics; they are masked out below
+        warnings.simplefilter("ignore", RuntimeWarning)
+        calibrated = (_zscore if method == "zscore" else _quantile)(scores, counts, cohort)
+    calibrated = np.where(enough & ~np.isnan(scores), np.clip(calibrated, 0, 10), scores)
+    return calibrated
+
+
+def _weights(judges: list[str]):
+    """``judges x criteria`` weight matrix; a judge without configured weights counts each criterion once."""
+    rows = []
+    for judge in judges:
+        weights = JUDGE_WEIGHTS.get(judge) or dict.fromkeys(CRITERIA, 1.0)
+        rows.append([weights.get(criterion, 0.0) for criterion in CRITERIA])
+    return np.array(rows, dtype=float)
+
+
+def calibrate_round(
+    db_path: str | None = None,
+    round_num: int = 1,
+    method: str = "zscore",
+    min_samples: int = 5,
+) -> dict[str, Any]:
+    """Calibrate every score row of ``round_num`` and bulk-write ``calibrated_total``.
+
+    Returns a summary: rows updated, submissions and judges in the cohort,
+    each judge's mean raw and calibrated total, and elapsed seconds.
+    """
+    _require_numpy()
+    start = time.monotonic()
+    conn = sqlite3.connect(db_path or HACKATHON_DB_PATH, timeout=30)
+    try:
+        cursor = conn.cursor()
+        ensure_calibrated_column(cursor)
+        rows = cursor.execute(
+            f"SELECT id, submission_id, judge_name, {', '.join(CRITERIA)} FROM hackathon_scores WHERE round = ?",
+            (round_num,),
+        ).fetchall()
+        if not rows:
+            conn.commit()
+            return {"rows": 0, "submissions": 0, "judges": {}, "seconds": round(time.monotonic() - start, 3)}
+
+        ids = np.array([row[0] for row in rows], dtype=np.int64)
+        submission_keys = np.array([str(row[1]) for row in rows])
+        judge_keys = np.array([str(row[2]) for row in rows])
+        values = np.array([row[3:] for row in rows], dtype=float)  # None -> nan
+
+        submissions, sub_index = np.unique(submission_keys, return_inverse=True)
+        judges, judge_index = np.unique(judge_keys, return_inverse=True)
+        matrix = np.full((len(submissions), len(judges), len(CRITERIA)), np.nan)
+        matrix[sub_index, judge_index] = values
+
+        calibrated = calibrate_matrix(matrix, method=method, min_samples=min_samples)
+        weights = _weights(list(judges))
+        raw_totals = np.sum(values * weights[judge_index], axis=1)
+        totals = np.round(np.sum(calibrated[sub_index, judge_index] * weights[judge_index], axis=1), 2)
+
+        complete = ~np.isnan(totals)
+        updates = list(zip(totals[complete].tolist(), ids[complete].tolist(), strict=True))
+        cursor.executemany("UPDATE hackathon_scores SET calibrated_total = ? WHERE id = ?", updates)
+        conn.commit()
+    finally:
+        conn.close()
+
+    summary = {}
+    for j, judge in enumerate(judges):
+        mask = (judge_index == j) & complete
+        if mask.any():
+            summary[str(judge)] = {
+                "scores": int(mask.sum()),
+                "raw_mean": round(float(raw_totals[mask].mean()), 2),
+                "calibrated_mean": round(float(totals[mask].mean()), 2),
+            }
+    return {
+        "rows": len(updates),
+        "submissions": len(submissions),
+        "judges": summary,
+        "seconds": round(time.monotonic() - start, 3),
+    }
+
+
+def main():
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+    parser = argparse.ArgumentParser(description="Calibrate judge scores across the whole cohort")
+    parser.add_argument("--db-file", default=None, help="Database path (default: HACKATHON_DB_PATH)")
+    parser.add_argument("--round", type=int, default=1, help="Scoring round to calibrate (default: 1)")
+    parser.add_argument(
+        "--method", choices=CALIBRATION_METHODS, default=SCORE_CALIBRATION_METHOD, help="Calibration method"
+    )
+    parser.add_argument(
+        "--min-samples",
+        type=int,
+        default=SCORE_CALIBRATION_MIN_SAMPLES,
+        help="Scores a judge needs on a criterion before it is calibrated",
+    )
+    args = parser.parse_args()
+
+    if np is None:
+        parser.error("score calibration needs NumPy: pip install 'clanktank[calibration]'")
+    try:
+        result = calibrate_round(args.db_file, args.round, method=args.method, min_samples=args.min_samples)
+    except sqlite3.OperationalError as e:
+        logger.error(f"Calibration failed: {e}")
+        sys.exit(1)
+    logger.info(
+        f"Calibrated {result['rows']} Round {args.round} score(s) across {result['submissions']} submission(s) "
+        f"with {args.method} in {result['seconds']:.3f}s"
+    )
+    for judge, stats in result["judges"].items():
+        logger.info(
+            f"  {judge}: {stats['scores']} score(s), mean total {stats['raw_mean']:.2f} -> {stats['calibrated_mean']:.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""In-memory index of a round's score distribution for Round 2 comparative reasoning.
+
+Built once per synthesis run from a single query; rank, percentile and
+"similar projects" lookups are then bisects over a sorted score array instead
+of a fresh JOIN + notes parse for every project.
+"""
+
+import json
+import sqlite3
+import statistics
+from bisect import bisect_left, bisect_right
+from itertools import accumulate
+from typing import Any
+
+CRITICISM_MARKERS = ("but", "however", "concern")
+STRENGTH_MARKERS = ("good", "strong", "impressive", "solid")
+
+
+def _reason_snippets(judges: dict[str, dict[str, Any]], markers: tuple[str, ...]) -> list[str]:
+    """Pull ``criterion: reason`` lines whose text contains any of ``markers``."""
+    snippets = []
+    for judge_data in judges.values():
+        reasons = judge_data.get("notes", {}).get("reasons", {})
+        if not isinstance(reasons, dict):
+            continue
+        for criterion, reason in reasons.items():
+            text = str(reason).lower()
+            if any(marker in text for marker in markers):
+                snippets.append(f"{criterion}: {reason}")
+    return snippets
+
+
+class ScoreDistribution:
+    """Ranked per-project averages plus sorted arrays for O(log n) comparisons."""
+
+    def __init__(self, projects: dict[str, dict[str, Any]], all_scores: list[float]):
+        # Highest average first; ties keep query order, matching the historical rankings
+        ranked = sorted(projects.items(), key=lambda x: x[1]["avg_score"], reverse=True)
+        self.projects = dict(ranked)
+        self.rankings = [(pid, data["project_name"], data["avg_score"]) for pid, data in ranked]
+        self._rank = {pid: i + 1 for i, (pid, _, _) in enumerate(self.rankings)}
+
+        ascending = list(reversed(self.rankings))
+        self._ids_asc = [pid for pid, _, _ in ascending]
+        self._scores_asc = [score for _, _, score in ascending]
+        self._prefix = [0.0, *accumulate(self._scores_asc)]
+
+        self._criticisms = {pid: _reason_snippets(data["judges"], CRITICISM_MARKERS) for pid, data in ranked}
+        self._strengths = {pid: _reason_snippets(data["judges"], STRENGTH_MARKERS) for pid, data in ranked}
+
+        self.stats = {}
+        if all_scores:
+            self.stats = {
+                "mean": statistics.mean(all_scores),
+                "median": statistics.median(all_scores),
+                "std_dev": statistics.stdev(all_scores) if len(all_scores) > 1 else 0,
+                "min": min(all_scores),
+                "max": max(all_scores),
+                "total_projects": len(projects),
+                "score_ranges": {
+                    "excellent": len([s for s in all_scores if s >= 32]),  # 8+ avg
+                    "good": len([s for s in all_scores if 24 <= s < 32]),  # 6-8 avg
+                    "average": len([s for s in all_scores if 16 <= s < 24]),  # 4-6 avg
+                    "poor": len([s for s in all_scores if s < 16]),  # <4 avg
+                },
+            }
+
+    @classmethod
+    def from_rows(cls, rows) -> "ScoreDistribution":
+        """Build from ``(submission_id, project_name, category, judge_name, innovation,
+        technical_execution, market_potential, user_experience, weighted_total, notes)`` rows."""
+        projects: dict[str, dict[str, Any]] = {}
+        all_scores = []
+
+        for (
+            submission_id,
+            project_name,
+            category,
+            judge_name,
+            innovation,
+            technical,
+            market,
+            experience,
+            weighted_total,
+            notes,
+        ) in rows:
+            if submission_id not in projects:
+                projects[submission_id] = {
+                    "project_name": project_name,
+                    "category": category,
+                    "judges": {},
+                    "avg_score": 0,
+                    "score_variance": 0,
+                }
+
+            try:
+                judge_notes = json.loads(notes) if notes else {}
+            except Exception:
+                judge_notes = {"raw": notes}
+            if not isinstance(judge_notes, dict):
+                judge_notes = {"raw": judge_notes}
+
+            projects[submission_id]["judges"][judge_name] = {
+                "innovation": innovation,
+                "technical_execution": technical,
+                "market_potential": market,
+                "user_experience": experience,
+                "weighted_total": weighted_total,
+                "notes": judge_notes,
+            }
+            all_scores.append(weighted_total)
+
+        for data in projects.values():
+            judge_scores = [judge["weighted_total"] for judge in data["judges"].values()]
+            data["avg_score"] = statistics.mean(judge_scores)
+            data["score_variance"] = statistics.variance(judge_scores) if len(judge_scores) > 1 else 0
+
+        return cls(projects, all_scores)
+
+    @classmethod
+    def from_db(cls, db_path: str, table: str, round_num: int = 1) -> "ScoreDistribution":
+        """Load every judge score for ``round_num`` in one query."""
+        conn = sqlite3.connect(db_path, timeout=30)
+        try:
+            rows = conn.execute(
+                f"""
+                SELECT
+                    s.submission_id,
+                    s.project_name,
+                    s.category,
+                    sc.judge_name,
+                    sc.innovation,
+                    sc.technical_execution,
+                    sc.market_potential,
+                    sc.user_experience,
+                    sc.weighted_total,
+                    sc.notes
+                FROM hackathon_scores sc
+                JOIN {table} s ON sc.submission_id = s.submission_id
+                WHERE sc.round = ?
+                ORDER BY sc.weighted_total DESC
+                """,
+                (round_num,),
+            ).fetchall()
+        finally:
+            conn.close()
+        return cls.from_rows(rows)
+
+    def __len__(self) -> int:
+        return len(self.projects)
+
+    def __contains__(self, project_id: str) -> bool:
+        return project_id in self.projects
+
+    def rank(self, project_id: str) -> int | None:
+        return self._rank.get(project_id)
+
+    def count_above(self, score: float) -> int:
+        return len(self._scores_asc) - bisect_right(self._scores_asc, score)
+
+    def count_below(self, score: float) -> int:
+        return bisect_left(self._scores_asc, score)
+
+    def mean_above(self, score: float) -> float | None:
+        """Average of all project scores strictly greater than ``score``."""
+        start = bisect_right(self._scores_asc, score)
+        count = len(self._scores_asc) - start
+        if not count:
+            return None
+        return (self._prefix[-1] - self._prefix[start]) / count
+
+    def percentile(self, project_id: str) -> float:
+        """Share of projects scoring strictly lower, as 0-100."""
+        if not self.projects:
+            return 0
+        return self.count_below(self.projects[project_id]["avg_score"]) / len(self.projects) * 100
+
+    def similar(self, project_id: str, window: float = 2.0) -> list[str]:
+        """Other projects whose average is within ``±window`` of this one's."""
+        score = self.projects[project_id]["avg_score"]
+        lo = bisect_left(self._scores_asc, score - window)
+        hi = bisect_right(self._scores_asc, score + window)
+        return [pid for pid in self._ids_asc[lo:hi] if pid != project_id]
+
+    def criticisms_from_top(self, score: float, limit: int = 3) -> list[str]:
+        """Criticism snippets from the top ``limit`` projects ranked above ``score``."""
+        better = self.count_above(score)
+        return [s for pid, _, _ in self.rankings[: min(limit, better)] for s in self._criticisms[pid]]
+
+    def strengths_from_bottom(self, score: float, limit: int = 3) -> list[str]:
+        """Strength snippets from the bottom ``limit`` projects ranked below ``score``."""
+        worse = self.count_below(score)
+        start = len(self.rankings) - min(limit, worse)
+        return [s for pid, _, _ in self.rankings[start:] for s in self._strengths[pid]]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Legacy ``analyze_score_distribution`` shape."""
+        if not self.projects:
+            return {"error": "No scores found for this round"}
+        return {
+            "distribution_stats": self.stats,
+            "projects": self.projects,
+            "rankings": self.rankings,
+        }
@@ -0,0 +1,129 @@
+"""Bounded multi-stage worker pipeline for per-item work with distinct bottlenecks.
+
+Each stage has its own worker threads and a bounded input queue, so a stage
+runs only as far ahead as the next stage can absorb (backpressure) while
+different items are in different stages at the same time. Used by
+``clanktank research --all --concurrency N`` to overlap GitHub API calls,
+repository ingest, LLM research and the DB write across submissions.
+"""
+
+import logging
+import queue
+import threading
+import time
+from collections.abc import Callable, Iterable
+from typing import Any, NamedTuple
+
+logger = logging.getLogger(__name__)
+
+_DONE = object()
+
+
+class Stage(NamedTuple):
+    """``fn(value)`` run by ``workers`` threads; its return value is the next stage's input."""
+
+    name: str
+    fn: Callable[[Any], Any]
+    workers: int = 1
+
+
+class StageError(Exception):
+    """An item failed in ``stage``; the original exception is ``__cause__``."""
+
+    def __init__(self, stage: str, error: BaseException):
+        super().__init__(f"{stage}: {error}")
+        self.stage = stage
+        self.error = error
+
+
+class StagePipeline:
+    """Run every item through ``stages`` in order, with per-stage worker pools.
+
+    A stage's input queue holds at most ``queue_size`` items (default: its
+    worker count), so a fast upstream stage blocks instead of piling up
+    work. An item whose stage raises is dropped from later stages and
+    reported as a ``StageError``. Setting ``stop`` lets in-flight items
+    finish their current stage and skips everything else.
+    """
+
+    def __init__(self, stages: list[Stage], queue_size: int | None = None, stop: threading.Event | None = None):
+        if not stages:
+            raise ValueError("StagePipeline needs at least one stage")
+        self.stages = [stage._replace(workers=max(1, stage.workers)) for stage in stages]
+        self.queue_size = queue_size
+        self.stop = stop or threading.Event()
+        self.busy = {stage.name: 0.0 for stage in self.stages}
+        self._lock = threading.Lock()
+
+    def run(self, items: Iterable[Any]) -> list[Any]:
+        """Outcome per item, in input order: the last stage's return value, a ``StageError``,
+        or None if the item was skipped after ``stop``."""
+        items = list(items)
+        outcomes: list[Any] = [None] * len(items)
+        queues = [queue.Queue(maxsize=self.queue_size or stage.workers) for stage in self.stages]
+        remaining = [stage.workers for stage in self.stages]
+        threads = []
+
+        def work(index: int) -> None:
+            stage = self.stages[index]
+            inbox = queues[index]
+            outbox = queues[index + 1] if index + 1 < len(self.stages) else None
+            while (entry := inbox.get()) is not _DONE:
+                position, value = entry
+                if self.stop.is_set():
+                    continue
+                start = time.monotonic()
+                try:
+                    result = stage.fn(value)
+                except Exception as e:
+                    logger.error(f"Stage {stage.name} failed for item {items[position]!r}: {e}")
+                    error = StageError(stage.name, e)
+                    error.__cause__ = e
+                    outcomes[position] = error
+                    continue
+                finally:
+                    with self._lock:
+                        self.busy[stage.name] += time.monotonic() - start
+                if outbox is None:
+                    outcomes[position] = result
+                else:
+                    outbox.put((position, result))
+            # The last worker out tells every worker of the next stage there is no more input
+            with self._lock:
+                remaining[index] -= 1
+                last = remaining[index] == 0
+            if last and outbox is not None:
+                for _ in range(self.stages[index + 1].workers):
+                    outbox.put(_DONE)
+
+        for index, stage in enumerate(self.stages):
+            for n in range(stage.workers):
+                thread = threading.Thread(target=work, args=(index,), name=f"{stage.name}-{n}", daemon=True)
+                thread.start()
+                threads.append(thread)
+
+        try:
+            for position, item in enumerate(items):
+                if self.stop.is_set():
+                    break
+                queues[0].put((position, item))
+        except BaseException:
+            self.stop.set()
+            raise
+        finally:
+            for _ in range(self.stages[0].workers):
+                queues[0].put(_DONE)
+
+        try:
+            for thread in threads:
+                thread.join()
+        except BaseException:
+            # Ctrl-C: in-flight calls finish, nothing new starts
+            self.stop.set()
+            raise
+        return outcomes
+
+    def report(self) -> str:
+        """Busy seconds per stage; the busiest stage is the one to give more workers."""
+        parts = [f"{stage.name} {self.busy[stage.name]:.1f}s/{stage.workers}w" for stage in self.stages]
+        return f"Stage busy time: {', '.join(parts)}"
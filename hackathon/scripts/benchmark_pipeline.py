@@ -0,0 +1,260 @@
+#!/usr/bin/env python3
+"""End-to-end scoring and synthesis benchmark against the offline fake OpenRouter.
+
+Builds a throwaway database holding a synthetic cohort: researched submissions
+plus community reactions. It then starts ``hackathon.scripts.fake_openrouter``
+in-process and runs Round 1 scoring and Round 2 synthesis through
+``HackathonManager``, the same code path as the CLI. For each stage it reports
+submissions/sec, client-side LLM latency percentiles, and how long a writer
+waited for the SQLite write lock while the stage ran. No API key or network
+is needed.
+
+Usage:
+    python -m hackathon.scripts.benchmark_pipeline --submissions 50 --concurrency 8 --rps 0
+    python -m hackathon.scripts.benchmark_pipeline --submissions 200 --latency-median 2 --error-rate 0.05 --panel
+"""
+
+import argparse
+import json
+import logging
+import math
+import os
+import random
+import sqlite3
+import tempfile
+import threading
+import time
+
+from hackathon.backend.config import LLM_MAX_CONCURRENCY_PER_MODEL, LLM_RATE_LIMIT_BURST, LLM_RATE_LIMIT_RPS
+from hackathon.backend.create_db import create_hackathon_database
+from hackathon.backend.hackathon_manager import HackathonManager
+from hackathon.backend.llm_latency import LatencyTracker
+from hackathon.backend.rate_limit import ModelConcurrencyLimiter, TokenBucket
+from hackathon.scripts.fake_openrouter import add_server_args, server_from_args
+
+logger = logging.getLogger(__name__)
+
+CATEGORIES = ("DeFi", "Gaming", "AI/Agents", "Infrastructure", "Social", "Other")
+
+
+def _percentile(samples, q):
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    return ordered[max(0, math.ceil(q * len(ordered)) - 1)]
+
+
+class LockProbe:
+    """Sample write-lock contention by timing ``BEGIN IMMEDIATE`` on a separate connection.
+
+    Every ``interval`` seconds the probe asks for SQLite's write lock the
+    same way any writer in the pipeline does. The time it waits is the lock
+    wait a score or verdict commit would see at that moment.
+    """
+
+    def __init__(self, db_path: str, interval: float = 0.05):
+        self.db_path = db_path
+        self.interval = interval
+        self.waits: list[float] = []
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._run, name="lock-probe", daemon=True)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+    def _run(self):
+        conn = sqlite3.connect(self.db_path, timeout=30, isolation_level=None)
+        try:
+            while not self._stop.wait(self.interval):
+                start = time.monotonic()
+                conn.execute("BEGIN IMMEDIATE")
+                self.waits.append(time.monotonic() - start)
+                conn.execute("COMMIT")
+        finally:
+            conn.close()
+
+    def summary(self) -> dict:
+        return {
+            "probes": len(self.waits),
+            "total_s": round(sum(self.waits), 4),
+            "p99_ms": round(_percentile(self.waits, 0.99) * 1000, 2),
+            "max_ms": round(max(self.waits, default=0.0) * 1000, 2),
+        }
+
+
+def seed_cohort(db_path: str, submissions: int, seed: int | None = None) -> None:
+    """Create a database with ``submissions`` researched projects and a few reactions each."""
+    create_hackathon_database(db_path)
+    rng = random.Random(seed)
+    voters = [f"voter-{i}" for i in range(25)]
+    conn = sqlite3.connect(db_path, timeout=30)
+    try:
+        conn.executemany(
+            "INSERT INTO users (discord_id, username) VALUES (?, ?)",
+            [("owner", "benchmark-owner")] + [(voter, voter) for voter in voters],
+        )
+        for sid in range(1, submissions + 1):
+            conn.execute(
+                """
+                INSERT INTO hackathon_submissions_v2
+                (submission_id, status, owner_discord_id, project_name, discord_handle, category, description,
+                 github_url, demo_video_url, problem_solved, favorite_part)
+                VALUES (?, 'researched', 'owner', ?, 'benchmark-owner', ?, ?, ?, ?, ?, ?)
+                """,
+                (
+                    sid,
+                    f"Synthetic Project {sid}",
+                    rng.choice(CATEGORIES),
+                    f"Synthetic project {sid} for the offline pipeline benchmark. " * 4,
+                    f"https://github.com/example/project-{sid}",
+                    f"https://example.com/demo/{sid}.mp4",
+                    "Benchmarks the judging pipeline without a network.",
+                    "Watching the numbers go up.",
+                ),
+            )
+            github_analysis = {
+                "url": f"https://github.com/example/project-{sid}",
+                "stars": rng.randint(0, 500),
+                "forks": rng.randint(0, 50),
+                "language": rng.choice(("Python", "TypeScript", "Rust")),
+                "is_fork": False,
+                "file_structure": {"total_files": rng.randint(10, 400)},
+            }
+            market_research = {"market_analysis": {"score": rng.randint(3, 9), "notes": "Synthetic research."}}
+            technical_assessment = {
+                "technical_implementation": {"score": rng.randint(3, 9), "notes": "Synthetic research."},
+            }
+            conn.execute(
+                "INSERT INTO hackathon_research (submission_id, github_analysis, market_research, technical_assessment) "
+                "VALUES (?, ?, ?, ?)",
+                (sid, json.dumps(github_analysis), json.dumps(market_research), json.dumps(technical_assessment)),
+            )
+            conn.executemany(
+                "INSERT INTO likes_dislikes (discord_id, submission_id, action) VALUES (?, ?, ?)",
+                [
+                    (voter, str(sid), rng.choice(("like", "like", "dislike")))
+                    for voter in rng.sample(voters, rng.randint(0, 10))
+                ],
+            )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def run_benchmark(db_path: str, server, args) -> dict:
+    """Score then synthesize the cohort in ``db_path`` against ``server``; per-stage results."""
+    manager = HackathonManager(
+        db_path=db_path,
+        llm_cache=False,
+        parallel_judges=args.parallel_judges,
+        panel=args.panel,
+        api_key="offline-benchmark",
+    )
+    manager.llm.url = server.url
+    manager.llm.rate_limiter = TokenBucket(args.rps, max(args.rps, LLM_RATE_LIMIT_BURST))
+    manager.llm.model_limiter = ModelConcurrencyLimiter(args.per_model)
+
+    latencies = LatencyTracker(window=1_000_000)
+    errors: dict[str, int] = {}
+    phase = {"name": "score"}
+
+    def record(event):
+        if event["outcome"] == "ok":
+            latencies.observe(phase["name"], event["latency"])
+        elif event["outcome"] in ("error", "circuit_open"):
+            errors[phase["name"]] = errors.get(phase["name"], 0) + 1
+
+    manager.llm.add_hook(record)
+
+    results = {}
+    for name in ("score", "synthesize"):
+        phase["name"] = name
+        with LockProbe(db_path) as probe:
+            start = time.monotonic()
+            if name == "score":
+                outcome = manager.score_all_researched(1, concurrency=args.concurrency)
+                done, failed = outcome["scored"], outcome["failed"]
+            else:
+                conn = sqlite3.connect(db_path, timeout=30)
+                try:
+                    conn.execute("UPDATE hackathon_submissions_v2 SET status = 'community-voting'")
+                    conn.commit()
+                finally:
+                    conn.close()
+                outcome = manager.run_round2_synthesis(concurrency=args.concurrency)
+                done, failed = outcome["synthesized"], outcome["failed"]
+            elapsed = time.monotonic() - start
+        results[name] = {
+            "submissions": done,
+            "failed": failed,
+            "seconds": round(elapsed, 3),
+            "per_sec": round(done / elapsed, 3) if elapsed else 0.0,
+            "llm_calls": latencies.count(name),
+            "llm_errors": errors.get(name, 0),
+            "llm_p50_s": round(latencies.percentile(name, 0.5) or 0.0, 3),
+            "llm_p99_s": round(latencies.percentile(name, 0.99) or 0.0, 3),
+            "db_lock_wait": probe.summary(),
+        }
+    return results
+
+
+def print_report(results: dict, args, served: dict) -> None:
+    mode = "panel" if args.panel else ("parallel judges" if args.parallel_judges else "serial judges")
+    print(
+        f"\nPipeline benchmark: {args.submissions} submissions, concurrency {args.concurrency}, {mode}, "
+        f"rps {args.rps or 'unlimited'}, fake latency median {args.latency_median}s"
+    )
+    print(
+        f"{'stage':<12}{'subs':>6}{'fail':>6}{'wall s':>9}{'subs/s':>9}{'calls':>7}{'errors':>8}"
+        f"{'p50 s':>8}{'p99 s':>8}{'lock p99 ms':>13}{'lock total s':>14}"
+    )
+    for stage, r in results.items():
+        lock = r["db_lock_wait"]
+        print(
+            f"{stage:<12}{r['submissions']:>6}{r['failed']:>6}{r['seconds']:>9.2f}{r['per_sec']:>9.2f}"
+            f"{r['llm_calls']:>7}{r['llm_errors']:>8}{r['llm_p50_s']:>8.2f}{r['llm_p99_s']:>8.2f}"
+            f"{lock['p99_ms']:>13.2f}{lock['total_s']:>14.3f}"
+        )
+    print(f"\nFake server answered: {json.dumps(served, sort_keys=True)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline end-to-end scoring + synthesis benchmark")
+    parser.add_argument("--submissions", type=int, default=25, help="Synthetic cohort size (default: 25)")
+    parser.add_argument("--concurrency", type=int, default=4, help="Submissions processed at once (default: 4)")
+    parser.add_argument("--parallel-judges", action="store_true", help="Query the four judges concurrently")
+    parser.add_argument("--panel", action="store_true", help="One panel request per submission")
+    parser.add_argument(
+        "--rps", type=float, default=LLM_RATE_LIMIT_RPS, help="LLM requests/sec pacing, 0 = unpaced (default: env)"
+    )
+    parser.add_argument(
+        "--per-model", type=int, default=LLM_MAX_CONCURRENCY_PER_MODEL, help="In-flight cap per model (default: env)"
+    )
+    parser.add_argument("--db", default=None, help="Keep the synthetic database at this path (default: temp dir)")
+    parser.add_argument("--output", help="Write the results as JSON")
+    add_server_args(parser)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory(prefix="clanktank-bench-") as tmp:
+        db_path = args.db or os.path.join(tmp, "benchmark.db")
+        if os.path.exists(db_path):
+            parser.error(f"{db_path} already exists")
+        seed_cohort(db_path, args.submissions, args.seed)
+        with server_from_args(args) as server:
+            results = run_benchmark(db_path, server, args)
+            served = dict(server.counts)
+
+    print_report(results, args, served)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"settings": vars(args), "results": results}, f, indent=2)
+        print(f"Results saved to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
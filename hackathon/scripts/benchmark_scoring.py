@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+"""Benchmark per-judge scoring against panel scoring (one request for all judges).
+
+Dry runs (the default) only build the prompts and compare request count and
+prompt size. ``--live`` sends the real requests (LLM cache bypassed, nothing is
+written to the DB) and adds wall time plus provider-reported token usage.
+
+Usage:
+    python -m hackathon.scripts.benchmark_scoring --submission-id 12 --submission-id 13
+    python -m hackathon.scripts.benchmark_scoring --all --limit 5 --live
+"""
+
+import argparse
+import json
+import logging
+import sqlite3
+import time
+
+from hackathon.backend.hackathon_manager import JUDGES, HackathonManager
+from hackathon.backend.llm_client import content_text
+
+logger = logging.getLogger(__name__)
+
+MODES = ("per-judge", "panel")
+
+
+def _empty_totals():
+    return {
+        "requests": 0,
+        "prompt_chars": 0,
+        "prompt_tokens": 0,
+        "completion_tokens": 0,
+        "wall_seconds": 0.0,
+        "failures": 0,
+    }
+
+
+def _instrument(manager, calls):
+    """Record latency and usage for every LLM call the manager makes."""
+    chat = manager.llm.chat
+
+    def timed_chat(payload, **kwargs):
+        start = time.monotonic()
+        result = chat(payload, **kwargs)
+        calls.append(
+            {
+                "seconds": time.monotonic() - start,
+                "chars": sum(len(content_text(m["content"])) for m in payload["messages"]),
+                "usage": result.get("usage") or {},
+            }
+        )
+        return result
+
+    manager.llm.chat = timed_chat
+
+
+def _prompt_chars(manager, mode, project_data, research_data):
+    if mode == "panel":
+        return [len(manager.create_panel_scoring_prompt(JUDGES, project_data, research_data))]
+    return [len(manager.create_scoring_prompt(judge, project_data, research_data)) for judge in JUDGES]
+
+
+def benchmark(manager, submission_ids, live=False):
+    """Score each submission in both modes and return per-mode totals."""
+    results = {mode: _empty_totals() for mode in MODES}
+    calls = []
+    if live:
+        _instrument(manager, calls)
+
+    for submission_id in submission_ids:
+        project_data, research_data, _ = manager._load_scoring_inputs(submission_id, 1)
+        for mode in MODES:
+            totals = results[mode]
+            manager.panel = mode == "panel"
+
+            if not live:
+                chars = _prompt_chars(manager, mode, project_data, research_data)
+                totals["requests"] += len(chars)
+                totals["prompt_chars"] += sum(chars)
+                continue
+
+            calls.clear()
+            start = time.monotonic()
+            try:
+                manager._collect_judge_scores(project_data, research_data)
+            except Exception as e:
+                logger.warning(f"{mode} scoring failed for {submission_id}: {e}")
+                totals["failures"] += 1
+            totals["wall_seconds"] += time.monotonic() - start
+            totals["requests"] += len(calls)
+            totals["prompt_chars"] += sum(c["chars"] for c in calls)
+            totals["prompt_tokens"] += sum(c["usage"].get("prompt_tokens", 0) for c in calls)
+            totals["completion_tokens"] += sum(c["usage"].get("completion_tokens", 0) for c in calls)
+
+    return results
+
+
+def print_report(results, submissions, live):
+    print(f"\nScoring benchmark over {submissions} submission(s) ({'live' if live else 'dry run'})")
+    print(f"{'mode':<12}{'requests':>10}{'~prompt tok':>14}{'prompt tok':>12}{'compl tok':>11}{'wall s':>9}{'fail':>6}")
+    for mode, totals in results.items():
+        print(
+            f"{mode:<12}{totals['requests']:>10}{totals['prompt_chars'] // 4:>14}"
+            f"{totals['prompt_tokens']:>12}{totals['completion_tokens']:>11}"
+            f"{totals['wall_seconds']:>9.1f}{totals['failures']:>6}"
+        )
+
+    base, panel = results["per-judge"], results["panel"]
+    if panel["requests"] and panel["prompt_chars"]:
+        print(
+            f"\npanel vs per-judge: {base['requests'] / panel['requests']:.1f}x fewer requests, "
+            f"{base['prompt_chars'] / panel['prompt_chars']:.1f}x less prompt text"
+        )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark per-judge vs panel scoring")
+    parser.add_argument("--submission-id", action="append", default=[], help="Submission to benchmark (repeatable)")
+    parser.add_argument("--all", action="store_true", help="Benchmark researched/scored submissions")
+    parser.add_argument("--limit", type=int, default=5, help="Max submissions with --all (default: 5)")
+    parser.add_argument("--live", action="store_true", help="Send real LLM requests (costs tokens)")
+    parser.add_argument("--parallel-judges", action="store_true", help="Fan out per-judge requests in live mode")
+    parser.add_argument("--version", default="v2", choices=["v1", "v2"], help="Schema version (default: v2)")
+    parser.add_argument("--db-file", default=None, help="Database path (default: from .env or data/hackathon.db)")
+    parser.add_argument("--output", help="Write results as JSON")
+    args = parser.parse_args()
+
+    manager = HackathonManager(
+        db_path=args.db_file, version=args.version, parallel_judges=args.parallel_judges, llm_cache=False
+    )
+
+    submission_ids = list(args.submission_id)
+    if args.all:
+        conn = sqlite3.connect(manager.db_path)
+        rows = conn.execute(
+            f"SELECT submission_id FROM {manager.table} WHERE status IN ('researched', 'scored') LIMIT ?",
+            (args.limit,),
+        ).fetchall()
+        conn.close()
+        submission_ids += [row[0] for row in rows]
+
+    if not submission_ids:
+        parser.error("specify --submission-id or --all")
+
+    results = benchmark(manager, submission_ids, live=args.live)
+    print_report(results, len(submission_ids), args.live)
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump({"submissions": submission_ids, "live": args.live, "modes": results}, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
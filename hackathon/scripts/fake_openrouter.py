@@ -0,0 +1,353 @@
+#!/usr/bin/env python3
+"""Offline stand-in for the OpenRouter chat-completions endpoint.
+
+Answers every request with a well-formed response for the component that sent
+it: Round 1 judge scores (labelled text, panel blocks or structured JSON),
+Round 2 verdict JSON, research JSON, GitIngest recommendations and episode
+JSON. The component is identified by the ``X-Title`` header that ``LLMClient``
+sends. Latency is drawn from a log-normal distribution, and a configurable
+share of requests fail with 503 or 429. With ``--replay``, a request whose
+key is in an LLM response cache file (``LLM_CACHE_PATH`` from a live run)
+gets the recorded answer back.
+
+Usage:
+    python -m hackathon.scripts.fake_openrouter --port 8787 --latency-median 1.5 --error-rate 0.02
+    OPENROUTER_BASE_URL=http://127.0.0.1:8787/api/v1/chat/completions clanktank score --all
+"""
+
+import argparse
+import json
+import math
+import random
+import re
+import sqlite3
+import threading
+import time
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any
+
+from hackathon.backend.llm_cache import LLMResponseCache
+from hackathon.backend.llm_client import content_text
+from hackathon.prompts.show_config import get_episode_structure
+
+CHAT_PATH = "/api/v1/chat/completions"
+CRITERIA = ("INNOVATION", "TECHNICAL", "MARKET", "EXPERIENCE")
+PANEL_JUDGES = re.compile(r'"JUDGE: <name>" \(([^)]*)\)')
+EPISODE_ID = re.compile(r'"id":\s*"([^"]*)"')
+
+
+def _prompt(payload: dict[str, Any]) -> str:
+    return "\n".join(content_text(message.get("content", "")) for message in payload.get("messages", []))
+
+
+def classify(payload: dict[str, Any], title: str = "") -> str:
+    """Which kind of answer ``payload`` expects, from the client title and prompt markers."""
+    prompt = _prompt(payload)
+    if "GitIngest" in title or "RepoSage" in prompt:
+        return "gitingest"
+    if "Episode" in title or '"scenes"' in prompt:
+        return "episode"
+    if "Research" in title:
+        return "research"
+    if payload.get("response_format"):
+        return "structured"
+    if "PANEL OUTPUT FORMAT" in prompt:
+        return "panel"
+    if "PROJECT TO EVALUATE" in prompt:
+        return "judge"
+    if "Judge Scoring" in title:
+        return "round2"
+    return "research"
+
+
+class ResponseFactory:
+    """Synthetic, parseable answers for each request kind (deterministic per ``seed``)."""
+
+    def __init__(self, seed: int | None = None):
+        self.random = random.Random(seed)
+        self._lock = threading.Lock()
+
+    def _score(self) -> int:
+        with self._lock:
+            return self.random.randint(3, 9)
+
+    def _labelled(self) -> str:
+        lines = []
+        for label in CRITERIA:
+            lines.append(f"{label}_SCORE: {self._score()}")
+            lines.append(f"{label}_REASON: Synthetic {label.lower()} assessment for the offline benchmark.")
+        lines.append("OVERALL_COMMENT: A solid synthetic submission.")
+        return "\n".join(lines)
+
+    def content(self, kind: str, payload: dict[str, Any]) -> str:
+        prompt = _prompt(payload)
+        if kind == "judge":
+            return self._labelled()
+        if kind == "panel":
+            match = PANEL_JUDGES.search(prompt)
+            judges = [name.strip() for name in match.group(1).split(",")] if match else []
+            return "\n\n".join(f"JUDGE: {judge}\n{self._labelled()}" for judge in judges)
+        if kind == "structured":
+            scores = {
+                criterion: {"score": self._score(), "reason": f"Synthetic {criterion} assessment."}
+                for criterion in ("innovation", "technical_execution", "market_potential", "user_experience")
+            }
+            return json.dumps({**scores, "overall_comment": "A solid synthetic submission."})
+        if kind == "round2":
+            adjustment = self._score() - 6
+            return json.dumps(
+                {
+                    "final_verdict": "Synthetic final verdict.",
+                    "score_revision": {"type": "adjustment", "adjustment": adjustment, "reason": "Community signal"},
+                    "reasoning": "Offline benchmark reasoning.",
+                    "community_influence": "moderate",
+                    "confidence": "medium",
+                }
+            )
+        if kind == "gitingest":
+            return json.dumps(
+                {
+                    "include_patterns": ["**/*.py", "**/*.ts", "README.md"],
+                    "exclude_patterns": ["node_modules/**", "dist/**"],
+                    "core_code_max": 20000,
+                    "other_file_max": 5000,
+                    "rationale": "Synthetic recommendation: core sources and the README.",
+                }
+            )
+        if kind == "episode":
+            # The format spec with the submission id comes last in the episode prompt
+            ids = EPISODE_ID.findall(prompt)
+            return json.dumps(self._episode(ids[-1] if ids else "offline"))
+        return json.dumps(
+            {
+                "technical_implementation": {"score": self._score(), "notes": "Synthetic technical research."},
+                "market_analysis": {"score": self._score(), "notes": "Synthetic market research."},
+                "innovation_rating": {"score": self._score(), "notes": "Synthetic innovation research."},
+                "final_verdict": {"strengths": ["Offline"], "weaknesses": ["Synthetic"]},
+            }
+        )
+
+    @staticmethod
+    def _episode(submission_id: str) -> dict[str, Any]:
+        """One scene per slot of the show's episode structure, with its exact cast positions."""
+        scenes = []
+        for slot in get_episode_structure():
+            cast = {
+                position: actor.replace("pitcher", "pitchbot") for position, actor in slot["cast_positions"].items()
+            }
+            actor = next(iter(cast.values()))
+            scenes.append(
+                {
+                    "location": slot["location"],
+                    "description": slot["description"],
+                    "in": slot["transitions"]["in"],
+                    "out": slot["transitions"]["out"],
+                    "cast": cast,
+                    "dialogue": [{"actor": actor, "line": "Synthetic line for the offline run.", "action": "neutral"}],
+                }
+            )
+        return {
+            "id": submission_id,
+            "name": "Offline Episode",
+            "premise": "A synthetic pitch.",
+            "summary": "Synthetic summary.",
+            "scenes": scenes,
+        }
+
+
+class FakeOpenRouter:
+    """Threaded HTTP server speaking the chat-completions protocol.
+
+    ``latency_median``/``latency_sigma`` shape a log-normal delay per request;
+    ``error_rate`` and ``rate_limit_rate`` are the shares answered with 503 and
+    with 429 (plus ``Retry-After``). ``replay`` is an LLM response cache file
+    whose recorded answers win over synthetic ones.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency_median: float = 0.0,
+        latency_sigma: float = 0.5,
+        error_rate: float = 0.0,
+        rate_limit_rate: float = 0.0,
+        replay: str | None = None,
+        seed: int | None = None,
+    ):
+        self.latency_median = latency_median
+        self.latency_sigma = latency_sigma
+        self.error_rate = error_rate
+        self.rate_limit_rate = rate_limit_rate
+        self.replay = replay
+        self.responses = ResponseFactory(seed)
+        self.random = random.Random(seed)
+        self.counts: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.server = ThreadingHTTPServer((host, port), self._handler())
+        self.server.daemon_threads = True
+        self._thread: threading.Thread | None = None
+
+    @property
+    def url(self) -> str:
+        host, port = self.server.server_address[:2]
+        return f"http://{host}:{port}{CHAT_PATH}"
+
+    def start(self) -> "FakeOpenRouter":
+        self._thread = threading.Thread(target=self.server.serve_forever, name="fake-openrouter", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.server.shutdown()
+        self.server.server_close()
+        if self._thread:
+            self._thread.join()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self.counts[outcome] = self.counts.get(outcome, 0) + 1
+
+    def _draw(self) -> tuple[float, float]:
+        """(latency seconds, uniform draw for error injection)."""
+        with self._lock:
+            latency = 0.0
+            if self.latency_median > 0:
+                latency = self.random.lognormvariate(math.log(self.latency_median), self.latency_sigma)
+            return latency, self.random.random()
+
+    def _recorded(self, payload: dict[str, Any]) -> dict[str, Any] | None:
+        if not self.replay:
+            return None
+        conn = sqlite3.connect(self.replay, timeout=30)
+        try:
+            row = conn.execute(
+                "SELECT response FROM llm_cache WHERE key = ?", (LLMResponseCache.make_key(payload),)
+            ).fetchone()
+        except sqlite3.Error:
+            return None
+        finally:
+            conn.close()
+        return json.loads(row[0]) if row else None
+
+    def respond(self, payload: dict[str, Any], title: str = "") -> tuple[int, dict[str, str], dict[str, Any]]:
+        """``(status, headers, body)`` for one request, after its simulated latency."""
+        latency, draw = self._draw()
+        time.sleep(latency)
+        if draw < self.rate_limit_rate:
+            self._count("429")
+            return 429, {"Retry-After": "1"}, {"error": {"code": 429, "message": "Rate limited (simulated)"}}
+        if draw < self.rate_limit_rate + self.error_rate:
+            self._count("503")
+            return 503, {}, {"error": {"code": 503, "message": "Provider unavailable (simulated)"}}
+
+        recorded = self._recorded(payload)
+        if recorded is not None:
+            self._count("replayed")
+            return 200, {}, recorded
+
+        kind = classify(payload, title)
+        self._count(kind)
+        content = self.responses.content(kind, payload)
+        prompt_tokens = len(_prompt(payload)) // 4
+        return (
+            200,
+            {},
+            {
+                "id": f"gen-offline-{uuid.uuid4().hex[:12]}",
+                "object": "chat.completion",
+                "created": int(time.time()),
+                "model": payload.get("model") or "offline/fake",
+                "choices": [
+                    {"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}
+                ],
+                "usage": {
+                    "prompt_tokens": prompt_tokens,
+                    "completion_tokens": len(content) // 4,
+                    "total_tokens": prompt_tokens + len(content) // 4,
+                },
+            },
+        )
+
+    def _handler(self):
+        fake = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_POST(self):
+                if self.path.rstrip("/") != CHAT_PATH:
+                    self._send(404, {}, {"error": {"code": 404, "message": f"Unknown path {self.path}"}})
+                    return
+                try:
+                    payload = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))))
+                except ValueError:
+                    self._send(400, {}, {"error": {"code": 400, "message": "Body is not JSON"}})
+                    return
+                self._send(*fake.respond(payload, self.headers.get("X-Title", "")))
+
+            def _send(self, status, headers, body):
+                data = json.dumps(body).encode("utf-8")
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(data)))
+                for name, value in headers.items():
+                    self.send_header(name, value)
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, format, *args):
+                pass
+
+        return Handler
+
+
+def add_server_args(parser: argparse.ArgumentParser) -> None:
+    """Latency/error/replay options shared with the pipeline benchmark."""
+    parser.add_argument("--latency-median", type=float, default=0.5, help="Median response latency in seconds")
+    parser.add_argument("--latency-sigma", type=float, default=0.5, help="Log-normal sigma (tail heaviness)")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of requests answered with 503")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share of requests answered with 429")
+    parser.add_argument("--replay", default=None, help="LLM response cache DB whose recorded answers are replayed")
+    parser.add_argument("--seed", type=int, default=None, help="Random seed for latencies, errors and scores")
+
+
+def server_from_args(args: argparse.Namespace, host: str = "127.0.0.1", port: int = 0) -> FakeOpenRouter:
+    return FakeOpenRouter(
+        host=host,
+        port=port,
+        latency_median=args.latency_median,
+        latency_sigma=args.latency_sigma,
+        error_rate=args.error_rate,
+        rate_limit_rate=args.rate_limit_rate,
+        replay=args.replay,
+        seed=args.seed,
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline fake OpenRouter chat-completions server")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8787)
+    add_server_args(parser)
+    args = parser.parse_args()
+
+    server = server_from_args(args, args.host, args.port)
+    print(f"Fake OpenRouter listening on {server.url}")
+    print(f"  export OPENROUTER_BASE_URL={server.url} OPENROUTER_API_KEY=offline")
+    try:
+        server.server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server.server_close()
+        print(f"Served: {json.dumps(server.counts, sort_keys=True)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -36,10 +36,11 @@ logger = logging.getLogger(__name__)
 # Configuration — centralized in config module
 from hackathon.backend.config import (  # noqa: E402
     AI_MODEL_NAME,
-    BASE_URL,
     HACKATHON_DB_PATH,
     OPENROUTER_API_KEY,
 )
+from hackathon.backend.llm_client import LLMClient  # noqa: E402
+from hackathon.backend.llm_telemetry import get_telemetry_recorder  # noqa: E402
 
 
 class SubmissionFieldMapper:
@@ -82,12 +83,11 @@ class EpisodeGeneratorV2:
         self.version = version or LATEST_SUBMISSION_VERSION
         self.table = f"hackathon_submissions_{self.version}"
         self.fields = get_fields(self.version)
-        self.headers = {
-            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-            "Content-Type": "application/json",
-            "HTTP-Referer": "https://github.com/m3-org/clanktank",
-            "X-Title": "Clank Tank Episode Generator V2",
-        }
+        # Shared pooled transport; episodes are sampled at high temperature, so never response-cached
+        self.llm = LLMClient(api_key=OPENROUTER_API_KEY, title="Clank Tank Episode Generator V2", stage="episode")
+        telemetry = get_telemetry_recorder(self.db_path)
+        if telemetry is not None:
+            self.llm.add_hook(telemetry)
 
     def fetch_project_data(self, submission_id: str) -> dict[str, Any]:
         """
@@ -261,9 +261,7 @@ Twitter: {field_mapper.get_safe_field("twitter_handle", "Not provided")}
         }
 
         try:
-            response = requests.post(BASE_URL, json=payload, headers=self.headers)
-            response.raise_for_status()
-            result = response.json()
+            result = self.llm.chat(payload)
             episode_json_text = result["choices"][0]["message"]["content"].strip()
 
             # Parse the JSON response, handling markdown code blocks
@@ -22,11 +22,21 @@ STATIC_DATA_DIR = os.getenv(
 )
 
 
-def generate_static_data():
-    """Generate static JSON files for static site deployment."""
-    print("Generating static data files...")
-
-    engine = create_engine(f"sqlite:///{HACKATHON_DB_PATH}")
+def generate_static_data(submission_ids=None, db_path=None):
+    """Generate static JSON files for static site deployment.
+
+    With ``submission_ids``, only those submissions' detail files are rewritten;
+    the listing, leaderboard and stats files are always regenerated. Data is read
+    from ``db_path`` (default ``HACKATHON_DB_PATH``).
+    """
+    changed = None if submission_ids is None else {str(sid) for sid in submission_ids}
+    print(
+        "Generating static data files..."
+        if changed is None
+        else f"Updating static data for {len(changed)} submission(s)..."
+    )
+
+    engine = create_engine(f"sqlite:///{db_path or HACKATHON_DB_PATH}")
 
     # Create output directory
     output_dir = Path(STATIC_DATA_DIR)
@@ -89,6 +99,8 @@ def generate_static_data():
 
         for submission in submissions:
             sid = submission["submission_id"]
+            if changed is not None and str(sid) not in changed:
+                continue
             details_result = conn.execute(
                 text(
                     "SELECT s.*, u.avatar as discord_avatar FROM hackathon_submissions_v2 s "
@@ -302,6 +314,8 @@ def generate_static_data():
         src_submission_dir = output_dir / "submission"
         if src_submission_dir.exists():
             for f in src_submission_dir.glob("*.json"):
+                if changed is not None and f.stem not in changed:
+                    continue
                 shutil.copy2(f, api_submissions_dir / f.name)
 
         # Generate index.html listing available endpoints
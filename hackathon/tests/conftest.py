@@ -80,6 +80,20 @@ def setup_test_environment():
     cleanup_all_test_data()
 
 
+@pytest.fixture
+def make_manager(monkeypatch, tmp_path):
+    """Factory for HackathonManager instances on a throwaway database, with no API key or LLM cache needed"""
+    from hackathon.backend import hackathon_manager
+
+    monkeypatch.setattr(hackathon_manager, "OPENROUTER_API_KEY", "test-key")
+
+    def make(db_path=None, **kwargs):
+        kwargs.setdefault("llm_cache", False)
+        return hackathon_manager.HackathonManager(db_path=db_path or str(tmp_path / "hackathon.db"), **kwargs)
+
+    return make
+
+
 @pytest.fixture
 def client():
     """Shared test client fixture"""
@@ -336,3 +336,45 @@ def verify_database_integrity() -> dict[str, bool]:
         conn.close()
 
     return checks
+
+
+def seed_scoring_db(
+    db_path: str, submission_ids: list[int], status: str, round1_totals: dict[int, float] | None = None
+) -> str:
+    """
+    Create a fresh hackathon database at ``db_path`` for scoring tests
+
+    Args:
+        db_path: Path of the new database file
+        submission_ids: One v2 submission named "Proj <id>" is inserted per ID
+        status: Status of every inserted submission
+        round1_totals: Optional per-submission weighted total stored as a round 1 score for every judge
+
+    Returns:
+        ``db_path``
+    """
+    from hackathon.backend.create_db import create_hackathon_database
+    from hackathon.backend.hackathon_manager import JUDGES
+
+    create_hackathon_database(db_path)
+    conn = sqlite3.connect(db_path)
+    try:
+        for submission_id in submission_ids:
+            conn.execute(
+                """
+                INSERT INTO hackathon_submissions_v2
+                (submission_id, project_name, discord_handle, category, description, github_url, demo_video_url, status)
+                VALUES (?, ?, 'dev', 'DeFi', 'desc', 'https://github.com/a/b', 'https://youtu.be/x', ?)
+            """,
+                (submission_id, f"Proj {submission_id}", status),
+            )
+            if round1_totals and submission_id in round1_totals:
+                conn.executemany(
+                    "INSERT INTO hackathon_scores (submission_id, judge_name, round, weighted_total, notes) "
+                    "VALUES (?, ?, 1, ?, '{}')",
+                    [(submission_id, judge, round1_totals[submission_id]) for judge in JUDGES],
+                )
+        conn.commit()
+    finally:
+        conn.close()
+    return db_path
@@ -0,0 +1,99 @@
+"""
+Tests for the offline fake OpenRouter server and the end-to-end pipeline benchmark.
+"""
+
+import argparse
+
+import pytest
+import requests
+
+from hackathon.backend import hackathon_manager
+from hackathon.backend.circuit_breaker import CircuitBreaker
+from hackathon.backend.llm_cache import LLMResponseCache
+from hackathon.backend.llm_client import LLMClient
+from hackathon.backend.rate_limit import TokenBucket
+from hackathon.scripts.benchmark_pipeline import run_benchmark, seed_cohort
+from hackathon.scripts.fake_openrouter import FakeOpenRouter
+
+JUDGE_PAYLOAD = {
+    "model": "offline/model",
+    "messages": [{"role": "user", "content": "Judge this.\nPROJECT TO EVALUATE:\n\nProject: X"}],
+    "max_tokens": 100,
+}
+
+
+def make_client(server, title="Clank Tank Hackathon Judge Scoring", max_retries=0):
+    return LLMClient(
+        rate_limiter=TokenBucket(0),
+        breaker=CircuitBreaker(0, 0),
+        api_key="offline",
+        title=title,
+        max_retries=max_retries,
+        retry_backoff=0,
+        url=server.url,
+    )
+
+
+@pytest.fixture
+def server():
+    with FakeOpenRouter(seed=1) as server:
+        yield server
+
+
+def content(result):
+    return result["choices"][0]["message"]["content"]
+
+
+def test_judge_response_parses(server, tmp_path):
+    manager = hackathon_manager.HackathonManager(db_path=str(tmp_path / "x.db"), llm_cache=False, api_key="offline")
+    result = make_client(server).chat(JUDGE_PAYLOAD)
+
+    parsed = manager.parse_scoring_response(content(result))
+    assert set(parsed["scores"]) == set(hackathon_manager.SCORE_LABELS.values())
+    assert result["usage"]["prompt_tokens"] > 0
+    assert server.counts == {"judge": 1}
+
+
+def test_component_is_chosen_by_title(server):
+    payload = {**JUDGE_PAYLOAD, "messages": [{"role": "user", "content": "Analyze the repo"}]}
+
+    research = make_client(server, title="Clank Tank Hackathon Research").chat(payload)
+    gitingest = make_client(server, title="Clank Tank GitIngest").chat(payload)
+
+    assert "technical_implementation" in content(research)
+    assert "include_patterns" in content(gitingest)
+
+
+def test_injected_rate_limits_are_retried(server):
+    server.rate_limit_rate = 1.0
+    with pytest.raises(requests.exceptions.HTTPError):
+        make_client(server, max_retries=1).chat(JUDGE_PAYLOAD)
+    assert server.counts == {"429": 2}
+
+    server.rate_limit_rate = 0.0
+    assert content(make_client(server).chat(JUDGE_PAYLOAD))
+
+
+def test_replays_recorded_responses(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "recorded.db"), ttl_seconds=0, max_entries=0)
+    recorded = {"choices": [{"message": {"content": "recorded answer"}}]}
+    cache.set(LLMResponseCache.make_key(JUDGE_PAYLOAD), "offline/model", recorded)
+
+    with FakeOpenRouter(replay=cache.path) as server:
+        assert content(make_client(server).chat(JUDGE_PAYLOAD)) == "recorded answer"
+        assert server.counts == {"replayed": 1}
+
+
+def test_benchmark_scores_and_synthesizes_cohort(tmp_path, monkeypatch):
+    monkeypatch.setattr("hackathon.backend.simple_audit.log_system_action", lambda *a, **k: None)
+    db_path = str(tmp_path / "bench.db")
+    seed_cohort(db_path, 3, seed=1)
+    args = argparse.Namespace(parallel_judges=True, panel=False, rps=0, per_model=4, concurrency=2)
+
+    with FakeOpenRouter(seed=1) as server:
+        results = run_benchmark(db_path, server, args)
+
+    assert results["score"]["submissions"] == 3
+    assert results["synthesize"]["submissions"] == 3
+    assert results["score"]["llm_calls"] == 12
+    assert results["score"]["db_lock_wait"]["probes"] >= 0
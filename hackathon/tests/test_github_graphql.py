@@ -0,0 +1,162 @@
+"""
+Tests for GitHub GraphQL batch mode: repository snapshots several repositories per query.
+"""
+
+import re
+import threading
+
+import pytest
+
+from hackathon.backend.github_analyzer import GitHubAnalyzer
+from hackathon.backend.github_graphql import build_repository_query
+from hackathon.backend.repo_snapshot import RepoSnapshot, SnapshotPrefetcher
+
+REPOS = {
+    "acme/app": {"files": ["src/main.py", "requirements.txt", "web/package.json"], "readme": "# App\n## Setup"},
+    "acme/lib": {"files": ["lib.rs", "Cargo.toml"], "readme": None},
+    "acme/cli": {"files": ["main.go", "go.mod"], "readme": "# CLI"},
+}
+
+
+class FakeResponse:
+    def __init__(self, payload, status_code=200):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = ""
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        pass
+
+
+class FakeGitHub:
+    """GraphQL endpoint plus the REST tree endpoint, built from ``REPOS``; records every call."""
+
+    timeout = (1, 1)
+
+    def __init__(self):
+        self.queries = []
+        self.gets = []
+
+    def post(self, url, json=None, timeout=None):
+        query = json["query"]
+        self.queries.append(query)
+        data, errors = {}, []
+        for alias, owner, name, body in re.findall(
+            r'(r\d+): repository\(owner: "(.+?)", name: "(.+?)"\) \{(.*?)\n?\}(?=\nr\d+:|\n\}$)', query, re.S
+        ):
+            repo = REPOS.get(f"{owner}/{name}")
+            if repo is None:
+                data[alias] = None
+                errors.append({"type": "NOT_FOUND", "path": [alias], "message": "not found"})
+            elif "readme0" in body:
+                data[alias] = {
+                    "description": name,
+                    "createdAt": "2025-01-01T00:00:00Z",
+                    "languages": {"edges": [{"size": 10, "node": {"name": "Python"}}]},
+                    "licenseInfo": {"name": "MIT"},
+                    "commit": {"oid": f"{name}-sha", "history": {"nodes": []}},
+                    "readme0": {"text": repo["readme"]} if repo["readme"] else None,
+                }
+            else:
+                data[alias] = {
+                    blob: {"text": f"{path} at {sha}"}
+                    for blob, sha, path in re.findall(r'(b\d+): object\(expression: "(.+?):(.+?)"\)', body)
+                }
+        return FakeResponse({"data": data, "errors": errors})
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        self.gets.append(url)
+        name = url.split("/repos/")[1].split("/git/")[0]
+        return FakeResponse({"tree": [{"type": "blob", "path": p, "size": 1} for p in REPOS[name]["files"]]})
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.setattr("hackathon.backend.config.GITHUB_GRAPHQL_ENABLED", True)
+    monkeypatch.setattr("hackathon.backend.config.GITHUB_GRAPHQL_BATCH_SIZE", 2)
+    monkeypatch.setenv("SUBMISSION_DEADLINE", "2025-02-01T00:00:00Z")
+    analyzer = GitHubAnalyzer(github_token="t")
+    analyzer.session = FakeGitHub()
+    return analyzer
+
+
+def test_batch_costs_two_queries_plus_one_tree_per_repository(analyzer):
+    app, lib = analyzer.get_snapshots([("acme", "app", None), ("acme", "lib", None)])
+
+    assert len(analyzer.session.queries) == 2
+    assert len(analyzer.session.gets) == 2
+    assert isinstance(app, RepoSnapshot) and app.sha == "app-sha"
+    assert app.repo_data["license"] == {"name": "MIT"}
+    assert app.languages == {"Python": {"bytes": 10, "percentage": 100.0}}
+    assert app.commits == {"total_commits": 0}
+    assert app.readme.startswith("# App") and lib.readme is None
+    assert app.blobs == {
+        "requirements.txt": "requirements.txt at app-sha",
+        "web/package.json": "web/package.json at app-sha",
+    }
+    assert lib.blobs == {"Cargo.toml": "Cargo.toml at lib-sha"}
+
+
+def test_dependency_info_comes_from_prefetched_blobs(analyzer, monkeypatch):
+    monkeypatch.setattr(analyzer, "get_gitingest_agentic_recommendation", lambda *a: None)
+    analysis = analyzer.analyze_repository("https://github.com/acme/app")
+    assert analysis["dependency_info"]["requirements.txt"] == "requirements.txt at app-sha"
+    assert not any("/contents/" in url for url in analyzer.session.gets)
+
+
+def test_missing_repository_does_not_fail_the_batch(analyzer):
+    gone, cli = analyzer.get_snapshots([("acme", "gone", None), ("acme", "cli", None)])
+    assert gone == {"error": "Repository not found"}
+    assert cli.sha == "cli-sha"
+
+
+def test_prefetcher_fetches_submissions_in_batches(analyzer):
+    urls = [f"https://github.com/acme/{name}" for name in ("app", "lib", "cli")]
+    prefetcher = SnapshotPrefetcher(analyzer, [*urls, None], batch_size=2)
+
+    assert prefetcher.take(urls[0]).sha == "app-sha"
+    assert prefetcher.take(urls[1]).sha == "lib-sha"
+    assert len(analyzer.session.queries) == 2  # app and lib in one batch
+    assert prefetcher.take(urls[2]).sha == "cli-sha"
+    assert len(analyzer.session.queries) == 4
+
+
+def test_prefetcher_fetches_outside_the_lock():
+    release = threading.Event()
+
+    class SlowAnalyzer:
+        def extract_repo_info(self, url):
+            return ("acme", url.rsplit("/", 1)[-1], None)
+
+        def get_snapshots(self, targets):
+            if targets[0][1] == "slow":
+                release.wait(5)
+            return [f"{name}-snapshot" for _, name, _ in targets]
+
+    urls = ["https://github.com/acme/slow", "https://github.com/acme/fast"]
+    prefetcher = SnapshotPrefetcher(SlowAnalyzer(), urls, batch_size=1)
+    slow = threading.Thread(target=prefetcher.take, args=(urls[0],))
+    slow.start()
+    try:
+        # The slow batch is still in flight; a different batch must not wait on it
+        assert prefetcher.take(urls[1]) == "fast-snapshot"
+        assert slow.is_alive()
+    finally:
+        release.set()
+        slow.join(5)
+
+
+def test_query_escapes_names_and_selects_the_branch():
+    query = build_repository_query([("o", 'we"ird', "feature/x")], since="2025-01-01T00:00:00")
+    assert 'name: "we\\"ird"' in query
+    assert 'object(expression: "feature/x")' in query
+    assert 'since: "2025-01-01T00:00:00"' in query
+
+
+def test_rest_is_used_without_a_token(monkeypatch):
+    monkeypatch.setattr("hackathon.backend.config.GITHUB_GRAPHQL_ENABLED", True)
+    monkeypatch.delenv("GITHUB_TOKEN", raising=False)
+    assert not GitHubAnalyzer().use_graphql
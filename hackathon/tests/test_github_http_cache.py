@@ -0,0 +1,117 @@
+"""
+Tests for the ETag / Last-Modified conditional-request cache under GitHubAnalyzer.session.
+"""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from hackathon.backend import http_cache
+from hackathon.backend.github_analyzer import GitHubAnalyzer
+from hackathon.backend.http_cache import HTTPCache
+from hackathon.backend.http_client import create_session
+
+
+class FakeGitHub(ThreadingHTTPServer):
+    """Serves ``/repos/<name>`` with an ETag and answers a matching ``If-None-Match`` with 304."""
+
+    def __init__(self):
+        super().__init__(("127.0.0.1", 0), Handler)
+        self.version = 1
+        self.statuses = []
+        self.url = f"http://127.0.0.1:{self.server_address[1]}"
+
+    def __enter__(self):
+        threading.Thread(target=self.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc):
+        self.shutdown()
+        self.server_close()
+
+
+class Handler(BaseHTTPRequestHandler):
+    def do_GET(self):
+        server = self.server
+        etag = f'W/"{self.path}-{server.version}-{self.headers.get("Authorization", "")}"'
+        if self.headers.get("If-None-Match") == etag:
+            server.statuses.append(304)
+            self.send_response(304)
+            self.send_header("ETag", etag)
+            self.send_header("X-RateLimit-Remaining", "4999")
+            self.end_headers()
+            return
+        body = json.dumps({"full_name": self.path.rsplit("/", 1)[-1], "version": server.version}).encode()
+        server.statuses.append(200)
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("X-RateLimit-Remaining", "4998")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    with FakeGitHub() as server:
+        yield server
+
+
+def test_unchanged_resource_is_revalidated_with_304(tmp_path, server):
+    cache = HTTPCache(str(tmp_path / "http.db"))
+    session = create_session(cache=cache)
+
+    first = session.get(f"{server.url}/repos/alpha")
+    second = session.get(f"{server.url}/repos/alpha")
+
+    assert server.statuses == [200, 304]
+    assert second.status_code == 200 and second.from_cache and not first.from_cache
+    assert second.json() == first.json() == {"full_name": "alpha", "version": 1}
+    assert second.headers["X-RateLimit-Remaining"] == "4999"
+    assert (cache.revalidated, cache.stored) == (1, 1)
+
+    # A new process sees the same entries on disk
+    reopened = create_session(cache=HTTPCache(str(tmp_path / "http.db")))
+    assert reopened.get(f"{server.url}/repos/alpha").from_cache
+
+
+def test_changed_resource_replaces_the_entry(tmp_path, server):
+    session = create_session(cache=HTTPCache(str(tmp_path / "http.db")))
+    session.get(f"{server.url}/repos/alpha")
+    server.version = 2
+
+    assert session.get(f"{server.url}/repos/alpha").json()["version"] == 2
+    assert session.get(f"{server.url}/repos/alpha").json()["version"] == 2
+    assert server.statuses == [200, 200, 304]
+
+
+def test_entries_vary_on_authorization(tmp_path, server):
+    cache = HTTPCache(str(tmp_path / "http.db"))
+    session = create_session(cache=cache)
+    session.get(f"{server.url}/repos/alpha", headers={"Authorization": "token a"})
+    session.get(f"{server.url}/repos/alpha", headers={"Authorization": "token b"})
+    assert server.statuses == [200, 200]
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, server):
+    session = create_session(cache=HTTPCache(str(tmp_path / "http.db"), max_entries=2))
+    for name in ("a", "b", "c", "a"):
+        session.get(f"{server.url}/repos/{name}")
+    assert server.statuses == [200, 200, 200, 200]
+
+
+def test_github_analyzer_session_uses_the_cache(tmp_path, monkeypatch):
+    monkeypatch.setattr(http_cache, "_cache", None)
+    monkeypatch.setattr(http_cache, "GITHUB_HTTP_CACHE_PATH", str(tmp_path / "http.db"))
+    analyzer = GitHubAnalyzer(github_token="t")
+    assert analyzer.http_cache is not None
+    assert isinstance(analyzer.session.get_adapter("https://api.github.com"), http_cache.ConditionalCacheAdapter)
+
+    monkeypatch.setattr(http_cache, "GITHUB_HTTP_CACHE_ENABLED", False)
+    assert GitHubAnalyzer(github_token="t").http_cache is None
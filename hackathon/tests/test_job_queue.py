@@ -0,0 +1,138 @@
+"""
+Tests for the durable, lease-based pipeline job queue.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from hackathon.backend.create_db import create_hackathon_database
+from hackathon.backend.job_queue import JobQueue, run_worker
+
+
+@pytest.fixture
+def queue(tmp_path):
+    return JobQueue(str(tmp_path / "jobs.db"), lease_seconds=60, max_attempts=2, retry_delay=0)
+
+
+def job_row(queue, submission_id, stage="score"):
+    conn = sqlite3.connect(queue.db_path)
+    conn.row_factory = sqlite3.Row
+    row = conn.execute(
+        "SELECT * FROM pipeline_jobs WHERE stage = ? AND submission_id = ?", (stage, str(submission_id))
+    ).fetchone()
+    conn.close()
+    return dict(row)
+
+
+def test_create_db_includes_jobs_table(tmp_path, monkeypatch):
+    monkeypatch.setattr("hackathon.backend.simple_audit.log_system_action", lambda *a, **k: None)
+    path = str(tmp_path / "fresh.db")
+    create_hackathon_database(path)
+
+    assert JobQueue(path).enqueue("research", [1]) == 1
+
+
+def test_concurrent_claims_never_share_a_job(queue):
+    queue.enqueue("score", range(40))
+    claimed, lock = [], threading.Lock()
+
+    def worker(name):
+        while (job := queue.claim("score", name)) is not None:
+            with lock:
+                claimed.append(job["submission_id"])
+
+    threads = [threading.Thread(target=worker, args=(f"w{i}",)) for i in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert sorted(claimed, key=int) == [str(i) for i in range(40)]
+
+
+def test_expired_lease_is_reclaimed_and_old_owner_is_fenced(queue):
+    queue.enqueue("score", [7])
+    job = queue.claim("score", "crashed")
+    assert queue.claim("score", "other") is None
+
+    conn = sqlite3.connect(queue.db_path)
+    conn.execute("UPDATE pipeline_jobs SET lease_expires_at = ?", (time.time() - 1,))
+    conn.commit()
+    conn.close()
+
+    retaken = queue.claim("score", "rescuer")
+    assert retaken["attempts"] == 2 and retaken["lease_owner"] == "rescuer"
+    assert not queue.complete(job, "crashed")
+    assert queue.complete(retaken, "rescuer")
+    assert job_row(queue, 7)["status"] == "done"
+
+
+def test_worker_does_not_count_a_job_it_lost_the_lease_on(queue):
+    queue.enqueue("score", [7])
+    stop = threading.Event()
+
+    def stalled(submission_id):
+        # The lease runs out mid-job and another worker takes the job over
+        conn = sqlite3.connect(queue.db_path)
+        conn.execute("UPDATE pipeline_jobs SET lease_expires_at = ?", (time.time() - 1,))
+        conn.commit()
+        conn.close()
+        assert queue.claim("score", "rescuer") is not None
+        stop.set()
+
+    assert run_worker(queue, "score", stalled, worker_id="stalled", stop=stop) == {"done": 0, "failed": 0}
+    row = job_row(queue, 7)
+    assert (row["status"], row["lease_owner"]) == ("running", "rescuer")
+
+
+def test_worker_retries_then_records_failure(queue):
+    queue.enqueue("score", [1, 2])
+    calls = []
+
+    def handler(submission_id):
+        calls.append(submission_id)
+        if submission_id == "2":
+            raise RuntimeError("judge timed out")
+
+    results = run_worker(queue, "score", handler, concurrency=2)
+
+    assert results == {"done": 1, "failed": 2}
+    assert calls.count("2") == 2
+    failed = job_row(queue, 2)
+    assert (failed["status"], failed["attempts"]) == ("failed", 2)
+    assert failed["last_error"] == "RuntimeError: judge timed out"
+    assert queue.counts() == {"score": {"pending": 0, "running": 0, "done": 1, "failed": 1}}
+
+
+def test_rerun_after_a_killed_worker_reclaims_its_job(tmp_path):
+    queue = JobQueue(str(tmp_path / "jobs.db"), lease_seconds=0.3, max_attempts=2, retry_delay=0)
+    queue.enqueue("score", [1, 2])
+
+    def killed(submission_id):
+        raise KeyboardInterrupt  # the process dies mid-job; nothing marks the job failed
+
+    with pytest.raises(KeyboardInterrupt):
+        run_worker(queue, "score", killed)
+    assert job_row(queue, 1)["status"] == "running"
+
+    calls = []
+    results = run_worker(queue, "score", calls.append, poll_interval=0.05)
+
+    assert results == {"done": 2, "failed": 0}
+    assert sorted(calls) == ["1", "2"]
+    assert job_row(queue, 1)["attempts"] == 2
+
+
+def test_enqueue_resets_finished_jobs_but_not_live_leases(queue):
+    queue.enqueue("score", [1, 2])
+    run_worker(queue, "score", lambda sid: None)
+    queue.enqueue("score", [3])
+    live = queue.claim("score", "busy")
+
+    assert queue.enqueue("score", [1, 3]) == 1
+    assert job_row(queue, 1)["status"] == "pending"
+    assert job_row(queue, 3)["lease_owner"] == live["lease_owner"] == "busy"
+    assert job_row(queue, 2)["status"] == "done"
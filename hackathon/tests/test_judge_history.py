@@ -0,0 +1,77 @@
+"""
+Tests for the in-memory judge history that feeds variety prompts.
+"""
+
+import sqlite3
+
+import pytest
+
+from hackathon.backend import hackathon_manager
+from hackathon.backend.create_db import create_hackathon_database
+from hackathon.backend.judge_history import JudgeHistory
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "history.db")
+    create_hackathon_database(path)
+    conn = sqlite3.connect(path)
+    rows = [(i, "aimarc", f"note {i}", f"2025-01-0{i}") for i in range(1, 6)]
+    rows.append((9, "peepo", "vibes", "2025-01-01"))
+    conn.executemany(
+        "INSERT INTO hackathon_scores (submission_id, judge_name, round, notes, created_at) VALUES (?, ?, 1, ?, ?)",
+        rows,
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_seeds_last_notes_per_judge_newest_first(db_path):
+    history = JudgeHistory.from_db(db_path, limit=3)
+
+    assert history.recent("aimarc") == ["note 5", "note 4", "note 3"]
+    assert history.recent("peepo") == ["vibes"]
+    assert history.recent("spartan") == []
+
+
+def test_record_evicts_oldest(db_path):
+    history = JudgeHistory.from_db(db_path, limit=3)
+    history.record("aimarc", "note 6")
+    history.record("aimarc", "")
+
+    assert history.recent("aimarc") == ["note 6", "note 5", "note 4"]
+
+
+def test_missing_db_gives_empty_history(tmp_path):
+    path = tmp_path / "absent.db"
+    assert JudgeHistory.from_db(str(path)).recent("aimarc") == []
+    assert not path.exists()
+
+
+def test_scoring_prompt_uses_history_without_db_hits(db_path, monkeypatch, make_manager):
+    manager = make_manager(db_path)
+
+    def no_db(*args, **kwargs):
+        raise AssertionError("variety prompt should not query the database")
+
+    monkeypatch.setattr(hackathon_manager, "get_judge_recent_evaluations", no_db)
+
+    manager._save_judge_score(
+        {
+            "submission_id": 7,
+            "round": 1,
+            "judge_name": "aimarc",
+            "innovation": 8,
+            "technical_execution": 8,
+            "market_potential": 8,
+            "user_experience": 8,
+            "weighted_total": 32,
+            "notes": "fresh take",
+        }
+    )
+    prompt = manager.create_scoring_prompt("aimarc", {"project_name": "X"}, {})
+
+    assert "• fresh take" in prompt
+    assert "• note 5" in prompt
+    assert "note 3" not in prompt
@@ -0,0 +1,119 @@
+"""
+Tests for per-judge score persistence: each judge's score is committed as it arrives and reused on re-runs.
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+from hackathon.backend import hackathon_manager, research, simple_audit
+
+from .test_db_helpers import seed_scoring_db
+
+
+@pytest.fixture
+def manager(make_manager):
+    return make_manager(parallel_judges=True)
+
+
+@pytest.fixture
+def scoring_db(manager, monkeypatch):
+    monkeypatch.setattr(simple_audit, "log_system_action", lambda *a, **k: None)
+    return seed_scoring_db(manager.db_path, [1], "researched")
+
+
+def fake_judge_scores(judge_name):
+    return {
+        "judge_name": judge_name,
+        "innovation": 7,
+        "technical_execution": 7,
+        "market_potential": 7,
+        "user_experience": 7,
+        "weighted_total": 28,
+        "notes": "{}",
+    }
+
+
+def stored_judges(db_path):
+    conn = sqlite3.connect(db_path)
+    judges = {row[0] for row in conn.execute("SELECT judge_name FROM hackathon_scores WHERE round = 1")}
+    status = conn.execute("SELECT status FROM hackathon_submissions_v2").fetchone()[0]
+    conn.close()
+    return judges, status
+
+
+def test_partial_failure_persists_other_judges_and_rerun_retries_missing(manager, scoring_db, monkeypatch):
+    calls = []
+    failures = {"spartan"}
+
+    def flaky_scores(judge_name, project_data, research_data):
+        calls.append(judge_name)
+        if judge_name in failures:
+            failures.discard(judge_name)
+            raise RuntimeError("parse failed")
+        return fake_judge_scores(judge_name)
+
+    monkeypatch.setattr(manager, "get_ai_scores", flaky_scores)
+
+    with pytest.raises(RuntimeError, match="parse failed"):
+        manager.score_submission("1")
+
+    judges, status = stored_judges(scoring_db)
+    assert judges == {"aimarc", "aishaw", "peepo"}
+    assert status == "researched"
+
+    calls.clear()
+    results = manager.score_submission("1")
+
+    assert calls == ["spartan"]
+    assert [r["judge_name"] for r in results] == hackathon_manager.JUDGES
+    judges, status = stored_judges(scoring_db)
+    assert judges == set(hackathon_manager.JUDGES)
+    assert status == "scored"
+
+
+def test_rescore_after_re_research_calls_every_judge_again(manager, scoring_db, monkeypatch, tmp_path):
+    monkeypatch.setattr(research, "OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(research, "RESEARCH_CACHE_DIR", str(tmp_path / "cache"))
+    calls = []
+
+    def scores(judge_name, project_data, research_data):
+        calls.append(judge_name)
+        return fake_judge_scores(judge_name)
+
+    monkeypatch.setattr(manager, "get_ai_scores", scores)
+    manager.score_submission("1")
+    assert len(calls) == len(hackathon_manager.JUDGES)
+
+    time.sleep(0.01)
+    researcher = research.HackathonResearcher(db_path=scoring_db, llm_cache=False)
+    researcher._update_submission_research("1", {"github_analysis": {}, "ai_research": {"new": True}})
+    assert stored_judges(scoring_db)[1] == "researched"
+
+    calls.clear()
+    manager.score_submission("1")
+
+    assert calls == hackathon_manager.JUDGES
+    assert stored_judges(scoring_db)[1] == "scored"
+
+
+def test_judge_scores_committed_before_remaining_judges_finish(manager, scoring_db, monkeypatch):
+    seen_committed = []
+
+    def slow_last_judge(judge_name, project_data, research_data):
+        if judge_name == "peepo":
+            # Another connection must already see the earlier judges without waiting on a lock
+            conn = sqlite3.connect(scoring_db, timeout=0.1)
+            seen_committed.extend(row[0] for row in conn.execute("SELECT judge_name FROM hackathon_scores"))
+            conn.execute("UPDATE hackathon_submissions_v2 SET description = 'edited'")
+            conn.commit()
+            conn.close()
+        return fake_judge_scores(judge_name)
+
+    manager.parallel_judges = False
+    monkeypatch.setattr(manager, "get_ai_scores", slow_last_judge)
+
+    manager.score_submission("1")
+
+    assert sorted(seen_committed) == ["aimarc", "aishaw", "spartan"]
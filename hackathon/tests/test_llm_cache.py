@@ -0,0 +1,321 @@
+"""
+Tests for the persistent LLM response cache and the shared LLMClient.
+"""
+
+import threading
+import time
+
+import pytest
+import requests
+
+from hackathon.backend.circuit_breaker import CircuitBreaker, CircuitOpenError
+from hackathon.backend.llm_cache import LLMResponseCache
+from hackathon.backend.llm_client import LLMClient
+from hackathon.backend.rate_limit import TokenBucket
+
+PAYLOAD = {
+    "model": "test/model",
+    "messages": [{"role": "user", "content": "Score this project"}],
+    "temperature": 0.3,
+    "max_tokens": 100,
+}
+
+
+def completion(text):
+    return {"choices": [{"message": {"content": text}}]}
+
+
+class FakeResponse:
+    def __init__(self, body, status=200, headers=None):
+        self.body = body
+        self.status_code = status
+        self.headers = headers or {}
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise requests.exceptions.HTTPError(f"{self.status_code} error")
+
+    def json(self):
+        return self.body
+
+
+class FakeSession:
+    timeout = (1, 1)
+
+    def __init__(self, responses):
+        self.responses = list(responses)
+        self.calls = 0
+
+    def post(self, url, json=None, headers=None, timeout=None):
+        self.calls += 1
+        response = self.responses.pop(0)
+        if isinstance(response, Exception):
+            raise response
+        return response
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return LLMResponseCache(str(tmp_path / "llm.db"), ttl_seconds=3600, max_entries=100)
+
+
+def make_client(cache, responses, max_retries=0, breaker=None, hooks=None):
+    session = FakeSession(responses)
+    client = LLMClient(
+        session,
+        cache=cache,
+        rate_limiter=TokenBucket(0),
+        breaker=breaker or CircuitBreaker(0, 0),
+        max_retries=max_retries,
+        retry_backoff=0,
+        hooks=hooks,
+    )
+    return client, session
+
+
+def test_key_covers_only_output_determining_fields():
+    base = LLMResponseCache.make_key(PAYLOAD)
+    assert LLMResponseCache.make_key({**PAYLOAD, "stream": False}) == base
+    assert LLMResponseCache.make_key(dict(reversed(list(PAYLOAD.items())))) == base
+    assert LLMResponseCache.make_key({**PAYLOAD, "temperature": 0.8}) != base
+    assert LLMResponseCache.make_key({**PAYLOAD, "model": "other/model"}) != base
+    structured = {**PAYLOAD, "response_format": {"type": "json_object"}}
+    assert LLMResponseCache.make_key(structured) != base
+    assert LLMResponseCache.make_key({**PAYLOAD, "seed": 7}) != base
+
+
+def test_structured_and_plain_requests_do_not_share_a_reply(cache):
+    client, session = make_client(cache, [FakeResponse(completion("plain")), FakeResponse(completion("{}"))])
+    structured = {**PAYLOAD, "response_format": {"type": "json_object"}}
+
+    assert client.chat(PAYLOAD) == completion("plain")
+    assert client.chat(structured) == completion("{}")
+    assert session.calls == 2
+
+
+def test_cache_round_trip_and_ttl(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm.db"), ttl_seconds=0.05, max_entries=10)
+    cache.set("k", "test/model", completion("hi"))
+    assert cache.get("k") == completion("hi")
+
+    time.sleep(0.1)
+    assert cache.get("k") is None
+    assert (cache.hits, cache.misses) == (1, 1)
+
+
+def test_cache_evicts_least_recently_used(tmp_path):
+    cache = LLMResponseCache(str(tmp_path / "llm.db"), ttl_seconds=3600, max_entries=2)
+    cache.set("a", None, completion("a"))
+    time.sleep(0.01)
+    cache.set("b", None, completion("b"))
+    time.sleep(0.01)
+    cache.get("a")  # touch "a" so "b" becomes the LRU entry
+    time.sleep(0.01)
+    cache.set("c", None, completion("c"))
+
+    assert cache.get("a") is not None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+def test_client_serves_repeat_prompts_from_cache(cache):
+    client, session = make_client(cache, [FakeResponse(completion("first"))])
+
+    assert client.chat(PAYLOAD) == completion("first")
+    assert client.chat(dict(PAYLOAD)) == completion("first")
+    assert session.calls == 1
+
+
+def test_client_does_not_cache_errors_and_invalidate_forces_refetch(cache):
+    client, session = make_client(
+        cache,
+        [
+            FakeResponse({"error": "overloaded"}, status=503),
+            FakeResponse(completion("unparseable")),
+            FakeResponse(completion("good")),
+        ],
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.chat(PAYLOAD)
+    assert client.chat(PAYLOAD) == completion("unparseable")
+
+    client.invalidate(PAYLOAD)
+    assert client.chat(PAYLOAD) == completion("good")
+    assert session.calls == 3
+
+
+def test_client_without_cache_always_calls_model():
+    client, session = make_client(None, [FakeResponse(completion("a")), FakeResponse(completion("b"))])
+
+    assert client.chat(PAYLOAD) == completion("a")
+    assert client.chat(PAYLOAD) == completion("b")
+    assert session.calls == 2
+
+
+def test_client_records_latency_usage_and_cache_hits(cache):
+    body = completion("scored")
+    body["usage"] = {"prompt_tokens": 1000, "completion_tokens": 50, "prompt_tokens_details": {"cached_tokens": 800}}
+    client, _ = make_client(cache, [FakeResponse(body)])
+
+    client.chat(PAYLOAD)
+    client.chat(PAYLOAD)
+
+    stats = client.stats
+    assert (stats.calls, stats.response_cache_hits) == (1, 1)
+    assert stats.prompt_cache_hit_rate == 0.8
+    assert "prompt cache 80% (800/1000 prompt tokens)" in stats.summary()
+
+
+def test_retries_error_answers_and_unsent_requests_only():
+    refused = requests.exceptions.ConnectTimeout("connect timed out")
+    client, session = make_client(
+        None, [FakeResponse({}, status=503), refused, FakeResponse(completion("ok"))], max_retries=3
+    )
+    assert client.chat(PAYLOAD) == completion("ok")
+    assert session.calls == 3
+
+    # A read timeout may mean the provider is still generating: never re-POST
+    client, session = make_client(None, [requests.exceptions.ReadTimeout("slow"), FakeResponse({})], max_retries=3)
+    with pytest.raises(requests.exceptions.ReadTimeout):
+        client.chat(PAYLOAD)
+    assert session.calls == 1
+
+    # Client errors are not retried either
+    client, session = make_client(None, [FakeResponse({}, status=400), FakeResponse({})], max_retries=3)
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.chat(PAYLOAD)
+    assert session.calls == 1
+
+
+def test_circuit_breaker_fails_fast_then_probes():
+    breaker = CircuitBreaker(failure_threshold=2, cooldown=0.05)
+    client, session = make_client(
+        None,
+        [FakeResponse({}, status=502), FakeResponse({}, status=502), FakeResponse(completion("back"))],
+        breaker=breaker,
+    )
+
+    for _ in range(2):
+        with pytest.raises(requests.exceptions.HTTPError):
+            client.chat(PAYLOAD)
+    with pytest.raises(CircuitOpenError):
+        client.chat(PAYLOAD)
+    assert (session.calls, breaker.state) == (2, "open")
+
+    time.sleep(0.06)
+    assert client.chat(PAYLOAD) == completion("back")
+    assert breaker.state == "closed"
+
+
+def test_probe_that_raises_any_request_error_still_settles_the_breaker():
+    breaker = CircuitBreaker(failure_threshold=1, cooldown=0.05)
+    client, session = make_client(
+        None,
+        [
+            FakeResponse({}, status=502),
+            requests.exceptions.ChunkedEncodingError("connection broken"),
+            FakeResponse(completion("back")),
+        ],
+        breaker=breaker,
+    )
+
+    with pytest.raises(requests.exceptions.HTTPError):
+        client.chat(PAYLOAD)
+    time.sleep(0.06)
+    with pytest.raises(requests.exceptions.ChunkedEncodingError):
+        client.chat(PAYLOAD)
+    assert breaker.state == "open"
+
+    time.sleep(0.06)
+    assert client.chat(PAYLOAD) == completion("back")
+    assert (session.calls, breaker.state) == (3, "closed")
+
+
+def test_hooks_receive_per_call_metrics(cache):
+    events = []
+    body = completion("scored")
+    body["usage"] = {"prompt_tokens": 10, "completion_tokens": 5}
+    client, _ = make_client(
+        cache, [FakeResponse({}, status=429), FakeResponse(body)], max_retries=1, hooks=[events.append]
+    )
+    client.stage = "score"
+
+    client.chat(PAYLOAD)
+    client.chat(PAYLOAD)
+
+    assert [(e["stage"], e["outcome"], e["attempts"]) for e in events] == [
+        ("score", "ok", 2),
+        ("score", "cache_hit", 0),
+    ]
+    assert events[0]["usage"]["completion_tokens"] == 5
+    assert events[0]["model"] == "test/model"
+
+
+def test_clients_share_default_transport():
+    a = LLMClient(api_key="k", title="A", stage="score")
+    b = LLMClient(stage="episode")
+
+    assert a.session is b.session
+    assert a.breaker is b.breaker and a.model_limiter is b.model_limiter
+    assert a.headers["Authorization"] == "Bearer k" and b.headers == {}
+
+
+class BlockingSession(FakeSession):
+    """Holds every request until ``release`` is set, so callers overlap."""
+
+    def __init__(self, responses):
+        super().__init__(responses)
+        self.release = threading.Event()
+
+    def post(self, url, json=None, headers=None, timeout=None):
+        self.release.wait(5)
+        return super().post(url, json=json, headers=headers, timeout=timeout)
+
+
+def run_concurrently(client, count):
+    results, errors = [], []
+
+    def call():
+        try:
+            results.append(client.chat(dict(PAYLOAD)))
+        except Exception as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=call) for _ in range(count)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while client.single_flight.in_flight() == 0 and time.monotonic() < deadline:
+        time.sleep(0.005)
+    time.sleep(0.05)  # let the followers join the in-flight call
+    return threads, results, errors
+
+
+def test_identical_in_flight_prompts_share_one_call(cache):
+    session = BlockingSession([FakeResponse(completion("once"))])
+    client = LLMClient(session, cache=cache, rate_limiter=TokenBucket(0), breaker=CircuitBreaker(0, 0))
+
+    threads, results, errors = run_concurrently(client, 3)
+    session.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert session.calls == 1 and not errors
+    assert results == [completion("once")] * 3
+    assert results[0] is not results[1]
+    assert client.stats.shared == 2
+
+
+def test_in_flight_failure_reaches_every_waiter():
+    session = BlockingSession([FakeResponse({}, status=400)])
+    client = LLMClient(session, rate_limiter=TokenBucket(0), breaker=CircuitBreaker(0, 0), max_retries=0)
+
+    threads, results, errors = run_concurrently(client, 2)
+    session.release.set()
+    for thread in threads:
+        thread.join()
+
+    assert session.calls == 1 and not results
+    assert len(errors) == 2 and all(isinstance(e, requests.exceptions.HTTPError) for e in errors)
+    assert client.single_flight.in_flight() == 0
@@ -0,0 +1,139 @@
+"""
+Tests for per-stage LLM latency percentiles and hedged requests.
+"""
+
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from hackathon.backend import llm_client
+from hackathon.backend.circuit_breaker import CircuitBreaker
+from hackathon.backend.llm_client import LLMClient
+from hackathon.backend.llm_latency import HedgePolicy, LatencyTracker
+from hackathon.backend.rate_limit import TokenBucket
+
+PAYLOAD = {"model": "primary/model", "messages": [{"role": "user", "content": "Score"}], "max_tokens": 10}
+
+
+class FakeResponse:
+    status_code = 200
+
+    def __init__(self, text):
+        self.text = text
+
+    def raise_for_status(self):
+        pass
+
+    def json(self):
+        return {"choices": [{"message": {"content": self.text}}]}
+
+
+class ModelSession:
+    """Answers per model; models listed in ``slow`` block until released."""
+
+    timeout = (1, 1)
+
+    def __init__(self, answers, slow=()):
+        self.answers = answers
+        self.slow = set(slow)
+        self.release = threading.Event()
+        self.models = []
+
+    def post(self, url, json=None, headers=None, timeout=None):
+        self.models.append(json["model"])
+        if json["model"] in self.slow:
+            self.release.wait(5)
+        return FakeResponse(self.answers[json["model"]])
+
+
+def seeded_policy(latency=0.01, samples=5, **kwargs):
+    tracker = LatencyTracker()
+    for _ in range(samples):
+        tracker.observe("score", latency)
+    return HedgePolicy(tracker, min_samples=5, min_delay=0.01, **kwargs)
+
+
+def make_client(session, policy):
+    return LLMClient(
+        session,
+        rate_limiter=TokenBucket(0),
+        breaker=CircuitBreaker(0, 0),
+        max_retries=0,
+        stage="score",
+        hedge=policy,
+    )
+
+
+@pytest.fixture
+def session():
+    session = ModelSession({"primary/model": "slow answer", "fallback/model": "fast answer"}, slow={"primary/model"})
+    yield session
+    session.release.set()
+
+
+def test_percentiles_and_report():
+    tracker = LatencyTracker()
+    for latency in range(1, 101):
+        tracker.observe("research", float(latency))
+    tracker({"stage": "research", "outcome": "cache_hit", "latency": 0.0})
+
+    assert tracker.count("research") == 100
+    assert (tracker.percentile("research", 0.5), tracker.percentile("research", 0.9)) == (50.0, 90.0)
+    assert tracker.percentile("score", 0.9) is None
+    assert tracker.report() == ["LLM latency [research]: n=100, p50 50.0s, p90 90.0s, p99 99.0s"]
+
+
+def test_hedge_waits_for_enough_samples():
+    assert seeded_policy(samples=4).delay("score") is None
+    assert seeded_policy(latency=3.0).delay("score") == 3.0
+    assert seeded_policy(latency=0.001).delay("score") == 0.01
+
+
+def test_slow_request_is_hedged_to_fallback_model(session):
+    policy = seeded_policy(fallback_model="fallback/model")
+
+    result = make_client(session, policy).chat(PAYLOAD)
+
+    assert result["choices"][0]["message"]["content"] == "fast answer"
+    assert session.models == ["primary/model", "fallback/model"]
+    assert (policy.hedges, policy.hedge_wins) == (1, 1)
+
+
+def test_first_valid_parse_wins(session):
+    policy = seeded_policy(fallback_model="fallback/model")
+
+    def validate(result):
+        if result["choices"][0]["message"]["content"] != "slow answer":
+            raise ValueError("missing scores")
+
+    threading.Timer(0.1, session.release.set).start()
+    result = make_client(session, policy).chat(PAYLOAD, validate=validate)
+
+    assert result["choices"][0]["message"]["content"] == "slow answer"
+    assert (policy.hedges, policy.hedge_wins) == (1, 0)
+
+
+def test_fast_request_is_not_hedged():
+    session = ModelSession({"primary/model": "quick"})
+    policy = seeded_policy(latency=1.0)
+
+    assert make_client(session, policy).chat(PAYLOAD)["choices"][0]["message"]["content"] == "quick"
+    assert session.models == ["primary/model"]
+    assert policy.hedges == 0
+
+
+def test_time_queued_for_a_worker_does_not_trigger_a_hedge(monkeypatch):
+    pool = ThreadPoolExecutor(1)
+    monkeypatch.setitem(llm_client._shared_state, "hedge_pool", pool)
+    session = ModelSession({"primary/model": "quick", "fallback/model": "hedged"})
+    policy = seeded_policy(fallback_model="fallback/model")
+
+    pool.submit(time.sleep, 0.1)  # the only worker is busy well past the hedge delay
+    result = make_client(session, policy).chat(PAYLOAD)
+
+    assert result["choices"][0]["message"]["content"] == "quick"
+    assert session.models == ["primary/model"]
+    assert policy.hedges == 0
+    pool.shutdown()
@@ -0,0 +1,80 @@
+"""
+Tests for per-call LLM telemetry and the `clanktank status --llm` aggregates.
+"""
+
+import sqlite3
+
+from hackathon.backend import hackathon_manager
+from hackathon.backend.llm_telemetry import TelemetryRecorder, summarize_telemetry
+from hackathon.scripts.fake_openrouter import FakeOpenRouter
+
+
+def event(stage="score", judge=None, model="m1", outcome="ok", latency=1.0, usage=None):
+    return {
+        "stage": stage,
+        "judge": judge,
+        "model": model,
+        "outcome": outcome,
+        "latency": latency,
+        "attempts": 1,
+        "usage": usage,
+    }
+
+
+def test_recorder_batches_writes_and_creates_table_lazily(tmp_path):
+    db_path = str(tmp_path / "t.db")
+    recorder = TelemetryRecorder(db_path, batch_size=3)
+
+    recorder(event())
+    recorder(event())
+    assert not (tmp_path / "t.db").exists()  # nothing written until the batch fills
+
+    recorder(event(usage={"prompt_tokens": 10, "completion_tokens": 5, "prompt_tokens_details": {"cached_tokens": 8}}))
+    conn = sqlite3.connect(db_path)
+    try:
+        assert conn.execute("SELECT COUNT(*), SUM(cached_tokens) FROM llm_telemetry").fetchone() == (3, 8)
+    finally:
+        conn.close()
+    assert recorder.flush() == 0
+
+
+def test_summary_groups_by_stage_judge_and_model(tmp_path):
+    db_path = str(tmp_path / "t.db")
+    recorder = TelemetryRecorder(db_path)
+    for latency in (1.0, 2.0, 3.0, 4.0):
+        recorder(event(judge="aimarc", latency=latency, usage={"prompt_tokens": 100, "completion_tokens": 20}))
+    recorder(event(judge="aimarc", outcome="error", latency=0.5))
+    recorder(event(judge="aimarc", outcome="cache_hit", latency=0.0))
+    recorder(event(stage="research", model="m2", latency=10.0, usage={"prompt_tokens": 50, "cost": 0.25}))
+    recorder.flush()
+
+    report = summarize_telemetry(db_path)
+
+    score = next(r for r in report["stage"] if r["name"] == "score")
+    assert score["calls"] == 6
+    assert score["prompt_tokens"] == 400 and score["completion_tokens"] == 80
+    assert score["p50"] == 2.0 and score["p95"] == 4.0
+    assert score["errors"] == 1 and score["error_rate"] == 1 / 5
+    assert score["cache_hits"] == 1
+    assert [r["name"] for r in report["judge"]] == ["aimarc"]
+    assert {r["name"]: r["cost"] for r in report["model"]} == {"m1": 0.0, "m2": 0.25}
+
+
+def test_summary_without_telemetry_table(tmp_path):
+    assert summarize_telemetry(str(tmp_path / "empty.db")) == {"stage": [], "judge": [], "model": []}
+
+
+def test_judge_calls_are_tagged_per_judge(tmp_path, monkeypatch):
+    monkeypatch.setattr(hackathon_manager, "get_telemetry_recorder", lambda db_path: TelemetryRecorder(db_path))
+    db_path = str(tmp_path / "x.db")
+    manager = hackathon_manager.HackathonManager(db_path=db_path, llm_cache=False, api_key="offline")
+    recorder = manager.llm.hooks[-1]
+
+    with FakeOpenRouter(seed=1) as server:
+        manager.llm.url = server.url
+        manager.get_ai_scores("aimarc", {"project_name": "X"}, {})
+    recorder.flush()
+
+    (judge,) = summarize_telemetry(db_path)["judge"]
+    assert judge["name"] == "aimarc"
+    assert judge["calls"] == 1 and judge["prompt_tokens"] > 0
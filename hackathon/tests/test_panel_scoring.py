@@ -0,0 +1,127 @@
+"""
+Tests for panel scoring mode (all judges in a single LLM request).
+"""
+
+import sqlite3
+
+import pytest
+
+from hackathon.backend import hackathon_manager
+from hackathon.backend.create_db import create_hackathon_database
+from hackathon.backend.llm_client import cacheable_content, content_text
+from hackathon.scripts.benchmark_scoring import benchmark
+
+
+def judge_block(name, score=7, header="JUDGE: {name}"):
+    return f"""{header.format(name=name)}
+INNOVATION_SCORE: {score}
+INNOVATION_REASON: Fresh angle from {name}
+TECHNICAL_SCORE: {score}
+TECHNICAL_REASON: Clean code
+MARKET_SCORE: {score}
+MARKET_REASON: Real demand
+EXPERIENCE_SCORE: {score}
+EXPERIENCE_REASON: Smooth onboarding
+OVERALL_COMMENT: {name} likes it
+"""
+
+
+@pytest.fixture
+def manager(make_manager):
+    return make_manager(panel=True)
+
+
+def test_parse_panel_response_splits_decorated_blocks(manager):
+    response = (
+        judge_block("aimarc", 8, "## JUDGE: aimarc")
+        + judge_block("aishaw", 6, "**JUDGE: aishaw**")
+        + "JUDGE: spartan\nINNOVATION_SCORE: 5\n"
+    )
+
+    parsed, errors = manager.parse_panel_response(response, hackathon_manager.JUDGES)
+
+    assert parsed["aimarc"]["scores"]["innovation"] == 8
+    assert parsed["aishaw"]["scores"]["user_experience"] == 6
+    assert parsed["aishaw"]["overall_comment"] == "aishaw likes it"
+    assert parsed["aimarc"]["reasons"]["innovation"] == "Fresh angle from aimarc"
+    assert set(errors) == {"spartan", "peepo"}
+    assert "Missing required scores" in errors["spartan"]
+
+
+def test_panel_mode_uses_one_request_and_keeps_partial_results(manager, monkeypatch):
+    payloads = []
+
+    def fake_chat(payload, tags=None):
+        payloads.append(payload)
+        content = "".join(judge_block(name) for name in ("peepo", "aimarc", "aishaw"))
+        return {"choices": [{"message": {"content": content}}]}
+
+    monkeypatch.setattr(manager.llm, "chat", fake_chat)
+    recorded = []
+
+    with pytest.raises(RuntimeError, match="judge spartan"):
+        manager._collect_judge_scores({"project_name": "X"}, {}, on_score=lambda s: recorded.append(s["judge_name"]))
+
+    assert len(payloads) == 1
+    assert sorted(recorded) == ["aimarc", "aishaw", "peepo"]
+
+    prompt = content_text(payloads[0]["messages"][1]["content"])
+    assert prompt.count("PROJECT DETAILS:") == 1
+    for name in hackathon_manager.JUDGES:
+        assert f"### {name}" in prompt
+
+
+def test_single_pending_judge_falls_back_to_per_judge(manager, monkeypatch):
+    monkeypatch.setattr(manager, "get_ai_scores", lambda judge, p, r: {"judge_name": judge})
+    monkeypatch.setattr(manager, "get_panel_scores", lambda *a: pytest.fail("panel used for one judge"))
+
+    assert manager._collect_judge_scores({"project_name": "X"}, {}, judges=["spartan"]) == [{"judge_name": "spartan"}]
+
+
+def test_benchmark_dry_run_compares_request_counts(manager):
+    create_hackathon_database(manager.db_path)
+    conn = sqlite3.connect(manager.db_path)
+    conn.execute(
+        f"""
+        INSERT INTO {manager.table}
+        (submission_id, project_name, discord_handle, category, description, github_url, demo_video_url, status)
+        VALUES (1, 'Proj', 'dev', 'DeFi', 'A long description', 'https://github.com/a/b', 'https://youtu.be/x',
+                'researched')
+        """
+    )
+    conn.commit()
+    conn.close()
+
+    results = benchmark(manager, [1])
+
+    assert results["per-judge"]["requests"] == 4
+    assert results["panel"]["requests"] == 1
+    assert results["panel"]["prompt_chars"] < results["per-judge"]["prompt_chars"]
+
+
+def test_judge_prompt_prefix_is_stable_across_projects(manager, monkeypatch):
+    monkeypatch.setattr(hackathon_manager, "JUDGE_PERSONAS", {"aimarc": "You are aimarc, a visionary VC."})
+    monkeypatch.setattr(hackathon_manager, "get_scoring_task", lambda: "Score on four criteria.")
+
+    prefix_a, suffix_a = manager._scoring_prompt_parts("aimarc", {"project_name": "Alpha"}, {})
+    prefix_b, _ = manager._scoring_prompt_parts("aimarc", {"project_name": "Beta"}, {})
+
+    assert prefix_a == prefix_b
+    assert prefix_a.startswith("You are aimarc") and "Score on four criteria." in prefix_a
+    assert "Alpha" in suffix_a and "Alpha" not in prefix_a
+
+    content = cacheable_content(prefix_a, suffix_a)
+    assert content[0]["cache_control"] == {"type": "ephemeral"}
+    assert content_text(content) == manager.create_scoring_prompt("aimarc", {"project_name": "Alpha"}, {})
+
+
+def test_round2_template_splits_at_first_project_field():
+    template = "JUDGE {judge}: weigh the community signal carefully.\nProject: {project_name}\nScore: {r1_score}"
+
+    prefix, suffix = hackathon_manager.split_template_prefix(
+        template, static_fields={"judge": "AIMARC"}, project_name="Alpha", r1_score="30.0"
+    )
+
+    assert prefix == "JUDGE AIMARC: weigh the community signal carefully.\nProject: "
+    assert suffix == "Alpha\nScore: 30.0"
+    assert hackathon_manager.split_template_prefix("", static_fields={}, x=1) == ("", "")
@@ -0,0 +1,112 @@
+"""
+Tests for the streaming pipeline orchestrator and its static-data debouncer.
+"""
+
+import json
+import sqlite3
+import threading
+import time
+
+from hackathon.backend.pipeline import Debouncer, PipelineRunner
+
+
+def test_score_starts_as_soon_as_research_lands():
+    slow_research = threading.Event()
+    scored = []
+
+    def research(sid):
+        if sid == "slow":
+            assert slow_research.wait(5)
+
+    def score(sid):
+        scored.append(sid)
+        if sid == "fast":
+            # The slow submission is still in research while the fast one is scored
+            slow_research.set()
+
+    runner = PipelineRunner({"research": research, "score": score}, concurrency={"research": 2})
+    results = runner.run(research_ids=["slow", "fast"], score_ids=["fast", "done-earlier"])
+
+    assert scored[0] in ("fast", "done-earlier")
+    assert sorted(scored) == ["done-earlier", "fast", "slow"]
+    assert results["research"] == {"done": 2, "failed": 0}
+    assert results["score"] == {"done": 3, "failed": 0}
+
+
+def test_failed_research_is_not_scored():
+    def research(sid):
+        if sid == "broken":
+            raise RuntimeError("GitHub unavailable")
+
+    scored = []
+    results = PipelineRunner({"research": research, "score": scored.append}).run(research_ids=["ok", "broken"])
+
+    assert scored == ["ok"]
+    assert results["research"] == {"done": 1, "failed": 1}
+
+
+def test_stage_concurrency_budget():
+    active = {"score": 0, "peak": 0}
+    lock = threading.Lock()
+
+    def score(sid):
+        with lock:
+            active["score"] += 1
+            active["peak"] = max(active["peak"], active["score"])
+        time.sleep(0.02)
+        with lock:
+            active["score"] -= 1
+
+    PipelineRunner({"score": score}, concurrency={"score": 3}).run(score_ids=range(12))
+
+    assert active["peak"] == 3
+
+
+def test_static_data_is_debounced_per_changed_submission():
+    published = []
+    runner = PipelineRunner(
+        {"research": lambda sid: None, "score": lambda sid: None, "synthesize": lambda sid: None},
+        publish=published.append,
+        debounce=0.5,
+    )
+
+    runner.run(research_ids=[1, 2], synthesize_ids=[3])
+
+    assert published == [{"1", "2", "3"}]
+
+
+def test_debouncer_flushes_on_max_delay_under_steady_updates():
+    batches = []
+    debouncer = Debouncer(batches.append, delay=0.05, max_delay=0.1)
+    for key in range(8):
+        debouncer.touch(key)
+        time.sleep(0.03)
+    debouncer.close()
+
+    assert len(batches) >= 2
+    assert set().union(*batches) == {str(key) for key in range(8)}
+
+
+def test_static_data_is_published_from_the_given_database(tmp_path, monkeypatch):
+    from hackathon.backend import simple_audit
+    from hackathon.backend.create_db import create_hackathon_database
+    from hackathon.scripts import generate_static_data as static
+
+    monkeypatch.setattr(simple_audit, "log_system_action", lambda *a, **k: None)
+    db_path = str(tmp_path / "other.db")
+    create_hackathon_database(db_path)
+    conn = sqlite3.connect(db_path)
+    conn.execute("INSERT INTO users (discord_id, username) VALUES ('42', 'dev')")
+    conn.execute(
+        "INSERT INTO hackathon_submissions_v2 (submission_id, project_name, discord_handle, category, description, "
+        "github_url, demo_video_url, status, owner_discord_id) VALUES (7, 'Only In Other DB', 'dev', 'DeFi', 'desc', "
+        "'https://github.com/a/b', 'https://youtu.be/x', 'scored', '42')"
+    )
+    conn.commit()
+    conn.close()
+    monkeypatch.setattr(static, "STATIC_DATA_DIR", str(tmp_path / "public" / "data"))
+
+    static.generate_static_data(submission_ids=[7], db_path=db_path)
+
+    submissions = json.loads((tmp_path / "public" / "data" / "submissions.json").read_text())
+    assert [s["project_name"] for s in submissions] == ["Only In Other DB"]
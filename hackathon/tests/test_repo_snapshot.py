@@ -0,0 +1,166 @@
+"""
+Tests for RepoSnapshot: one fetch per (owner, repo, commit SHA), shared by every GitHubAnalyzer consumer.
+"""
+
+import base64
+import threading
+import time
+from urllib.parse import urlparse
+
+import pytest
+
+from hackathon.backend.github_analyzer import GitHubAnalyzer
+from hackathon.backend.repo_snapshot import RepoSnapshot
+
+
+class FakeResponse:
+    def __init__(self, status_code, payload=None, text=""):
+        self.status_code = status_code
+        self._payload = payload
+        self.text = text
+
+    def json(self):
+        return self._payload
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+
+class FakeGitHubSession:
+    """Answers the REST endpoints GitHubAnalyzer uses from ``repos`` and records every request path."""
+
+    timeout = (1, 1)
+
+    def __init__(self, repos):
+        self.repos = repos
+        self.requests = []
+
+    def get(self, url, params=None, headers=None, timeout=None):
+        path = urlparse(url).path
+        self.requests.append(path)
+        parts = path.strip("/").split("/")
+        repo = self.repos.get(f"{parts[1]}/{parts[2]}")
+        if repo is None:
+            return FakeResponse(404)
+        endpoint = parts[3] if len(parts) > 3 else ""
+        if endpoint == "":
+            return FakeResponse(200, {"description": repo["description"], "default_branch": "main"})
+        if endpoint == "commits" and len(parts) > 4:
+            return FakeResponse(200, text=repo["sha"])
+        if endpoint == "git":
+            return FakeResponse(200, {"tree": [{"type": "blob", "path": p, "size": s} for p, s in repo["files"]]})
+        if endpoint == "readme":
+            return FakeResponse(200, {"content": base64.b64encode(b"# Demo\n## Setup\nrun it").decode()})
+        if endpoint == "languages":
+            return FakeResponse(200, {"Python": 300, "Shell": 100})
+        if endpoint == "contents":
+            assert params == {"ref": repo["sha"]}
+            return FakeResponse(200, {"content": base64.b64encode(b"requests\nnumpy\n").decode()})
+        if endpoint == "topics":
+            return FakeResponse(200, {"names": ["demo"]})
+        return FakeResponse(200, [])
+
+
+@pytest.fixture
+def analyzer(monkeypatch):
+    monkeypatch.delenv("SUBMISSION_DEADLINE", raising=False)
+    analyzer = GitHubAnalyzer(github_token="t")
+    analyzer.session = FakeGitHubSession(
+        {
+            "acme/app": {
+                "sha": "a" * 40,
+                "description": "App",
+                "files": [("src/main.py", 4000), ("requirements.txt", 20), ("README.md", 30)],
+            },
+            "acme/lib": {"sha": "b" * 40, "description": "Lib", "files": [("src/main.py", 90)]},
+        }
+    )
+    monkeypatch.setattr(analyzer, "get_gitingest_agentic_recommendation", lambda *a: None)
+    return analyzer
+
+
+def fetches(session, endpoint):
+    return sum(1 for path in session.requests if f"/{endpoint}" in path)
+
+
+def test_analysis_and_summary_share_one_snapshot(analyzer):
+    url = "https://github.com/acme/app"
+    snapshot = analyzer.snapshot_for_url(url)
+    assert isinstance(snapshot, RepoSnapshot) and snapshot.key == ("acme", "app", "a" * 40)
+
+    analysis = analyzer.analyze_repository(url, snapshot=snapshot)
+    assert fetches(analyzer.session, "languages") == 0  # only the summary reports languages
+    summary = analyzer.summarize_repo(url, snapshot=snapshot)
+
+    assert fetches(analyzer.session, "git/trees") == 1
+    assert fetches(analyzer.session, "readme") == 1
+    assert fetches(analyzer.session, "languages") == 1
+    assert analysis["commit_sha"] == "a" * 40
+    assert analysis["readme_analysis"]["has_setup_section"]
+    assert analysis["dependency_info"] == {"requirements.txt": "requests\nnumpy"}
+    assert summary["file_list"] == ["src/main.py", "requirements.txt", "README.md"]
+    assert summary["readme_head"].startswith("# Demo")
+    assert summary["language_breakdown"] == {
+        "Python": {"bytes": 300, "percentage": 75.0},
+        "Shell": {"bytes": 100, "percentage": 25.0},
+    }
+
+
+def test_unchanged_commit_reuses_the_snapshot(analyzer):
+    first = analyzer.get_snapshot("acme", "app")
+    requests_before = len(analyzer.session.requests)
+    assert analyzer.get_snapshot("acme", "app") is first
+    # Only the SHA lookup
+    assert len(analyzer.session.requests) == requests_before + 1
+
+    analyzer.session.repos["acme/app"]["sha"] = "c" * 40
+    assert analyzer.get_snapshot("acme", "app").sha == "c" * 40
+
+
+def test_file_sizes_do_not_mix_between_repositories(analyzer):
+    app = analyzer.analyze_repository("https://github.com/acme/app")
+    lib = analyzer.analyze_repository("https://github.com/acme/lib")
+    sizes = {r["name"]: {f["path"]: f["bytes"] for f in r["file_manifest"]} for r in (app, lib)}
+    assert sizes["app"]["src/main.py"] == 4000
+    assert sizes["lib"]["src/main.py"] == 90
+
+
+def test_missing_repository_returns_an_error(analyzer):
+    assert analyzer.analyze_repository("https://github.com/acme/gone") == {"error": "Repository not found"}
+
+
+def test_manifests_download_concurrently_with_a_bounded_pool(monkeypatch):
+    monkeypatch.setattr("hackathon.backend.config.GITHUB_MAX_DEPENDENCY_FILES", 8)
+    monkeypatch.setattr("hackathon.backend.config.GITHUB_MANIFEST_CONCURRENCY", 3)
+    paths = [f"packages/p{n}/package.json" for n in range(10)]
+    snapshot = RepoSnapshot("acme", "mono", "d" * 40, {}, [{"path": p, "size": 1} for p in paths])
+    active, peak = [0], [0]
+    lock = threading.Lock()
+
+    class SlowSession:
+        timeout = (1, 1)
+
+        def get(self, url, params=None, timeout=None):
+            with lock:
+                active[0] += 1
+                peak[0] = max(peak[0], active[0])
+            time.sleep(0.05)
+            with lock:
+                active[0] -= 1
+            path = url.split("/contents/")[1]
+            if path == paths[1]:
+                return FakeResponse(404)
+            return FakeResponse(200, {"content": base64.b64encode(path.encode()).decode()})
+
+    analyzer = GitHubAnalyzer(github_token="t")
+    analyzer.session = SlowSession()
+    manifest = analyzer.label_file_relevance(snapshot.files, snapshot.sizes)
+
+    start = time.monotonic()
+    deps = analyzer.extract_dependency_info(snapshot, manifest)
+
+    assert list(deps) == [p for p in paths[:8] if p != paths[1]]
+    assert deps[paths[0]] == paths[0]
+    assert peak[0] == 3
+    assert time.monotonic() - start < 0.05 * 8 * 0.75
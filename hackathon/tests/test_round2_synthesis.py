@@ -0,0 +1,72 @@
+"""
+Tests for Round 2 synthesis: per-project commits, resumable runs and the grouped community-feedback query.
+"""
+
+import sqlite3
+
+import pytest
+
+from hackathon.backend import simple_audit
+
+from .test_db_helpers import seed_scoring_db
+
+
+@pytest.fixture
+def manager(make_manager):
+    return make_manager()
+
+
+@pytest.fixture
+def round2_db(manager, monkeypatch):
+    monkeypatch.setattr(simple_audit, "log_system_action", lambda *a, **k: None)
+    return seed_scoring_db(manager.db_path, [1, 2, 3], "community-voting", round1_totals={1: 21, 2: 22, 3: 23})
+
+
+def test_round2_commits_per_project_and_resumes(manager, round2_db, monkeypatch):
+    calls = []
+    failing = {2}
+
+    def fake_verdict(project_id, judge, r1_data, community_context, comparative_reasoning, project_meta=None):
+        assert project_meta["project_name"] == f"Proj {project_id}"
+        calls.append((project_id, judge))
+        if project_id in failing:
+            raise RuntimeError("model exploded")
+        return '{"final_verdict": "ok", "score_revision": {"type": "adjustment", "adjustment": 1}}'
+
+    monkeypatch.setattr(manager, "_generate_final_verdict_with_comparison", fake_verdict)
+
+    assert manager.run_round2_synthesis(concurrency=3) == {"synthesized": 2, "failed": 1}
+
+    conn = sqlite3.connect(round2_db)
+    statuses = dict(conn.execute(f"SELECT submission_id, status FROM {manager.table}"))
+    r2 = conn.execute(
+        "SELECT submission_id, COUNT(*), MIN(weighted_total) FROM hackathon_scores WHERE round = 2 GROUP BY 1"
+    )
+    assert statuses == {1: "completed", 2: "community-voting", 3: "completed"}
+    assert {row[0]: row[1:] for row in r2} == {1: (4, 22), 3: (4, 24)}
+    conn.close()
+
+    failing.clear()
+    calls.clear()
+    assert manager.run_round2_synthesis() == {"synthesized": 1, "failed": 0}
+    assert {pid for pid, _ in calls} == {2}
+
+
+def test_community_context_uses_one_grouped_query(manager, round2_db):
+    conn = sqlite3.connect(round2_db)
+    votes = [("u1", "1", "like"), ("u2", "1", "like"), ("u3", "1", "dislike"), ("u1", "2", "dislike")]
+    conn.executemany("INSERT INTO likes_dislikes (discord_id, submission_id, action) VALUES (?, ?, ?)", votes)
+    conn.commit()
+
+    statements = []
+    conn.set_trace_callback(statements.append)
+    context = manager._get_community_feedback_context(conn.cursor(), [1, 2, 3])
+    conn.close()
+
+    assert len(statements) == 1
+    assert context[1]["total_reactions"] == 3
+    assert context[1]["unique_voters"] == 3
+    assert context[1]["reaction_breakdown"] == {"like": 2, "dislike": 1}
+    assert context[2]["reaction_breakdown"] == {"dislike": 1}
+    assert context[3]["reaction_breakdown"] == {}
+    assert [context[pid]["engagement_level"] for pid in (1, 2, 3)] == ["high", "medium", "low"]
@@ -0,0 +1,130 @@
+"""
+Tests for cohort-wide judge calibration of hackathon_scores.
+"""
+
+import sqlite3
+import time
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from hackathon.backend.create_db import create_hackathon_database  # noqa: E402
+from hackathon.backend.score_calibration import calibrate_matrix, calibrate_round  # noqa: E402
+
+BIAS = {"aimarc": 2.0, "aishaw": -1.5, "peepo": 0.5, "spartan": 0.0}
+
+
+def cohort(n, seed=1):
+    """``n x judges x 4`` raw scores: a shared project quality plus a fixed leniency per judge."""
+    rng = np.random.default_rng(seed)
+    quality = rng.uniform(3, 8, size=(n, 1, 1))
+    noise = rng.normal(0, 0.7, size=(n, len(BIAS), 4))
+    return np.clip(quality + np.array(list(BIAS.values()))[None, :, None] + noise, 0, 10)
+
+
+@pytest.fixture
+def db_path(tmp_path, monkeypatch):
+    monkeypatch.setattr("hackathon.backend.simple_audit.log_system_action", lambda *a, **k: None)
+    path = str(tmp_path / "calibrate.db")
+    create_hackathon_database(path)
+    return path
+
+
+def insert_scores(db_path, scores, round_num=1):
+    judges = list(BIAS)
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.executemany(
+            "INSERT INTO hackathon_scores (submission_id, judge_name, round, innovation, technical_execution, "
+            "market_potential, user_experience, weighted_total) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            [
+                (sid + 1, judge, round_num, *map(float, scores[sid, j]), float(scores[sid, j].sum()))
+                for sid in range(scores.shape[0])
+                for j, judge in enumerate(judges)
+            ],
+        )
+        conn.commit()
+    finally:
+        conn.close()
+
+
+@pytest.mark.parametrize("method", ["zscore", "quantile"])
+def test_calibration_removes_judge_leniency(method):
+    raw = cohort(500)
+    calibrated = calibrate_matrix(raw, method=method)
+
+    raw_means = np.nanmean(raw, axis=(0, 2))
+    calibrated_means = np.nanmean(calibrated, axis=(0, 2))
+    assert raw_means.max() - raw_means.min() > 3
+    assert calibrated_means.max() - calibrated_means.min() < 0.3
+    # Ranking within a judge is preserved
+    order = np.argsort(raw[:, 0, 0], kind="stable")
+    assert np.all(np.diff(calibrated[order, 0, 0]) >= -1e-9)
+    assert calibrated.min() >= 0 and calibrated.max() <= 10
+
+
+def test_quantile_keeps_ties_and_missing_scores():
+    raw = cohort(50).round()
+    raw[3, 1, :] = np.nan  # aishaw never scored project 4
+    calibrated = calibrate_matrix(raw, method="quantile")
+
+    assert np.isnan(calibrated[3, 1]).all()
+    column = raw[:, 0, 0]
+    tied = column == column[0]
+    assert tied.sum() > 1
+    assert np.allclose(calibrated[tied, 0, 0], calibrated[0, 0, 0])
+
+
+def test_sparse_judge_keeps_raw_scores():
+    raw = cohort(20)
+    raw[3:, 3, :] = np.nan  # spartan only scored three projects
+    calibrated = calibrate_matrix(raw, min_samples=5)
+    assert np.allclose(calibrated[:3, 3], raw[:3, 3])
+
+
+def test_calibrate_round_writes_totals_in_bulk(db_path):
+    insert_scores(db_path, cohort(40), round_num=1)
+    insert_scores(db_path, cohort(40, seed=2)[:5], round_num=2)
+
+    result = calibrate_round(db_path, round_num=1)
+
+    assert result["rows"] == 160 and result["submissions"] == 40
+    means = [stats["calibrated_mean"] for stats in result["judges"].values()]
+    assert max(means) - min(means) < 1.0
+    conn = sqlite3.connect(db_path)
+    try:
+        by_round = dict(
+            conn.execute("SELECT round, COUNT(calibrated_total) FROM hackathon_scores GROUP BY round").fetchall()
+        )
+    finally:
+        conn.close()
+    assert by_round == {1: 160, 2: 0}
+
+
+def test_calibrate_round_adds_column_to_older_databases(tmp_path):
+    path = str(tmp_path / "old.db")
+    conn = sqlite3.connect(path)
+    try:
+        conn.execute(
+            "CREATE TABLE hackathon_scores (id INTEGER PRIMARY KEY, submission_id INTEGER, judge_name TEXT, "
+            "round INTEGER, innovation REAL, technical_execution REAL, market_potential REAL, user_experience REAL)"
+        )
+        conn.commit()
+    finally:
+        conn.close()
+    assert calibrate_round(path)["rows"] == 0
+    conn = sqlite3.connect(path)
+    try:
+        columns = {row[1] for row in conn.execute("PRAGMA table_info(hackathon_scores)")}
+    finally:
+        conn.close()
+    assert "calibrated_total" in columns
+
+
+def test_ten_thousand_submissions_calibrate_quickly():
+    raw = cohort(10_000)
+    start = time.monotonic()
+    calibrate_matrix(raw, method="zscore")
+    calibrate_matrix(raw, method="quantile")
+    assert time.monotonic() - start < 1.0
@@ -0,0 +1,78 @@
+"""
+Tests for the in-memory ScoreDistribution index used by Round 2 synthesis.
+"""
+
+import json
+
+import pytest
+
+from hackathon.backend.score_distribution import ScoreDistribution
+
+
+def row(pid, judge, total, reasons=None):
+    notes = json.dumps({"reasons": reasons or {}, "overall_comment": ""})
+    return (pid, f"Project {pid}", "DeFi", judge, 5, 5, 5, 5, total, notes)
+
+
+@pytest.fixture
+def distribution():
+    rows = [
+        row("a", "aimarc", 36, {"innovation": "Novel, but the docs are thin"}),
+        row("a", "aishaw", 34),
+        row("b", "aimarc", 30, {"market_potential": "However, no go-to-market"}),
+        row("c", "aimarc", 29),
+        row("d", "aimarc", 20),
+        row("e", "aimarc", 12, {"technical_execution": "Solid contracts"}),
+        row("e", "aishaw", 10, {"user_experience": "Weak onboarding"}),
+    ]
+    return ScoreDistribution.from_rows(rows)
+
+
+def test_rankings_and_stats(distribution):
+    assert [pid for pid, _, _ in distribution.rankings] == ["a", "b", "c", "d", "e"]
+    assert distribution.projects["a"]["avg_score"] == 35
+    assert distribution.projects["e"]["score_variance"] == 2
+    assert distribution.stats["total_projects"] == 5
+    assert distribution.stats["max"] == 36
+
+
+def test_bisect_lookups(distribution):
+    assert distribution.rank("c") == 3
+    assert distribution.count_above(29) == 2
+    assert distribution.count_below(29) == 2
+    assert distribution.mean_above(29) == pytest.approx(32.5)
+    assert distribution.mean_above(35) is None
+    assert distribution.percentile("c") == 40
+    assert sorted(distribution.similar("c")) == ["b"]
+    assert distribution.similar("d") == []
+
+
+def test_snippets_are_preextracted(distribution):
+    assert distribution.criticisms_from_top(20) == [
+        "innovation: Novel, but the docs are thin",
+        "market_potential: However, no go-to-market",
+    ]
+    assert distribution.strengths_from_bottom(29) == ["technical_execution: Solid contracts"]
+    assert distribution.criticisms_from_top(35) == []
+
+
+def test_empty_distribution_keeps_legacy_error_shape():
+    assert ScoreDistribution.from_rows([]).to_dict() == {"error": "No scores found for this round"}
+
+
+def test_comparative_reasoning_reuses_prebuilt_index(monkeypatch, make_manager, distribution):
+    manager = make_manager()
+
+    def fail_rebuild(round_num=1):
+        raise AssertionError("distribution should not be rebuilt")
+
+    monkeypatch.setattr(manager, "build_score_distribution", fail_rebuild)
+
+    for pid in ("a", "c", "e"):
+        reasoning = manager.generate_comparative_reasoning(pid, distribution=distribution)
+        assert f"Project {pid}" in reasoning
+
+    reasoning = manager.generate_comparative_reasoning("c", distribution=distribution)
+    assert "Ranked #3 out of 5 projects" in reasoning
+    assert "2 projects scored higher (avg gap: 3.5 points)" in reasoning
+    assert "1 projects in similar score range" in reasoning
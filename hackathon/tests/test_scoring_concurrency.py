@@ -0,0 +1,103 @@
+"""
+Tests for concurrent judge scoring and the shared LLM rate limiting primitives.
+"""
+
+import threading
+import time
+
+import pytest
+
+from hackathon.backend import hackathon_manager
+from hackathon.backend.rate_limit import ModelConcurrencyLimiter, TokenBucket
+
+
+@pytest.fixture
+def manager(make_manager):
+    return make_manager(parallel_judges=True)
+
+
+def test_token_bucket_allows_burst_then_paces():
+    bucket = TokenBucket(rate=20, capacity=2)
+    assert bucket.try_acquire()
+    assert bucket.try_acquire()
+    assert not bucket.try_acquire()
+
+    waited = bucket.acquire()
+    assert 0 < waited < 0.5
+
+
+def test_token_bucket_disabled_with_zero_rate():
+    bucket = TokenBucket(rate=0)
+    assert all(bucket.try_acquire() for _ in range(100))
+    assert bucket.acquire() == 0.0
+
+
+def test_model_limiter_caps_in_flight_per_model():
+    limiter = ModelConcurrencyLimiter(max_per_model=2)
+    in_flight = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def work():
+        nonlocal in_flight, peak
+        with limiter.slot("model-a"):
+            with lock:
+                in_flight += 1
+                peak = max(peak, in_flight)
+            time.sleep(0.05)
+            with lock:
+                in_flight -= 1
+
+    threads = [threading.Thread(target=work) for _ in range(6)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert peak == 2
+
+
+def test_parallel_judges_run_concurrently_and_keep_order(manager, monkeypatch):
+    def fake_scores(judge_name, project_data, research_data):
+        time.sleep(0.2)
+        return {"judge_name": judge_name}
+
+    monkeypatch.setattr(manager, "get_ai_scores", fake_scores)
+
+    start = time.monotonic()
+    results = manager._collect_judge_scores({"project_name": "X"}, {})
+    elapsed = time.monotonic() - start
+
+    assert [r["judge_name"] for r in results] == hackathon_manager.JUDGES
+    assert elapsed < 0.6  # four 0.2s judges, not 0.8s serial
+
+
+def test_parallel_judges_propagate_failures(manager, monkeypatch):
+    def fake_scores(judge_name, project_data, research_data):
+        if judge_name == "spartan":
+            raise RuntimeError("parse failed")
+        return {"judge_name": judge_name}
+
+    monkeypatch.setattr(manager, "get_ai_scores", fake_scores)
+
+    with pytest.raises(RuntimeError, match="parse failed"):
+        manager._collect_judge_scores({"project_name": "X"}, {})
+
+
+def test_batch_scoring_isolates_failures_and_keeps_contract(manager, monkeypatch):
+    scored = []
+
+    def fake_score_submission(submission_id, round_num=1):
+        if submission_id == "bad":
+            raise RuntimeError("boom")
+        time.sleep(0.05)
+        scored.append(submission_id)
+        return []
+
+    monkeypatch.setattr(manager, "score_submission", fake_score_submission)
+    submissions = [("a", "A"), ("bad", "Bad"), ("b", "B"), ("c", "C")]
+
+    results = manager._score_batch(submissions, round_num=1, concurrency=3)
+
+    assert results == {"scored": 3, "failed": 1}
+    assert sorted(scored) == ["a", "b", "c"]
@@ -0,0 +1,84 @@
+"""
+Tests for judge score parsing (labelled text and structured JSON replies).
+"""
+
+import json
+
+import pytest
+
+from hackathon.backend import hackathon_manager
+
+TEXT_REPLY = """Let me weigh this one.
+
+INNOVATION_SCORE: 8
+INNOVATION_REASON: Novel agent routing
+Builds on prior work.
+**TECHNICAL_SCORE:** 7/10
+**TECHNICAL_REASON:** Solid tests
+MARKET_SCORE:
+6
+MARKET_REASON: Niche but real
+EXPERIENCE_SCORE: 12
+EXPERIENCE_REASON: Smooth onboarding
+OVERALL_COMMENT: Ship it.
+Extra chatter the judge added.
+"""
+
+JSON_REPLY = {
+    "innovation": {"score": 8, "reason": "Novel agent routing"},
+    "technical_execution": {"score": 7, "reason": "Solid tests"},
+    "market_potential": {"score": 6, "reason": "Niche but real"},
+    "user_experience": {"score": 12, "reason": "Smooth onboarding"},
+    "overall_comment": "Ship it.",
+}
+
+EXPECTED = {
+    "scores": {"innovation": 8, "technical_execution": 7, "market_potential": 6, "user_experience": 10},
+    "reasons": {
+        "innovation": "Novel agent routing",
+        "technical": "Solid tests",
+        "market": "Niche but real",
+        "experience": "Smooth onboarding",
+    },
+    "overall_comment": "Ship it.",
+}
+
+
+@pytest.fixture
+def manager(make_manager):
+    return make_manager(structured_output=True)
+
+
+def test_labelled_text_parses_in_one_pass(manager):
+    assert manager.parse_scoring_response(TEXT_REPLY) == EXPECTED
+
+
+@pytest.mark.parametrize("wrap", ["{}", "```json\n{}\n```"])
+def test_structured_json_reply(manager, wrap):
+    assert manager.parse_scoring_response(wrap.format(json.dumps(JSON_REPLY))) == EXPECTED
+
+
+def test_missing_scores_still_fail_loudly(manager):
+    partial = {k: v for k, v in JSON_REPLY.items() if k != "market_potential"}
+
+    with pytest.raises(ValueError, match="market_potential"):
+        manager.parse_scoring_response(json.dumps(partial))
+    with pytest.raises(ValueError, match="innovation"):
+        manager.parse_scoring_response("INNOVATION_SCORE: high\nOVERALL_COMMENT: hmm")
+
+
+def test_structured_mode_requests_schema_and_accepts_text_fallback(manager, monkeypatch):
+    payloads = []
+
+    def fake_chat(payload, validate=None, tags=None):
+        payloads.append(payload)
+        return {"choices": [{"message": {"content": TEXT_REPLY}}]}
+
+    monkeypatch.setattr(manager.llm, "chat", fake_chat)
+    scores = manager.get_ai_scores("aimarc", {"project_name": "X"}, {})
+
+    response_format = payloads[0]["response_format"]
+    assert response_format["type"] == "json_schema"
+    assert response_format["json_schema"]["schema"] is hackathon_manager.JUDGE_SCORE_SCHEMA
+    assert "OUTPUT FORMAT OVERRIDE" in manager.create_scoring_prompt("aimarc", {"project_name": "X"}, {})
+    assert scores["innovation"] == 8 and scores["judge_name"] == "aimarc"
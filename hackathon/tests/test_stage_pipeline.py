@@ -0,0 +1,133 @@
+"""
+Tests for the bounded stage pipeline and the staged `research --all --concurrency N` path.
+"""
+
+import sqlite3
+import threading
+import time
+
+from hackathon.backend import research
+from hackathon.backend.stage_pipeline import Stage, StageError, StagePipeline
+
+
+def test_outcomes_keep_input_order_and_failures_stop_early():
+    seen_by_last = []
+
+    def first(n):
+        if n == 2:
+            raise RuntimeError("GitHub unavailable")
+        time.sleep(0.01 * (5 - n))  # later items finish first
+        return n * 10
+
+    def last(n):
+        seen_by_last.append(n)
+        return n + 1
+
+    outcomes = StagePipeline([Stage("first", first, 4), Stage("last", last, 1)]).run(range(5))
+
+    assert outcomes[:2] == [1, 11] and outcomes[3:] == [31, 41]
+    assert isinstance(outcomes[2], StageError) and outcomes[2].stage == "first"
+    assert sorted(seen_by_last) == [0, 10, 30, 40]
+
+
+def test_stages_overlap_across_items():
+    def slow(n):
+        time.sleep(0.1)
+        return n
+
+    start = time.monotonic()
+    StagePipeline([Stage("a", slow, 1), Stage("b", slow, 1), Stage("c", slow, 1)]).run(range(4))
+    # Serial would be 12 x 0.1s; pipelined it is (4 + 3) x 0.1s
+    assert time.monotonic() - start < 0.95
+
+
+def test_upstream_is_held_back_by_a_slow_stage():
+    release = threading.Event()
+    produced = []
+
+    def produce(n):
+        produced.append(n)
+        return n
+
+    def consume(n):
+        assert release.wait(5)
+        return n
+
+    pipeline = StagePipeline([Stage("produce", produce, 1), Stage("consume", consume, 1)], queue_size=1)
+    thread = threading.Thread(target=pipeline.run, args=(range(20),))
+    thread.start()
+    time.sleep(0.2)
+    # One item in consume, one queued for it, one blocked hand-off in produce, one waiting in produce's inbox
+    assert len(produced) <= 4
+    release.set()
+    thread.join(5)
+    assert len(produced) == 20
+
+
+def test_stop_skips_queued_items():
+    stop = threading.Event()
+
+    def work(n):
+        if n == 0:
+            stop.set()
+        return n
+
+    outcomes = StagePipeline([Stage("work", work, 1)], stop=stop).run(range(5))
+    assert outcomes[0] == 0
+    assert outcomes[1:] == [None] * 4
+
+
+def test_research_all_pending_runs_staged(tmp_path, monkeypatch):
+    db_path = str(tmp_path / "r.db")
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute("CREATE TABLE hackathon_submissions_v2 (submission_id INTEGER PRIMARY KEY, github_url TEXT)")
+        conn.execute("CREATE TABLE hackathon_research (submission_id INTEGER PRIMARY KEY)")
+        conn.executemany("INSERT INTO hackathon_submissions_v2 VALUES (?, ?)", [(i, f"u{i}") for i in range(1, 7)])
+        conn.commit()
+    finally:
+        conn.close()
+
+    monkeypatch.setattr(research, "OPENROUTER_API_KEY", "test-key")
+    monkeypatch.setattr(research, "RESEARCH_CACHE_DIR", str(tmp_path / "cache"))
+    researcher = research.HackathonResearcher(db_path=db_path, llm_cache=False)
+
+    active = {"github": 0, "llm": 0}
+    peak = {"github": 0, "llm": 0}
+    written = []
+    lock = threading.Lock()
+
+    def timed(stage, job):
+        with lock:
+            active[stage] += 1
+            peak[stage] = max(peak[stage], active[stage])
+        time.sleep(0.05)
+        with lock:
+            active[stage] -= 1
+        return job
+
+    def analyze(job):
+        if job["submission_id"] == 4:
+            raise RuntimeError("rate limited")
+        job["github_analysis"] = {}
+        return timed("github", job)
+
+    def ai_research(job):
+        job["ai_research"] = {"ok": True}
+        return timed("llm", job)
+
+    def write(job):
+        written.append(job["submission_id"])
+        return {"submission_id": job["submission_id"]}
+
+    monkeypatch.setattr(researcher, "_analyze_github", analyze)
+    monkeypatch.setattr(researcher, "_run_ingest", lambda job: {**job, "gitingest_path": None})
+    monkeypatch.setattr(researcher, "_run_ai_research", ai_research)
+    monkeypatch.setattr(researcher, "_write_research", write)
+
+    results = researcher.research_all_pending(concurrency=3)
+
+    assert [r["submission_id"] for r in results] == [1, 2, 3, 4, 5, 6]
+    assert results[3] == {"submission_id": 4, "error": "rate limited"}
+    assert sorted(written) == [1, 2, 3, 5, 6]
+    assert peak["github"] > 1 and peak["llm"] > 1
@@ -0,0 +1,164 @@
+"""
+Tests for the PRAGMA data_version watcher and `score --all --watch`.
+"""
+
+import sqlite3
+import threading
+import time
+
+import pytest
+
+from hackathon.backend.db_watch import DataVersionWatcher
+
+
+def execute(db_path, sql, params=()):
+    conn = sqlite3.connect(db_path)
+    try:
+        conn.execute(sql, params)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+def wait_for(condition, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        if condition():
+            return True
+        time.sleep(0.01)
+    return False
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    path = str(tmp_path / "watch.db")
+    execute(
+        path,
+        "CREATE TABLE hackathon_submissions_v2 "
+        "(submission_id INTEGER PRIMARY KEY, project_name TEXT, status TEXT, created_at TEXT)",
+    )
+    return path
+
+
+@pytest.fixture
+def manager(make_manager, db_path):
+    return make_manager(db_path)
+
+
+def test_data_version_changes_only_on_other_commits(db_path):
+    watcher = DataVersionWatcher(db_path)
+    try:
+        assert watcher.changed()  # first check picks up existing work
+        assert not watcher.changed()
+
+        execute(db_path, "INSERT INTO hackathon_submissions_v2 VALUES (1, 'A', 'submitted', '1')")
+        assert watcher.changed()
+        assert not watcher.changed()
+    finally:
+        watcher.close()
+
+
+def test_watch_scores_new_submissions_and_stops_gracefully(manager, db_path, monkeypatch):
+    execute(db_path, "INSERT INTO hackathon_submissions_v2 VALUES (1, 'Backlog', 'researched', '1')")
+    scored, queries = [], []
+    pending_for_scoring = manager.pending_for_scoring
+
+    def fake_score(submission_id, round_num=1):
+        scored.append(submission_id)
+        execute(
+            db_path, "UPDATE hackathon_submissions_v2 SET status = 'scored' WHERE submission_id = ?", (submission_id,)
+        )
+
+    def counting_pending():
+        queries.append(1)
+        return pending_for_scoring()
+
+    monkeypatch.setattr(manager, "score_submission", fake_score)
+    monkeypatch.setattr(manager, "pending_for_scoring", counting_pending)
+
+    stop = threading.Event()
+    results = {}
+    thread = threading.Thread(
+        target=lambda: results.update(manager.watch_researched(concurrency=2, poll_interval=0.02, stop=stop))
+    )
+    thread.start()
+    try:
+        assert wait_for(lambda: scored == [1])
+        time.sleep(0.2)
+        idle_queries = len(queries)
+        time.sleep(0.2)
+        assert len(queries) == idle_queries  # nothing committed, nothing re-queried
+
+        execute(db_path, "INSERT INTO hackathon_submissions_v2 VALUES (2, 'New', 'researched', '2')")
+        assert wait_for(lambda: scored == [1, 2])
+    finally:
+        stop.set()
+        thread.join(5)
+
+    assert not thread.is_alive()
+    assert results == {"scored": 2, "failed": 0}
+
+
+def test_watch_retries_failed_submission_after_delay(manager, db_path, monkeypatch):
+    execute(db_path, "INSERT INTO hackathon_submissions_v2 VALUES (1, 'Flaky', 'researched', '1')")
+    attempts = []
+
+    def flaky_score(submission_id, round_num=1):
+        attempts.append(submission_id)
+        if len(attempts) == 1:
+            raise RuntimeError("provider down")
+        execute(
+            db_path, "UPDATE hackathon_submissions_v2 SET status = 'scored' WHERE submission_id = ?", (submission_id,)
+        )
+
+    monkeypatch.setattr(manager, "score_submission", flaky_score)
+
+    stop = threading.Event()
+    results = {}
+    thread = threading.Thread(
+        target=lambda: results.update(manager.watch_researched(poll_interval=0.02, retry_delay=0.2, stop=stop))
+    )
+    thread.start()
+    try:
+        assert wait_for(lambda: len(attempts) == 2)
+    finally:
+        stop.set()
+        thread.join(5)
+
+    assert results == {"scored": 1, "failed": 1}
+
+
+def test_retry_in_flight_does_not_requery_every_poll(manager, db_path, monkeypatch):
+    execute(db_path, "INSERT INTO hackathon_submissions_v2 VALUES (1, 'Slow', 'researched', '1')")
+    attempts, queries = [], []
+    release = threading.Event()
+    pending_for_scoring = manager.pending_for_scoring
+
+    def failing_then_slow_score(submission_id, round_num=1):
+        attempts.append(submission_id)
+        if len(attempts) == 1:
+            raise RuntimeError("provider down")
+        release.wait(5)
+
+    def counting_pending():
+        queries.append(1)
+        return pending_for_scoring()
+
+    monkeypatch.setattr(manager, "score_submission", failing_then_slow_score)
+    monkeypatch.setattr(manager, "pending_for_scoring", counting_pending)
+
+    stop = threading.Event()
+    thread = threading.Thread(
+        target=manager.watch_researched, kwargs={"poll_interval": 0.02, "retry_delay": 0.05, "stop": stop}
+    )
+    thread.start()
+    try:
+        assert wait_for(lambda: len(attempts) == 2)
+        time.sleep(0.05)
+        in_flight_queries = len(queries)
+        time.sleep(0.2)
+        assert len(queries) == in_flight_queries
+    finally:
+        release.set()
+        stop.set()
+        thread.join(5)